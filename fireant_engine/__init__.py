@@ -0,0 +1,36 @@
+"""
+FireAnt calculation engine
+
+The calculations behind the FireAnt Grasshopper components as plain Python functions
+taking numbers and lists, so they can be run without Rhino/Grasshopper. Lengths are in mm, the
+model unit of the Rhino curves the components measure, loads in kN and line loads in kN/m (= N/mm).
+
+    from fireant_engine import column
+    result = column.design_standard_sr(L=[3000, 4500], F=[150, 200], ToW=3)
+    result.Width, result.Height, result.NRcfire
+
+Methods:
+    column.design_standard_sr: Column, standard fire, strength reduction method
+    column.design_standard_rcs: Column, standard fire, reduced cross section method
+    column.design_parametric_sr: Column, parametric fire, strength reduction method
+    beam.design_standard_sr: Beam, standard fire, strength reduction method
+    beam.design_standard_rcs: Beam, standard fire, reduced cross section method
+    beam.design_parametric_sr: Beam, parametric fire, strength reduction method
+
+Large member tables can be designed with batch.design, using all CPU cores.
+Many load cases for the same members are designed with select_load_cases, see capacity:
+
+    profiles = column.profiles_standard_sr(ToW=3, t=60)
+    results = column.select_load_cases(L=[3000, 4500], F=[[150, 200], [180, 90]], profiles=profiles)
+
+The capacity of the profiles over the time of a fire is calculated in history, e.g. the
+governing instant of a parametric fire with history.parametric_scan. The R30/R60/R90/R120
+rating of a whole catalogue for a grid of lengths and loads is given by rating.classify.
+
+The span tables are not imported with the package, as they are also run from the command line
+(python -m fireant_engine.spantable); import them with from fireant_engine import spantable.
+"""
+
+from . import batch, beam, cache, capacity, catalogue, charring, cheapest, column, exposure, glulam, governing, history, materials, pareto, rating, sections, selection, sweep, verify
+from .beam import BeamResult
+from .column import ColumnResult
@@ -0,0 +1,31 @@
+"""
+Optional dependencies and Python 2 (IronPython) compatibility
+
+NumPy is not available in IronPython (Rhino/Grasshopper), where np is None and the engine
+falls back to the scalar functions.
+"""
+
+from __future__ import division
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+
+def where(condition, x, y):
+    """ x where condition is true and y elsewhere, with np.where for arrays and a conditional for numbers """
+    if np is not None and isinstance(condition, np.ndarray):
+        return np.where(condition, x, y)
+    if condition:
+        return x
+    return y
+
+
+try:
+    string_types = basestring  # IronPython and Python 2
+except NameError:
+    string_types = str
@@ -0,0 +1,225 @@
+"""
+Design of large member tables (10k-100k members) spread over the CPU cores
+
+The members are grouped by their fire scenario, each group is cut into chunks and the
+chunks are designed in a process pool. The results are put back in the order of the table.
+
+    from fireant_engine import batch
+    members = [{'L': 3000, 'F': 150, 'Sup': 1, 't': 60}, {'L': 4500, 'F': 200, 'SEF': 4}]
+    result = batch.design('Column-StdFire-SR', members, ToW=3)
+
+    method: Name of the FireAnt component, see METHODS
+    members: Member table; a list of rows (dictionaries) or a dictionary of columns (lists) with
+             L [mm], the load (F [kN] for columns, q [kN/m] for beams) and optionally any other
+             input of the method (Str, Sup, ToW, WS, t, SEF, O, qf, Ti, WidthProfile, HeightProfile)
+    processes: Number of processes [Default: one per CPU core, 1 runs in this process]
+    chunksize: Number of members designed at a time by a process [Default: CHUNKSIZE]
+    tolerance: Length tolerance [mm] for deduplication. Members with the same scenario and length, rounded
+               up to a multiple of tolerance, share one calculation of the capacity of the catalogue,
+               see capacity. 0 only groups equal lengths [Default: None, no deduplication]
+               Only scenarios with few distinct rounded lengths are deduplicated, see DEDUPLICATION.
+               The lengths are rounded up, so the members are never designed shorter than they are,
+               but members near the limit of the largest profile can get no profile at all
+               (24904 instead of 24627 of 100k random members with a tolerance of 50 mm)
+"""
+
+from __future__ import division
+
+import math as m
+from collections import namedtuple
+
+from . import beam, column
+
+# Module, design function and name of the load for each FireAnt component
+METHODS = {
+    'Column-StdFire-SR': ('column', 'design_standard_sr', 'F'),
+    'Column-StdFire-RCS': ('column', 'design_standard_rcs', 'F'),
+    'Column-ParamFire-SR': ('column', 'design_parametric_sr', 'F'),
+    'Beam-StdFire-SR': ('beam', 'design_standard_sr', 'q'),
+    'Beam-StdFire-RCS': ('beam', 'design_standard_rcs', 'q'),
+    'Beam-ParamFire-SR': ('beam', 'design_parametric_sr', 'q'),
+}
+
+MODULES = {'beam': beam, 'column': column}
+
+# Inputs that are the same for all members of one call to a design function
+SCENARIO = ('Str', 'Sup', 'ToW', 'WS', 't', 'SEF', 'O', 'qf', 'Ti', 'WidthProfile', 'HeightProfile', 'search')
+
+# Number of members designed at a time by a process
+CHUNKSIZE = 2000
+
+# Largest ratio of distinct rounded lengths to members of a scenario for which the members are deduplicated.
+# Other scenarios are designed with their own lengths, as the capacity of the catalogue for almost
+# every member costs more than the search it replaces
+DEDUPLICATION = 0.25
+
+Deduplication = namedtuple('Deduplication', 'Members Unique Ratio')
+
+
+def design_function(method):
+    """ Returns the design function and the name of the load of a FireAnt component """
+    if method not in METHODS:
+        raise ValueError('Unknown method: %r' % (method,))
+    module, name, load = METHODS[method]
+    return getattr(MODULES[module], name), load
+
+
+def result_type(method):
+    """ Returns ColumnResult or BeamResult, the result of a FireAnt component """
+    design_function(method)
+    if METHODS[method][0]=='column':
+        return column.ColumnResult
+    return beam.BeamResult
+
+
+def profiles_function(method):
+    """ Returns the function giving the profiles to verify of a FireAnt component, e.g. column.profiles_standard_sr """
+    design_function(method)
+    module, name, load = METHODS[method]
+    return getattr(MODULES[module], name.replace('design_', 'profiles_'))
+
+
+def rounded_length(L, tolerance):
+    """ Rounds L [mm] up to a multiple of tolerance, so a rounded member is never shorter than the real one """
+    if not tolerance:
+        return L
+    return m.ceil(round(L/tolerance, 9))*tolerance
+
+
+def rows(members):
+    """ Returns the member table as a list of rows (dictionaries) """
+    if isinstance(members, dict):
+        n = len(members['L'])
+        return [dict((k, members[k][i]) for k in members) for i in range(n)]
+    return list(members)
+
+
+def chunks(method, members, chunksize=CHUNKSIZE, tolerance=None, **defaults):
+    """ Groups the members by scenario and cuts the groups into chunks
+
+    With a tolerance, the scenarios with at most DEDUPLICATION distinct lengths per member get the
+    lengths rounded with rounded_length and are ordered by length, so members with the same length
+    end up in the same chunk. The members are sorted once, by scenario and rounded length.
+
+    Returns:
+        List of (indices, L, loads, scenario, deduplicate) with the indices of the members in the table
+        and deduplicate telling if the chunk has rounded lengths
+    """
+    function, load = design_function(method)
+    groups = {}
+    order = []
+    group = []
+    L = []
+    loads = []
+    for i, row in enumerate(rows(members)):
+        if 'L' not in row or load not in row:
+            raise ValueError('Member %d: L and %s are required' % (i, load))
+        scenario = dict(defaults)
+        for k in row:
+            if k in SCENARIO:
+                scenario[k] = row[k]
+            elif k!='L' and k!=load:
+                raise ValueError('Member %d: unknown input %r for %s' % (i, k, method))
+        key = tuple(sorted(scenario.items()))
+        if key not in groups:
+            groups[key] = len(order)
+            order.append(key)
+        group.append(groups[key])
+        L.append(row['L'])
+        loads.append(row[load])
+    deduplicate = [False]*len(order)
+    if tolerance is not None:
+        rounded = [rounded_length(x, tolerance) for x in L]
+        distinct = [set() for key in order]
+        count = [0]*len(order)
+        for i in range(len(L)):
+            distinct[group[i]].add(rounded[i])
+            count[group[i]] += 1
+        deduplicate = [len(distinct[k])<=DEDUPLICATION*count[k] for k in range(len(order))]
+        L = [rounded[i] if deduplicate[group[i]] else L[i] for i in range(len(L))]
+    # Scenarios in the order of the table, the members of a deduplicated one by length
+    sort = sorted(range(len(L)), key=lambda i: (group[i], L[i] if deduplicate[group[i]] else 0))
+    result = []
+    start = 0
+    while start<len(sort):
+        k = group[sort[start]]
+        stop = start+1
+        while stop<len(sort) and stop-start<chunksize and group[sort[stop]]==k:
+            stop += 1
+        # Members with the same length are kept together
+        while deduplicate[k] and stop<len(sort) and group[sort[stop]]==k and L[sort[stop]]==L[sort[stop-1]]:
+            stop += 1
+        chunk = sort[start:stop]
+        result.append((chunk, [L[i] for i in chunk], [loads[i] for i in chunk], dict(order[k]), deduplicate[k]))
+        start = stop
+    return result
+
+
+def deduplication(method, members, tolerance=0, **defaults):
+    """ Returns the Deduplication of the member table; the number of members, of unique
+    scenarios and lengths and the ratio between them """
+    unique = 0
+    n = 0
+    for indices, L, loads, scenario, deduplicate in chunks(method, members, CHUNKSIZE, tolerance, **defaults):
+        unique += len(set(L))
+        n += len(indices)
+    return Deduplication(n, unique, n/unique if unique else 1.0)
+
+
+def _design_chunk(task):
+    method, L, loads, scenario, deduplicate = task
+    if deduplicate:
+        # The capacity of the catalogue is calculated in full, so there is nothing to search
+        scenario = dict((k, v) for k, v in scenario.items() if k!='search')
+        profiles = profiles_function(method)(front=True, **scenario)
+        return MODULES[METHODS[method][0]].select_load_cases(L, [loads], profiles)[0]
+    function, load = design_function(method)
+    return function(L, loads, **scenario)
+
+
+def design(method, members, processes=None, chunksize=CHUNKSIZE, tolerance=None, **defaults):
+    """ Smallest profile of every member in the table, see the design function of the method
+
+    Args:
+        defaults: Inputs used for members that do not give them, e.g. ToW=3
+    Returns:
+        ColumnResult or BeamResult with one value per member in the order of the table,
+        ErrorMessage is set if any member has no profile that can support the load.
+        With a tolerance, Evaluated is 0 for members sharing the calculation of an earlier member
+    """
+    tasks = chunks(method, members, chunksize, tolerance, **defaults)
+    work = [(method, L, loads, scenario, deduplicate) for indices, L, loads, scenario, deduplicate in tasks]
+    # Imported here, so importing the engine does not load multiprocessing
+    try:
+        import multiprocessing
+    except ImportError:  # IronPython (Rhino/Grasshopper)
+        multiprocessing = None
+    if processes is None and multiprocessing is not None:
+        processes = multiprocessing.cpu_count()
+    if multiprocessing is None or processes<=1 or len(work)<=1:
+        results = [_design_chunk(x) for x in work]
+    else:
+        pool = multiprocessing.Pool(min(processes, len(work)))
+        try:
+            results = pool.map(_design_chunk, work, 1)
+        finally:
+            pool.close()
+            pool.join()
+    return merge(result_type(method), tasks, results)
+
+
+def merge(Result, tasks, results):
+    """ Puts the results of the chunks back in the order of the member table """
+    n = sum(len(task[0]) for task in tasks)
+    fields = [[None]*n for x in Result._fields]
+    error = Result._fields.index('ErrorMessage')
+    fields[error] = None
+    for task, result in zip(tasks, results):
+        indices = task[0]
+        for f, values in enumerate(result):
+            if f==error:
+                fields[f] = fields[f] or values
+                continue
+            for i, value in zip(indices, values):
+                fields[f][i] = value
+    return Result(*fields)
@@ -0,0 +1,325 @@
+"""
+Verification and selection of wooden beams in fire
+
+    L: Length of the beams [mm]
+    q: Line load [kN/m] for each beam to support
+    Str: Strength class for the wood 1=C30, 2=C24, 3=C18, 4=C14, 5=GL32h, 6=GL28h or 7=GL24h) [Default: C30]
+    Sup: Support conditions for the beam (1=Simply supported both ends, 2=One end fixed and one end not supported, 3=One end fixed and one end simply supported, 4=Both ends fixed [Default: Simply supported]
+    ToW: Type of Wood; 1=Sawn, 2=Planed or 3=Glulam (Glued laminated timber) standard profiles, or a user catalogue, see catalogue.resolve [Default: sawn]
+    WS: Wood Species (1=Conifer p>290 kg/m3, 2=Laminated wood p>290 kg/m3 , 3=Hardwood p>450 kg/m3, 4=Plywood [Default: Conifer]
+    t: Time of exposure [minutes] [Default 60]
+    SEF: Sides Exposed to Fire(1=Width, 2=Height, 3=Width+Height, 4=Width+2*Height, 5=2*Width+Height, 6=2*Width, 7=2*Height, 8=All [Default: Width+2*Height]
+    WidthProfile: Width of profile [mm] to calculate qmax for. If no value is inserted, the qmax is calculated based on ToW.
+    HeightProfile: Height of profile [mm] to calculate qmax for. If no value is inserted, the qmax is calculated based on ToW.
+    search: Search for the smallest passing profile; 'walk', 'bisect' or 'staircase', see selection [Default: walk]
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import cache, capacity, catalogue, charring, materials, pareto, sections, selection
+from ._compat import HAS_NUMPY, np, where
+
+if HAS_NUMPY:
+    from . import vectorized
+else:
+    vectorized = None
+
+BeamResult = namedtuple('BeamResult', 'qmax Width Height Sigmafire Utilization ErrorMessage Evaluated')
+
+# Profiles to verify with their section properties after fire, the inputs of select after L and q
+BeamProfiles = namedtuple('BeamProfiles', 'c w h Iy Hr fm FStr')
+
+ERROR_NO_PROFILE = 'No profiles with selected citeria can support the load'
+
+# Relative margin below the load from which the profiles found by capacity are verified with bending_stress,
+# covering the rounding of bending_capacity for a load at the capacity of a profile
+CAPACITY_MARGIN = 1e-9
+
+# Profiles kept by pareto_front per catalogue, dchar, SEF and t, like the residual sections
+FRONTS = cache.LRUCache(sections.SECTION_CACHE_SIZE)
+
+
+def section_strength_reduction(Pr, Ar, t):
+    """ Reduction factor FStr of one section, or of NumPy arrays of sections and times """
+    return where(t<20, 1-1/200*Pr/Ar*t/20, 1-1/200*Pr/Ar)
+
+
+def strength_reduction(Pr, Ar, t):
+    """ Reduction factor for flexural strength FStr """
+    FStr = []
+    for i in range(len(Pr)):
+        FStr.append(section_strength_reduction(Pr[i], Ar[i], t))
+    return FStr
+
+
+def bending_stress(Mmax, Iy, Hr, FStr=1):
+    """ Returns the bending stress sigmafire in the residual cross section """
+    return Mmax/Iy*Hr/2*FStr
+
+
+def maximum_load(L, Iy, Hr, fm, c):
+    """ Returns the maximum line load Qmax the residual cross section can support """
+    return (fm*2*Iy)/(c*(L*L)*Hr)
+
+
+def bending_capacity(L, Iy, Hr, fm, c, FStr=1):
+    """ Returns the line load [kN/m] at which sigmafire reaches fm, 0 for a section without a valid residual section """
+    if Iy<=0 or Hr<=0 or FStr<=0:
+        return 0.0
+    return (fm*2*Iy)/(c*(L*L)*Hr*FStr)
+
+
+def select(L, q, c, w, h, Iy, Hr, fm, FStr, search=selection.WALK):
+    """ Selects the smallest profile that can support the load of every beam
+
+    Stops at the first passing profile instead of calculating sigmafire for the whole catalogue, see
+    selection. Uses the NumPy kernel for the walk and staircase searches when NumPy is available and
+    the scalar loop otherwise, with identical results.
+    """
+    if vectorized is None or search not in (selection.WALK, selection.STAIRCASE):
+        return select_scalar(L, q, c, w, h, Iy, Hr, fm, FStr, search)
+    return select_array(L, q, c, w, h, Iy, Hr, fm, FStr, search=search)
+
+
+def select_array(L, q, c, w, h, Iy, Hr, fm, FStr, block=None, search=selection.WALK):
+    """ select with sigmafire calculated for many beams and profiles at once (requires NumPy) """
+    La = np.asarray(L, dtype=float)
+    qa = np.asarray(q, dtype=float)
+    Iya = np.asarray(Iy, dtype=float)
+    Hra = np.asarray(Hr, dtype=float)
+    FStra = np.asarray(FStr, dtype=float)
+
+    def check(rows, j):
+        # Beams rows against profiles j, broadcast together
+        sigmafire = vectorized.section_stress(La[rows], qa[rows], Iya[j], Hra[j], c, FStra[j])
+        return (sigmafire>0) & (sigmafire<fm)
+
+    if search==selection.STAIRCASE:
+        index, Evaluated = vectorized.staircase(check, len(L), selection.Grid(w, h))
+    else:
+        def evaluate(rows, start, stop):
+            return check(rows[:, np.newaxis], np.arange(start, stop))
+        index, Evaluated = vectorized.walk(evaluate, len(L), len(w), block or vectorized.BLOCK)
+    sigmafire = []
+    Qmax = []
+    for i in range(len(L)):
+        j = int(index[i])
+        if j<0:
+            sigmafire.append(None)
+            Qmax.append(None)
+        else:
+            sigmafire.append(bending_stress(c*q[i]*(L[i]*L[i]), Iy[j], Hr[j], FStr[j]))
+            Qmax.append(maximum_load(L[i], Iy[j], Hr[j], fm, c))
+    return selection_result(fm, w, h, index, sigmafire, Qmax, Evaluated.tolist())
+
+
+def select_scalar(L, q, c, w, h, Iy, Hr, fm, FStr, search=selection.WALK):
+    """ select one beam and profile at a time """
+    index = []
+    sigmafire = []
+    Qmax = []
+    Evaluated = []
+    prepared = selection.prepare(search, w, h)
+    for i in range(len(L)):
+        Mmax = c*q[i]*(L[i]*L[i])
+        sigma = {}
+
+        def passing(j):
+            sigma[j] = bending_stress(Mmax, Iy[j], Hr[j], FStr[j])
+            return 0<sigma[j]<fm
+
+        # Selecting the smallest profile with capability to support the load
+        j, evaluated = selection.search(search, w, passing, h, prepared)
+        index.append(j)
+        if j<0:
+            sigmafire.append(None)
+            Qmax.append(None)
+        else:
+            sigmafire.append(sigma[j])
+            Qmax.append(maximum_load(L[i], Iy[j], Hr[j], fm, c))
+        Evaluated.append(evaluated)
+    return selection_result(fm, w, h, index, sigmafire, Qmax, Evaluated)
+
+
+def capacity_index(L, profiles):
+    """ Returns the CapacityIndex with the bending capacity [kN/m] of every profile for the length L, see bending_capacity """
+    c, w, h, Iy, Hr, fm, FStr = profiles
+    return capacity.CapacityIndex([bending_capacity(L, Iy[j], Hr[j], fm, c, FStr[j]) for j in range(len(w))])
+
+
+def select_load_cases(L, q, profiles):
+    """ Smallest profile of every beam for each load case, see capacity
+
+    The bending capacity is calculated once for every profile and beam length, and the smallest
+    profile for each load is found by binary search, one search for all loads of the beams of a
+    length, so extra load cases cost almost nothing.
+    The search starts CAPACITY_MARGIN below the load and the profiles from there are verified with
+    bending_stress, so a load exactly at the capacity of a profile is decided as in select.
+
+    Args:
+        L: Length of the beams [mm]
+        q: Load cases; for each case the line load [kN/m] of every beam
+        profiles: BeamProfiles, see profiles_standard_sr
+    Returns:
+        List with a BeamResult per load case, Evaluated is the number of capacities calculated per beam
+    """
+    c, w, h, Iy, Hr, fm, FStr = profiles
+    lengths, Evaluated = capacity.by_length(L, len(w))
+    index = [[-1]*len(L) for k in q]
+    sigmafire = [[None]*len(L) for k in q]
+    Qmax = [[None]*len(L) for k in q]
+    for length, members in lengths:
+        ci = capacity_index(length, profiles)
+        js = ci.smallest_all([qk[i]*(1-CAPACITY_MARGIN) for qk in q for i in members])
+        for k in range(len(q)):
+            for n, i in enumerate(members):
+                Mmax = c*q[k][i]*(length*length)
+                j = js[k*len(members)+n]
+                sigma = None
+                while 0<=j<len(w):
+                    sigma = bending_stress(Mmax, Iy[j], Hr[j], FStr[j])
+                    if 0<sigma<fm:
+                        break
+                    j += 1
+                if j>=len(w) or q[k][i]<=0:
+                    continue
+                index[k][i] = j
+                sigmafire[k][i] = sigma
+                Qmax[k][i] = maximum_load(length, Iy[j], Hr[j], fm, c)
+    return [selection_result(fm, w, h, index[k], sigmafire[k], Qmax[k], list(Evaluated)) for k in range(len(q))]
+
+
+def selection_result(fm, w, h, index, sigmafire, Qmax, Evaluated):
+    """ BeamResult of the profiles index[i] of w, h selected for every beam, -1 if there is none """
+    Width = []
+    Height = []
+    Sigmafire = []
+    qmax = []
+    Utilization = []
+    ErrorMessage = None
+    for i in range(len(index)):
+        j = int(index[i])
+        if j<0:
+            ErrorMessage = ERROR_NO_PROFILE
+            Width.append(None)
+            Height.append(None)
+            Sigmafire.append(None)
+            qmax.append(None)
+            Utilization.append(None)
+        else:
+            Width.append(w[j])
+            Height.append(h[j])
+            Sigmafire.append(sigmafire[i])
+            qmax.append(Qmax[i])
+            Utilization.append(sigmafire[i]/fm*100)
+    return BeamResult(qmax, Width, Height, Sigmafire, Utilization, ErrorMessage, Evaluated)
+
+
+def pareto_front(profiles):
+    """ BeamProfiles without the profiles that can never be selected, see pareto
+
+    sigmafire is proportional to Hr*FStr/Iy, so a profile is dominated by an earlier one with a
+    larger Iy/(Hr*FStr). Sections without a valid residual section are dominated by any earlier profile.
+    """
+    return pareto.subset(profiles, _front_indices(profiles))
+
+
+def _front_indices(profiles):
+    keys = []
+    for j in range(len(profiles.w)):
+        Iy, Hr, FStr = profiles.Iy[j], profiles.Hr[j], profiles.FStr[j]
+        if Iy>0 and Hr>0 and FStr>0:
+            keys.append((Iy/(Hr*FStr),))
+        else:
+            keys.append((-1,))
+    return pareto.front(keys)
+
+
+def _front(profiles, approach, W, H, dchar, SEF, t):
+    """ pareto_front of the profiles of the catalogue W, H, cached in FRONTS
+
+    The front only depends on the sections after fire, so the strength class and support are not part of the key.
+    """
+    if len(W)<=1:
+        return profiles
+    keep = cache.cached(FRONTS, cache.key((approach, W, H, dchar, SEF, t)), _front_indices, profiles)
+    return pareto.subset(profiles, keep)
+
+
+def _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front):
+    fm, fc, E = materials.strength_class(Str)
+    c = materials.moment_coefficient(Sup)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    w, h, Wr, Hr, Ar, Iy, Iz, Pr = sections.rounded_residual_section(W, H, dchar, SEF)
+    FStr = strength_reduction(Pr, Ar, t)
+    profiles = BeamProfiles(c, w, h, Iy, Hr, fm, FStr)
+    if front:
+        return _front(profiles, 'SR', W, H, dchar, SEF, t)
+    return profiles
+
+
+def profiles_standard_sr(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a standard fire using the strength reduction method, see BeamProfiles
+
+    With front, only the profiles of the pareto_front, which is cached per catalogue, dchar, SEF and t
+    """
+    SEF = sections.sides_exposed(SEF)
+    dchar = charring.charring_depth_sr(t, materials.charring_rate_sr(WS))
+    return _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front)
+
+
+def profiles_parametric_sr(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a parametric fire using the strength reduction method, see BeamProfiles and profiles_standard_sr """
+    SEF = sections.sides_exposed(SEF)
+    Bn = materials.charring_rate_sr(WS)
+    dchar = charring.charring_depth_parametric(t, Bn, O, qf, Ti)
+    t = charring.parametric_exposure_time(t, O, qf)
+    return _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front)
+
+
+def profiles_standard_rcs(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a standard fire using the reduced cross section method, see BeamProfiles and profiles_standard_sr """
+    fm, fc, E = materials.strength_class(Str)
+    c = materials.moment_coefficient(Sup)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    SEF = sections.sides_exposed(SEF)
+    dchar = charring.charring_depth_rcs(t, materials.charring_rate_rcs(WS))
+
+    w, h, Wr, Hr, Ar, Iy, Iz = sections.rectangular_residual_section(W, H, dchar, SEF)
+    profiles = BeamProfiles(c, w, h, Iy, Hr, fm, [1]*len(Wr))
+    if front:
+        return _front(profiles, 'RCS', W, H, dchar, SEF, t)
+    return profiles
+
+
+def design_standard_sr(L, q, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest beam profile that can support q during a standard fire using the strength reduction method
+
+    Returns:
+        BeamResult with qmax [kN/m], Width [mm], Height [mm], Sigmafire and Utilization [%] per beam (None if no profile can support the load),
+        ErrorMessage and Evaluated, the number of profiles verified per beam
+    """
+    profiles = profiles_standard_sr(Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile, front=True)
+    return select(L, q, *profiles, search=search)
+
+
+def design_parametric_sr(L, q, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest beam profile that can support q during a parametric fire using the strength reduction method
+
+    Returns:
+        BeamResult, see design_standard_sr
+    """
+    profiles = profiles_parametric_sr(Str, Sup, ToW, WS, t, SEF, O, qf, Ti, WidthProfile, HeightProfile, front=True)
+    return select(L, q, *profiles, search=search)
+
+
+def design_standard_rcs(L, q, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest beam profile that can support q during a standard fire using the reduced cross section method
+
+    Returns:
+        BeamResult, see design_standard_sr
+    """
+    profiles = profiles_standard_rcs(Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile, front=True)
+    return select(L, q, *profiles, search=search)
@@ -0,0 +1,100 @@
+"""
+Least recently used cache for results shared between members, components and solves
+
+The cached functions are kept for as long as the module stays loaded, which inside
+Rhino is the whole session, so repeated solves reuse the results of earlier ones.
+"""
+
+from __future__ import division
+
+import functools
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """ Dictionary holding at most maxsize items, evicting the least recently used one """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        if key not in self._items:
+            self.misses += 1
+            return default
+        self.hits += 1
+        value = self._items.pop(key)
+        self._items[key] = value
+        return value
+
+    def put(self, key, value):
+        if key in self._items:
+            self._items.pop(key)
+        self._items[key] = value
+        while len(self._items)>self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def key(args):
+    """ Hashable key for arguments that may contain lists or arrays """
+    k = []
+    for x in args:
+        if hasattr(x, 'tolist'):
+            x = x.tolist()
+        if isinstance(x, list):
+            x = tuple(x)
+        k.append(x)
+    return tuple(k)
+
+
+def cached(lru, k, function, *args):
+    """ Returns function(*args), cached in the LRUCache lru under the key k
+
+    For results that only depend on part of what the arguments describe, e.g. the pareto front of
+    the profiles of a catalogue, which depends on the sections after fire but not on the strength class.
+    """
+    value = lru.get(k, lru)
+    if value is lru:
+        value = function(*args)
+        lru.put(k, value)
+    return value
+
+
+def memoize(maxsize=128, cached=None):
+    """ Decorator caching the results of a function in an LRUCache, available as function.cache
+
+    The results are shared between callers and must not be modified.
+
+    Args:
+        cached: Function of the arguments telling if the result is cached [Default: always]
+    """
+    def decorate(function):
+        cache = LRUCache(maxsize)
+
+        @functools.wraps(function)
+        def wrapper(*args):
+            if cached is not None and not cached(*args):
+                return function(*args)
+            k = key(args)
+            value = cache.get(k, cache)
+            if value is cache:
+                value = function(*args)
+                cache.put(k, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+    return decorate
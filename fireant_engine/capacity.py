@@ -0,0 +1,80 @@
+"""
+Capacity-first selection of the smallest profile for many loads
+
+The capacity of a profile (NRcfire for columns, the line load at which sigmafire reaches fm
+for beams) does not depend on the load. For one member length and fire scenario the
+capacities of the catalogue are calculated once; the running maximum over the profiles,
+ordered from the smallest to the largest area, is non-decreasing, so the smallest profile
+that can carry a load is found by binary search in O(log n) for every load case.
+"""
+
+from __future__ import division
+
+import bisect
+from ._compat import np
+
+
+class CapacityIndex(object):
+    """ Capacities of the profiles of a catalogue for one member, answering the smallest profile carrying a load
+
+    Args:
+        capacity: Capacity of each profile, ordered from the smallest to the largest area
+    Attributes:
+        capacity: Capacity of each profile
+        peak: Running maximum of capacity; peak[j] is the largest capacity of the profiles 0..j
+    """
+
+    def __init__(self, capacity):
+        self.capacity = tuple(capacity)
+        peak = []
+        best = None
+        for x in self.capacity:
+            if best is None or x>best:
+                best = x
+            peak.append(best)
+        self.peak = tuple(peak)
+        self._peak = None
+
+    def __len__(self):
+        return len(self.capacity)
+
+    def smallest(self, load):
+        """ Index of the smallest profile with capacity > load, -1 if no profile can carry it """
+        j = bisect.bisect_right(self.peak, load)
+        if j<len(self.peak):
+            return j
+        return -1
+
+    def smallest_all(self, loads):
+        """ smallest for a list of loads, using one vectorised search when NumPy is available """
+        if np is None:
+            return [self.smallest(x) for x in loads]
+        if self._peak is None:
+            self._peak = np.asarray(self.peak, dtype=float)
+        index = np.searchsorted(self._peak, np.asarray(loads, dtype=float), side='right')
+        index[index>=len(self.peak)] = -1
+        return index.tolist()
+
+
+def by_length(L, n):
+    """ Groups the members by length, for one CapacityIndex per length
+
+    Args:
+        L: Length of each member [mm]
+        n: Number of profiles, the capacities calculated for the first member of a length
+    Returns:
+        List of (length, indices of the members with that length) in the order of L, and
+        Evaluated, n for the first member of each length and 0 for the others
+    """
+    members = {}
+    order = []
+    Evaluated = []
+    for i in range(len(L)):
+        if L[i] in members:
+            Evaluated.append(0)
+        else:
+            members[L[i]] = []
+            order.append(L[i])
+            Evaluated.append(n)
+        members[L[i]].append(i)
+    return [(x, members[x]) for x in order], Evaluated
@@ -0,0 +1,317 @@
+"""
+Cross section catalogues used by the FireAnt design methods
+
+    ToW: Type of Wood; 1=Sawn, 2=Planed or 3=Glulam (Glued laminated timber) standard profiles,
+         a Catalogue or the path of a CSV/JSON file with a user catalogue, see load
+"""
+
+from __future__ import division
+
+import csv
+import io
+import json
+import os
+
+from . import cache
+from ._compat import np, string_types
+
+# Sawn profiles [mm]
+SAWN_W = [50,38,50,50,75,50,50,63,50,50,100,50,75,75,75,125,75,100,150,100,175,200]
+SAWN_H = [50,73,75,100,75,125,150,125,175,200,100,225,150,175,200,125,225,200,150,225,175,200]
+
+# Planed profiles [mm]
+PLANED_W = [45,45,45,70,45,45,45,45,95,45,70,70,70,120,70,95,145,95,170,195]
+PLANED_H = [45,70,95,70,120,145,170,195,95,220,145,170,195,120,220,195,145,220,170,195]
+
+# Glulam profiles [mm]
+GLULAM_W = [185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65,185,160,140,115,90,65,185,160,140,115,90,65,
+    185,160,140,115,90,65]
+GLULAM_H = [100,100,100,100,100,100,133,133,133,133,133,133,167,167,167,167,167,167,
+    200,200,200,200,200,200,233,233,233,233,233,233,267,267,267,267,267,267,
+    300,300,300,300,300,300,333,333,333,333,333,333,367,367,367,367,367,367,
+    400,400,400,400,400,400,433,433,433,433,433,433,467,467,467,467,467,467,
+    500,500,500,500,500,500,533,533,533,533,533,533,567,567,567,567,567,567,
+    600,600,600,600,600,600,633,633,633,633,633,633,667,667,667,667,667,667,
+    700,700,700,700,700,700,733,733,733,733,733,733,767,767,767,767,767,767,
+    800,800,800,800,800,800,833,833,833,833,833,833,867,867,867,867,867,867,
+    900,900,900,900,900,900,933,933,933,933,933,933,967,967,967,967,967,967,
+    1000,1000,1000,1000,1000,1000,1033,1033,1033,1033,1033,1033,1067,1067,1067,1067,1067,1067,
+    1100,1100,1100,1100,1100,1100,1133,1133,1133,1133,1133,1133,1167,1167,1167,1167,1167,1167,
+    1200,1200,1200,1200,1200,1200,1233,1233,1233,1233,1233,1233,1267,1267,1267,1267,1267,1267,
+    1300,1300,1300,1300,1300,1300,1333,1333,1333,1333,1333,1333,1367,1367,1367,1367,1367,1367,
+    1400,1400,1400,1400,1400,1400,1433,1433,1433,1433,1433,1433,1467,1467,1467,1467,1467,1467,
+    1500,1500,1500,1500,1500,1500]
+
+
+class Catalogue(object):
+    """ Profiles of one type of wood, ordered from the smallest to the largest area
+
+    The profiles are sorted once when the catalogue is created. W, H and A are tuples,
+    so the catalogue can be shared by all members, components and solves.
+
+    Args:
+        name: Name of the catalogue
+        W: Widths of the profiles [mm]
+        H: Heights of the profiles [mm]
+        ToW: Type of Wood of the profiles; 1=Sawn, 2=Planed or 3=Glulam [Default: Glulam]
+    Attributes:
+        W, H: Widths and heights [mm], sorted by area
+        A: Areas [mm2], sorted
+        order: Index of each sorted profile in the W and H given
+    """
+
+    def __init__(self, name, W, H, ToW=3):
+        if len(W)!=len(H):
+            raise ValueError('%s: %d widths but %d heights' % (name, len(W), len(H)))
+        self.name = name
+        self.ToW = ToW
+        # Sorted by area, profiles with the same area keep their order
+        self.order = tuple(sorted(range(len(W)), key=lambda i: W[i]*H[i]))
+        self.W = tuple(W[i] for i in self.order)
+        self.H = tuple(H[i] for i in self.order)
+        self.A = tuple(self.W[i]*self.H[i] for i in range(len(self.W)))
+
+    @classmethod
+    def presorted(cls, name, W, H, order, ToW=3):
+        """ Catalogue of profiles already sorted by area, e.g. read from the binary cache
+
+        Args:
+            order: Index of each profile in the W and H of the original catalogue, see Catalogue
+        """
+        c = cls.__new__(cls)
+        c.name = name
+        c.ToW = ToW
+        c.order = tuple(order)
+        c.W = tuple(W)
+        c.H = tuple(H)
+        c.A = tuple(c.W[i]*c.H[i] for i in range(len(c.W)))
+        return c
+
+    def __len__(self):
+        return len(self.W)
+
+    def __repr__(self):
+        return 'Catalogue(%r, %d profiles)' % (self.name, len(self))
+
+
+SAWN = Catalogue('Sawn', SAWN_W, SAWN_H, 1)
+PLANED = Catalogue('Planed', PLANED_W, PLANED_H, 2)
+GLULAM = Catalogue('Glulam', GLULAM_W, GLULAM_H, 3)
+
+# Type of Wood
+CATALOGUES = {1: SAWN, 2: PLANED, 3: GLULAM}
+
+
+def _number(value, source, row):
+    try:
+        x = float(value)
+    except (TypeError, ValueError):
+        raise ValueError('%s, profile %d: %r is not a number' % (source, row, value))
+    if not x>0:
+        raise ValueError('%s, profile %d: dimensions must be positive, got %r' % (source, row, value))
+    return _integral(x)
+
+
+def _integral(x):
+    """ Whole millimetres as int, like the standard catalogues """
+    if x==int(x):
+        return int(x)
+    return x
+
+
+def _type_of_wood(value, source):
+    """ ToW given by a catalogue file, 1=Sawn, 2=Planed or 3=Glulam """
+    try:
+        ToW = int(float(value))
+    except (TypeError, ValueError):
+        ToW = None
+    if ToW not in CATALOGUES or ToW!=float(value):
+        raise ValueError('%s: ToW must be 1, 2 or 3, got %r' % (source, value))
+    return ToW
+
+
+def _read_csv(path):
+    """ Widths and heights from a CSV file with the columns Width and Height (or the first two columns),
+    and the type of wood from an optional column ToW, None if there is none """
+    with io.open(path, newline='', encoding='utf-8-sig') as f:
+        rows = [r for r in csv.reader(f) if r and any(c.strip() for c in r)]
+    iw, ih, it = 0, 1, None
+    if rows:
+        header = [c.strip().lower() for c in rows[0]]
+        try:
+            float(header[0])
+        except ValueError:
+            for i, c in enumerate(header):
+                if c in ('width', 'w', 'widthprofile'):
+                    iw = i
+                if c in ('height', 'h', 'heightprofile'):
+                    ih = i
+                if c=='tow':
+                    it = i
+            rows = rows[1:]
+    W = []
+    H = []
+    ToW = set()
+    for row, r in enumerate(rows):
+        if len(r)<=max(iw, ih):
+            raise ValueError('%s, profile %d: expected a width and a height' % (path, row+1))
+        W.append(_number(r[iw], path, row+1))
+        H.append(_number(r[ih], path, row+1))
+        if it is not None and it<len(r) and r[it].strip():
+            ToW.add(_type_of_wood(r[it], path))
+    if len(ToW)>1:
+        raise ValueError('%s: all profiles of a catalogue must have the same ToW, got %s' % (path, sorted(ToW)))
+    return W, H, ToW.pop() if ToW else None
+
+
+def _read_json(path):
+    """ Widths and heights from a JSON file, either {"W": [...], "H": [...]},
+    a list of [width, height] or a list of {"Width": ..., "Height": ...}, and the type of wood from
+    an optional key "ToW" of an object, e.g. {"ToW": 1, "profiles": [...]}, None if there is none """
+    with io.open(path, encoding='utf-8-sig') as f:
+        data = json.load(f)
+    ToW = None
+    if isinstance(data, dict) and data.get('ToW') is not None:
+        ToW = _type_of_wood(data['ToW'], path)
+    if isinstance(data, dict) and 'profiles' in data:
+        data = data['profiles']
+    if isinstance(data, dict):
+        pairs = list(zip(data.get('W', data.get('Width', [])), data.get('H', data.get('Height', []))))
+    else:
+        pairs = []
+        for p in data:
+            if isinstance(p, dict):
+                p = (p.get('Width', p.get('W')), p.get('Height', p.get('H')))
+            pairs.append(p)
+    W = []
+    H = []
+    for row, p in enumerate(pairs):
+        if len(p)!=2:
+            raise ValueError('%s, profile %d: expected a width and a height' % (path, row+1))
+        W.append(_number(p[0], path, row+1))
+        H.append(_number(p[1], path, row+1))
+    return W, H, ToW
+
+
+def _cache_path(path):
+    return path+'.npy'
+
+
+def _read_cache(path, name, ToW):
+    """ Catalogue from the binary cache of path, None if there is no up to date cache
+
+    The cache holds the rows W, H and order of the sorted catalogue and the ToW of the file (0 if it
+    gives none) in the last column. It is memory mapped, so only the header is parsed and the rows
+    are copied straight from the file.
+    """
+    cached = _cache_path(path)
+    if np is None or not os.path.exists(cached) or os.path.getmtime(cached)<os.path.getmtime(path):
+        return None
+    try:
+        data = np.load(cached, mmap_mode='r')
+    except (IOError, OSError, ValueError):
+        return None
+    if data.ndim!=2 or data.shape[0]!=3 or data.shape[1]<2:
+        return None
+    W, H, order = data[:, :-1].tolist()
+    if ToW is None:
+        ToW = int(data[0, -1]) or 3
+    # Closes the file, so the cache can be rewritten when the catalogue changes
+    del data
+    return Catalogue.presorted(name, [_integral(x) for x in W], [_integral(x) for x in H], [int(x) for x in order], ToW)
+
+
+def _write_cache(path, catalogue, ToW):
+    if np is None:
+        return
+    W = list(catalogue.W)
+    H = list(catalogue.H)
+    integral = all(isinstance(x, int) for x in W+H)
+    data = np.array([W, H, list(catalogue.order)], dtype=np.int64 if integral else float)
+    data = np.concatenate((data, [[ToW or 0], [0], [0]]), axis=1)
+    try:
+        np.save(_cache_path(path), data)
+    except (IOError, OSError):
+        pass  # A read only folder only costs the speed up
+
+
+def load(path, ToW=None, name=None, binary_cache=True):
+    """ Reads a user catalogue from a CSV or JSON file
+
+    The profiles are validated and sorted once. With binary_cache, the sorted profiles are written
+    next to the file (path + '.npy', requires NumPy) and read from there on later runs as long as
+    the file has not been changed, so large catalogues are only parsed and sorted once.
+
+    Args:
+        path: CSV file with the columns Width and Height [mm] and optionally ToW, or JSON file, see _read_json
+        ToW: Type of Wood of the profiles; 1=Sawn, 2=Planed or 3=Glulam [Default: the ToW of the file, Glulam if it gives none]
+        name: Name of the catalogue [Default: the file name]
+        binary_cache: Read and write the binary cache [Default: True]
+    Returns:
+        Catalogue
+    """
+    if name is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+    c = _read_cache(path, name, ToW) if binary_cache else None
+    if c is not None:
+        return c
+    if path.lower().endswith('.json'):
+        W, H, FileToW = _read_json(path)
+    else:
+        W, H, FileToW = _read_csv(path)
+    if not W:
+        raise ValueError('%s: no profiles' % (path,))
+    c = Catalogue(name, W, H, ToW or FileToW or 3)
+    if binary_cache:
+        _write_cache(path, c, FileToW)
+    return c
+
+
+@cache.memoize(16)
+def _load_file(path, mtime):
+    return load(path)
+
+
+def resolve(ToW=1):
+    """ Returns the Catalogue for ToW; a type of wood, a Catalogue or the path of a user catalogue """
+    if isinstance(ToW, Catalogue):
+        return ToW
+    if isinstance(ToW, string_types):
+        return _load_file(ToW, os.path.getmtime(ToW))
+    return standard(ToW)
+
+
+def standard(ToW=1):
+    """ Returns the standard catalogue for the type of wood ToW [Default: sawn] """
+    return CATALOGUES.get(ToW, SAWN)
+
+
+def profiles(ToW=1, WidthProfile=None, HeightProfile=None):
+    """ Returns the profiles to verify, ordered from the smallest to the largest area
+
+    Args:
+        ToW: Type of Wood; 1=Sawn, 2=Planed or 3=Glulam, a Catalogue or the path of a user catalogue [Default: sawn]
+        WidthProfile: Width of a user defined profile [mm]
+        HeightProfile: Height of a user defined profile [mm]
+    Returns:
+        W: Widths of the profiles [mm]
+        H: Heights of the profiles [mm]
+        Input: 0 for a user defined profile, 1 for a standard catalogue
+    """
+    if WidthProfile and HeightProfile and WidthProfile>0 and HeightProfile>0:
+        return (WidthProfile,), (HeightProfile,), 0
+    c = resolve(ToW)
+    return c.W, c.H, 1
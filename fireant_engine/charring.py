@@ -0,0 +1,52 @@
+"""
+Charring depth for standard and parametric fires
+
+    t: Time of exposure [minutes]
+    Bn: Charring rate [mm/min]
+    O: Opening factor [m1/2]
+    qf: Fireload [MJ/m2]
+    Ti: Thermal inertia [Ws1/2/m2/K]
+
+The times t can be numbers or NumPy arrays of times.
+"""
+
+from __future__ import division
+
+from ._compat import where
+
+
+def charring_depth_sr(t, Bn):
+    """ Returns the charring depth dchar [mm] for a standard fire (strength reduction method) """
+    return t*Bn
+
+
+def charring_depth_rcs(t, Bn):
+    """ Returns the charring depth dchar [mm] for a standard fire (reduced cross section method) """
+    #Pyrolysis Zone
+    dpy = where(t<20, 7/20*t, 7)
+    return Bn*t+dpy
+
+
+def parametric_fire_duration(O=0.04, qf=400):
+    """ Returns the maximum duration of the parametric fire t1 """
+    return 0.0145*qf/O
+
+
+def parametric_charring_rate(Bn, O=0.04, Ti=1160):
+    """ Returns the charring rate B1 [mm/min] during the heating phase of the parametric fire """
+    BL = 1.25-0.035/((1160/Ti)*O+0.021)
+    return 1.5*Bn*BL
+
+
+def parametric_exposure_time(t, O=0.04, qf=400):
+    """ Returns the time of exposure t limited to the maximum duration of the parametric fire """
+    t1 = parametric_fire_duration(O, qf)
+    return where(t>t1, t1, t)
+
+
+def charring_depth_parametric(t, Bn, O=0.04, qf=400, Ti=1160):
+    """ Returns the charring depth dchar [mm] for a parametric fire (strength reduction method) """
+    t1 = parametric_fire_duration(O, qf)
+    t = parametric_exposure_time(t, O, qf)
+    B1 = parametric_charring_rate(Bn, O, Ti)
+    return where(t<t1/3, B1*t, B1/(12*t1)*(-9*t**2+18*t1*t-t1**2))
@@ -0,0 +1,119 @@
+"""
+Cheapest combination of strength class and profile over several catalogues
+
+The profiles of every strength class and catalogue (type of wood) are put in one list, ordered
+by cost, the area of the profile unless a cost function is given. For each member length the
+capacities of the whole list are calculated once per strength class and catalogue, and the
+cheapest combination that can carry the load of each member is found by binary search, see
+capacity.
+
+    from fireant_engine import cheapest
+    result = cheapest.design('Column-StdFire-SR', L=[3000, 4500], load=[150, 200], Str=[2, 6], ToW=[1, 3], t=60)
+    result.Str, result.ToW, result.Width, result.Height
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of the members [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+    cost: Function cost(Str, ToW, Width, Height) giving the cost of a profile, e.g. per metre [Default: area]
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import batch, capacity, catalogue, column, history, materials
+
+# Strength class, type of wood, Width and Height [mm], Capacity (NRcfire [kN] for columns, the line load at
+# which sigmafire reaches fm [kN/m] for beams), Utilization [%] and Cost of the cheapest combination per member
+CheapestResult = namedtuple('CheapestResult', 'Str ToW Width Height Capacity Utilization Cost ErrorMessage')
+
+ERROR_NO_PROFILE = column.ERROR_NO_PROFILE
+
+
+def area(Str, ToW, Width, Height):
+    """ Cost of a profile by its area [mm2] """
+    return Width*Height
+
+
+class Candidates(object):
+    """ Profiles of every strength class and catalogue, ordered by cost
+
+    Args:
+        method: Name of the FireAnt component
+        Str: Strength classes [Default: all]
+        ToW: Types of wood or catalogues, see catalogue.resolve [Default: sawn, planed and glulam]
+        cost: Cost function, see the module [Default: area]
+        scenario: Other inputs of the method (Sup, WS, t, SEF, O, qf, Ti)
+    Attributes:
+        Str, ToW, Width, Height, Cost: Of each candidate, ordered by cost
+    """
+
+    def __init__(self, method, Str=None, ToW=None, cost=area, **scenario):
+        self.member = history.method_parts(method)[0]
+        self.module = batch.MODULES[self.member]
+        if Str is None:
+            Str = sorted(materials.STRENGTH_CLASSES)
+        if ToW is None:
+            ToW = sorted(catalogue.CATALOGUES)
+        profiles_function = batch.profiles_function(method)
+        # Profiles of each strength class and type of wood
+        self.sets = []
+        candidates = []
+        for tow in ToW:
+            for s in Str:
+                profiles = profiles_function(Str=s, ToW=tow, **scenario)
+                for j in range(len(profiles.w)):
+                    candidates.append((cost(s, tow, profiles.w[j], profiles.h[j]), len(candidates), s, tow, profiles.w[j], profiles.h[j]))
+                self.sets.append(profiles)
+        # Sorted by cost, candidates with the same cost keep their order
+        candidates.sort(key=lambda x: x[:2])
+        self.order = [x[1] for x in candidates]
+        self.Cost = [x[0] for x in candidates]
+        self.Str = [x[2] for x in candidates]
+        self.ToW = [x[3] for x in candidates]
+        self.Width = [x[4] for x in candidates]
+        self.Height = [x[5] for x in candidates]
+
+    def __len__(self):
+        return len(self.order)
+
+    def capacity_index(self, L):
+        """ CapacityIndex of the candidates for the member length L [mm] """
+        values = []
+        for profiles in self.sets:
+            if self.member=='column':
+                values.extend(self.module.capacity_index(L*profiles.l0, profiles).capacity)
+            else:
+                values.extend(self.module.capacity_index(L, profiles).capacity)
+        return capacity.CapacityIndex([values[k] for k in self.order])
+
+
+def design(method, L, load, Str=None, ToW=None, cost=area, **scenario):
+    """ Cheapest strength class and profile of every member that can support the load
+
+    Args:
+        Str, ToW, cost, scenario: see Candidates
+    Returns:
+        CheapestResult with one value per member (None if no combination can support the load)
+    """
+    candidates = Candidates(method, Str, ToW, cost, **scenario)
+    indexes = {}
+    fields = [[] for x in CheapestResult._fields[:-1]]
+    ErrorMessage = None
+    for i in range(len(L)):
+        if L[i] not in indexes:
+            indexes[L[i]] = candidates.capacity_index(L[i])
+        index = indexes[L[i]]
+        k = index.smallest(load[i])
+        if candidates.member=='beam' and load[i]<=0:
+            k = -1
+        if k<0:
+            ErrorMessage = ERROR_NO_PROFILE
+            for x in fields:
+                x.append(None)
+            continue
+        C = index.capacity[k]
+        values = (candidates.Str[k], candidates.ToW[k], candidates.Width[k], candidates.Height[k], C, load[i]/C*100, candidates.Cost[k])
+        for x, value in zip(fields, values):
+            x.append(value)
+    return CheapestResult(*(fields+[ErrorMessage]))
@@ -0,0 +1,542 @@
+"""
+Verification and selection of wooden columns in fire (Calculation of NRc,fire)
+
+    L: Length of the columns [mm]
+    F: Vertical load [kN] for each column to support
+    Str: Strength class for the wood 1=C30, 2=C24, 3=C18, 4=C14, 5=GL32h, 6=GL28h or 7=GL24h) [Default: C30]
+    Sup: Support conditions for the column (1=Simply supported both ends, 2=One end fixed and one end not supported, 3=One end fixed and one end simply supported, 4=Both ends fixed [Default: Simply supported]
+    ToW: Type of Wood; 1=Sawn, 2=Planed or 3=Glulam (Glued laminated timber) standard profiles, or a user catalogue, see catalogue.resolve [Default: sawn]
+    WS: Wood Species (1=Conifer p>290 kg/m3, 2=Laminated wood p>290 kg/m3 , 3=Hardwood p>450 kg/m3, 4=Plywood [Default: Conifer]
+    t: Time of exposure [minutes] [Default 60]
+    SEF: Sides Exposed to Fire(1=Width, 2=Height, 3=Width+Height, 4=Width+2*Height, 5=2*Width+Height, 6=2*Width, 7=2*Height, 8=All [Default: All]
+    WidthProfile: Width of profile [mm] to calculate NRcfire for. If no value is inserted, the NRcfire is calculated based on ToW.
+    HeightProfile: Height of profile [mm] to calculate NRcfire for. If no value is inserted, the NRcfire is calculated based on ToW.
+    search: Search for the smallest passing profile; 'walk', 'bisect' or 'staircase', see selection [Default: walk]
+"""
+
+from __future__ import division
+
+import math as m
+from collections import namedtuple
+
+from . import cache, capacity, catalogue, charring, materials, pareto, sections, selection
+from ._compat import HAS_NUMPY, np, where
+
+if HAS_NUMPY:
+    from . import vectorized
+else:
+    vectorized = None
+
+ColumnResult = namedtuple('ColumnResult', 'NRcfire Width Height Utilization ErrorMessage Evaluated')
+
+# Profiles to verify with their section properties after fire, the inputs of select after L and F
+ColumnProfiles = namedtuple('ColumnProfiles', 'l0 w h Ar I fc E Bc CStr EStr')
+
+ERROR_NO_PROFILE = 'No profiles with selected citeria can support the load'
+
+# Relative margin on the lower bound of NRcfire, covering the rounding of buckling_capacity
+BOUND_MARGIN = 1e-9
+
+# Profiles kept by pareto_front per catalogue, dchar, SEF and t, like the residual sections
+FRONTS = cache.LRUCache(sections.SECTION_CACHE_SIZE)
+
+
+class PruningCounter(object):
+    """ Number of column sections decided by capacity_bounds, and by the full buckling calculation (evaluated)
+
+    The counts add up over every call of select and are never reset by it, so they hold the total
+    since the module was loaded (the whole Rhino session) until clear() sets them back to 0. To count
+    one design, call clear() before it. rejected+accepted+evaluated is the sum of Evaluated of the
+    results, plus the full calculation of the selected profiles, which is not counted.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __repr__(self):
+        return 'PruningCounter(rejected=%d, accepted=%d, evaluated=%d)' % (self.rejected, self.accepted, self.evaluated)
+
+    def clear(self):
+        self.rejected = 0
+        self.accepted = 0
+        self.evaluated = 0
+
+
+# Counts the sections verified by select since the module was loaded or PRUNING.clear()
+PRUNING = PruningCounter()
+
+
+def straightness_factor(ToW, Input):
+    """ Returns the straightness factor Bc (0.2 for sawn and planed, 0.1 for glulam and user defined profiles) """
+    if Input==1:
+        ToW = catalogue.resolve(ToW).ToW
+    if Input==1 and ToW!=3:
+        return 0.2
+    return 0.1
+
+
+def weakest_axis(Wr, Hr, Iy, Iz):
+    """ Returns the moment of inertia about the weakest axis of each profile """
+    I = []
+    for i in range(len(Wr)):
+        if Hr[i]>Wr[i]:
+            I.append(Iz[i])
+        else:
+            I.append(Iy[i])
+    return I
+
+
+def section_strength_reduction(Pr, Ar, t):
+    """ Reduction factors CStr and EStr of one section, or of NumPy arrays of sections and times """
+    CStr = where(t<20, 1-1/125*Pr/Ar*t/20, 1-1/125*Pr/Ar)
+    EStr = where(t<20, 1-1/330*Pr/Ar*t/20, 1-1/330*Pr/Ar)
+    return CStr, EStr
+
+
+def strength_reduction(Pr, Ar, t):
+    """ Reduction factors for compression strength CStr and modulus of elasticity EStr """
+    CStr = []
+    EStr = []
+    for i in range(len(Pr)):
+        c, e = section_strength_reduction(Pr[i], Ar[i], t)
+        CStr.append(c)
+        EStr.append(e)
+    return CStr, EStr
+
+
+def buckling_capacity(ls, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Returns the characteristic resistance NRcfire [kN] of one column section
+
+    Args:
+        ls: Critical buckling length
+        Ar: Area of the residual cross section [mm2]
+        I: Moment of inertia about the weakest axis [mm4]
+        fc: Compression strength [MPa]
+        E: Modulus of elasticity [MPa]
+        Bc: Straightness factor
+        CStr: Reduction factor for compression strength
+        EStr: Reduction factor for modulus of elasticity
+    """
+    if Ar<=0 or I<=0 or CStr<=0 or EStr<=0:
+        return 0.0
+    #Slenderness ratio
+    Lambda = ls/m.sqrt(I/Ar)
+    #Euler stress
+    SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+    #Relative slenderness ratio
+    Lambdarel = Lambda/m.sqrt(SigmaE)
+    #kfire coefficient
+    kfire = 0.5*(1+Bc*(Lambdarel-0.5)+Lambdarel*Lambdarel)
+    #Critical buckling factor
+    if Lambdarel<0.5:
+        kc = 1.0
+    else:
+        kc = 1/(kfire+m.sqrt(kfire*kfire-Lambdarel*Lambdarel))
+    #Characteristic resistance of wood
+    return Ar*fc*kc/1000
+
+
+def capacity_bounds(ls, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Returns a lower and an upper bound of NRcfire [kN] of a valid section, without square roots
+
+    kc <= 1 gives the upper bound Ar*fc/1000, which is NRcfire when Lambdarel < 0.5. Otherwise
+    Lambdarel <= (1+Lambdarel**2)/2 gives kfire <= k = 0.5*(1+(1+Bc/2)*Lambdarel**2) and
+    sqrt(k**2-Lambdarel**2) <= k-Lambdarel**2/(2*k) gives kc >= 1/(2*k-Lambdarel**2/(2*k)).
+    """
+    upper = Ar*fc/1000
+    SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+    Lambdarel2 = ls*ls*Ar/(I*SigmaE)
+    if Lambdarel2<0.25*(1-BOUND_MARGIN):
+        return upper*(1-BOUND_MARGIN), upper
+    k = 0.5*(1+(1+0.5*Bc)*Lambdarel2)
+    return upper/(2*k-Lambdarel2/(2*k))*(1-BOUND_MARGIN), upper
+
+
+def critical_slenderness(kc, Bc):
+    """ Returns the relative slenderness ratio Lambdarel at which the critical buckling factor drops to kc (0<kc<1)
+
+    Inverse of kc = 1/(kfire+sqrt(kfire**2-Lambdarel**2)), which gives
+    (1-kc)*Lambdarel**2+Bc*Lambdarel-(1/kc-1+Bc/2) = 0
+    """
+    a = 1-kc
+    c = 1/kc-1+0.5*Bc
+    return (-Bc+m.sqrt(Bc*Bc+4*a*c))/(2*a)
+
+
+def buckling_length(F, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Returns the critical buckling length ls at which NRcfire of one column section drops to F [kN]
+
+    None if the section cannot support F at any length and inf if it supports F at every length,
+    see buckling_capacity for the arguments
+    """
+    if Ar<=0 or I<=0 or CStr<=0 or EStr<=0:
+        return None
+    if F<=0:
+        return float('inf')
+    kc = F*1000/(Ar*fc)
+    if kc>=1:
+        return None
+    Lambdarel = critical_slenderness(kc, Bc)
+    SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+    return Lambdarel*m.sqrt(SigmaE)*m.sqrt(I/Ar)
+
+
+def select(L, F, l0, w, h, Ar, I, fc, E, Bc, CStr, EStr, search=selection.WALK):
+    """ Selects the smallest profile that can support the load of every column
+
+    Stops at the first passing profile instead of calculating NRcfire for the whole catalogue, see
+    selection. Sections whose capacity_bounds already decide the verification skip the full buckling
+    calculation, counted in PRUNING. Uses the NumPy kernel for the walk and staircase searches when
+    NumPy is available and the scalar loop otherwise, with identical results.
+    """
+    if vectorized is None or search not in (selection.WALK, selection.STAIRCASE):
+        return select_scalar(L, F, l0, w, h, Ar, I, fc, E, Bc, CStr, EStr, search)
+    return select_array(L, F, l0, w, h, Ar, I, fc, E, Bc, CStr, EStr, search=search)
+
+
+def select_array(L, F, l0, w, h, Ar, I, fc, E, Bc, CStr, EStr, block=None, search=selection.WALK):
+    """ select with NRcfire calculated for many columns and profiles at once (requires NumPy) """
+    ls = np.asarray(L, dtype=float)*l0
+    Fa = np.asarray(F, dtype=float)
+    Ara = np.asarray(Ar, dtype=float)
+    Ia = np.asarray(I, dtype=float)
+    CStra = np.asarray(CStr, dtype=float)
+    EStra = np.asarray(EStr, dtype=float)
+
+    def check(rows, j):
+        # Columns rows against profiles j, broadcast together
+        lsr = ls[rows]
+        Fr = Fa[rows]
+        lower, upper, valid = vectorized.capacity_bounds(lsr, Ara[j], Ia[j], fc, E, Bc, CStra[j], EStra[j], BOUND_MARGIN)
+        reject = valid & (upper<=Fr)
+        accept = valid & (lower>Fr)
+        # Full buckling calculation for the sections not decided by the bounds
+        undecided = np.nonzero(~(reject | accept))
+        r, c = [x[undecided] for x in np.broadcast_arrays(rows, j)]
+        passes = accept.copy()
+        passes[undecided] = vectorized.buckling_capacity(ls[r], Ara[c], Ia[c], fc, E, Bc, CStra[c], EStra[c])>Fa[r]
+        # Counted up to the first passing profile of each column in a block, as select_scalar does
+        if passes.ndim==2:
+            counted = np.cumsum(passes, axis=1)-passes==0
+        else:
+            counted = np.ones(passes.shape, dtype=bool)
+        PRUNING.rejected += int((reject & counted).sum())
+        PRUNING.accepted += int((accept & counted).sum())
+        PRUNING.evaluated += int((counted & ~(reject | accept)).sum())
+        return passes
+
+    if search==selection.STAIRCASE:
+        index, Evaluated = vectorized.staircase(check, len(L), selection.Grid(w, h))
+    else:
+        def evaluate(rows, start, stop):
+            return check(rows[:, np.newaxis], np.arange(start, stop))
+        index, Evaluated = vectorized.walk(evaluate, len(L), len(w), block or vectorized.BLOCK)
+    nrcfire = []
+    for i in range(len(L)):
+        j = int(index[i])
+        if j<0:
+            nrcfire.append(None)
+        else:
+            nrcfire.append(buckling_capacity(L[i]*l0, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j]))
+    return selection_result(F, w, h, index, nrcfire, Evaluated.tolist())
+
+
+def select_scalar(L, F, l0, w, h, Ar, I, fc, E, Bc, CStr, EStr, search=selection.WALK):
+    """ select one column and profile at a time """
+    index = []
+    nrcfire = []
+    Evaluated = []
+    prepared = selection.prepare(search, w, h)
+    for i in range(len(L)):
+        ls = L[i]*l0
+
+        def passing(j):
+            if Ar[j]>0 and I[j]>0 and CStr[j]>0 and EStr[j]>0:
+                lower, upper = capacity_bounds(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])
+                if upper<=F[i]:
+                    PRUNING.rejected += 1
+                    return False
+                if lower>F[i]:
+                    PRUNING.accepted += 1
+                    return True
+            PRUNING.evaluated += 1
+            return buckling_capacity(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])>F[i]
+
+        # Selecting the smallest profile with capability to support the load
+        j, evaluated = selection.search(search, w, passing, h, prepared)
+        index.append(j)
+        nrcfire.append(buckling_capacity(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j]) if j>=0 else None)
+        Evaluated.append(evaluated)
+    return selection_result(F, w, h, index, nrcfire, Evaluated)
+
+
+def capacity_index(ls, profiles):
+    """ Returns the CapacityIndex with NRcfire [kN] of every profile for the critical buckling length ls """
+    l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+    if vectorized is None:
+        return capacity.CapacityIndex([buckling_capacity(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j]) for j in range(len(w))])
+    return capacity.CapacityIndex(vectorized.column_capacity([ls], Ar, I, fc, E, Bc, CStr, EStr)[0].tolist())
+
+
+def select_load_cases(L, F, profiles):
+    """ Smallest profile of every column for each load case, see capacity
+
+    NRcfire is calculated once for every profile and column length, and the smallest profile
+    for each load is found by binary search, one search for all loads of the columns of a length,
+    so extra load cases cost almost nothing.
+
+    Args:
+        L: Length of the columns [mm]
+        F: Load cases; for each case the vertical load [kN] of every column
+        profiles: ColumnProfiles, see profiles_standard_sr
+    Returns:
+        List with a ColumnResult per load case, Evaluated is the number of NRcfire calculated per column
+    """
+    w = profiles.w
+    lengths, Evaluated = capacity.by_length(L, len(w))
+    index = [[-1]*len(L) for k in F]
+    nrcfire = [[None]*len(L) for k in F]
+    for length, members in lengths:
+        ci = capacity_index(length*profiles.l0, profiles)
+        js = ci.smallest_all([Fk[i] for Fk in F for i in members])
+        for k in range(len(F)):
+            for n, i in enumerate(members):
+                j = js[k*len(members)+n]
+                index[k][i] = j
+                nrcfire[k][i] = ci.capacity[j] if j>=0 else None
+    return [selection_result(F[k], w, profiles.h, index[k], nrcfire[k], list(Evaluated)) for k in range(len(F))]
+
+
+def maximum_length(F, profiles, tol=1):
+    """ Longest column [mm] of every profile that can support F
+
+    The length is found by inverting the kc chain of buckling_capacity, see buckling_length, and then
+    refined by bisection so the result is guaranteed to be within tol of the exact one. Uses NumPy for
+    all profiles at once when it is available.
+
+    Args:
+        F: Vertical load [kN]
+        profiles: ColumnProfiles, see profiles_standard_sr
+        tol: Accuracy of the length [mm]
+    Returns:
+        L: Length of each profile [mm] that supports F, while L+tol does not. None if the profile
+           cannot support F at any length, inf if it can at every length
+    """
+    if vectorized is None:
+        return maximum_length_scalar(F, profiles, tol)
+    return maximum_length_array(F, profiles, tol)
+
+
+def maximum_length_array(F, profiles, tol=1):
+    """ maximum_length for all profiles at once (requires NumPy) """
+    l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+    Ara = np.asarray(Ar, dtype=float)
+    Ia = np.asarray(I, dtype=float)
+    CStra = np.asarray(CStr, dtype=float)
+    EStra = np.asarray(EStr, dtype=float)
+    ls = vectorized.buckling_length(F, Ara, Ia, fc, E, Bc, CStra, EStra)
+    finite = np.isfinite(ls)
+
+    def passing(L):
+        return vectorized.buckling_capacity(L*l0, Ara, Ia, fc, E, Bc, CStra, EStra)>F
+
+    estimate = np.where(finite, ls, 0.0)/l0
+    lo = np.maximum(estimate-tol, 0.0)
+    hi = estimate+tol
+    # Widen the bracket until lo passes and hi fails
+    while True:
+        widen = finite & ~passing(lo)
+        if not widen.any():
+            break
+        lo = np.where(widen, np.maximum(lo-2*(hi-lo), 0.0), lo)
+    while True:
+        widen = finite & passing(hi)
+        if not widen.any():
+            break
+        hi = np.where(widen, hi+2*(hi-lo), hi)
+    while True:
+        active = finite & (hi-lo>tol)
+        if not active.any():
+            break
+        mid = (lo+hi)/2
+        ok = passing(mid)
+        lo = np.where(active & ok, mid, lo)
+        hi = np.where(active & ~ok, mid, hi)
+    return [float(lo[j]) if finite[j] else (float('inf') if ls[j]>0 else None) for j in range(len(w))]
+
+
+def maximum_length_scalar(F, profiles, tol=1):
+    """ maximum_length one profile at a time """
+    l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+    L = []
+    for j in range(len(w)):
+        ls = buckling_length(F, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])
+        if ls is None or ls==float('inf'):
+            L.append(ls)
+            continue
+
+        def passing(x):
+            return buckling_capacity(x*l0, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])>F
+
+        lo = max(ls/l0-tol, 0.0)
+        hi = ls/l0+tol
+        # Widen the bracket until lo passes and hi fails
+        while not passing(lo):
+            lo = max(lo-2*(hi-lo), 0.0)
+        while passing(hi):
+            hi = hi+2*(hi-lo)
+        while hi-lo>tol:
+            mid = (lo+hi)/2
+            if passing(mid):
+                lo = mid
+            else:
+                hi = mid
+        L.append(lo)
+    return L
+
+
+def selection_result(F, w, h, index, nrcfire, Evaluated):
+    """ ColumnResult of the profiles index[i] of w, h selected for every column, -1 if there is none """
+    Width = []
+    Height = []
+    NRcfire = []
+    Utilization = []
+    ErrorMessage = None
+    for i in range(len(F)):
+        j = int(index[i])
+        if j<0:
+            ErrorMessage = ERROR_NO_PROFILE
+            Width.append(None)
+            Height.append(None)
+            NRcfire.append(None)
+            Utilization.append(None)
+        else:
+            Width.append(w[j])
+            Height.append(h[j])
+            NRcfire.append(nrcfire[i])
+            Utilization.append(F[i]/nrcfire[i]*100)
+    return ColumnResult(NRcfire, Width, Height, Utilization, ErrorMessage, Evaluated)
+
+
+def pareto_front(profiles):
+    """ ColumnProfiles without the profiles that can never be selected, see pareto
+
+    NRcfire = Ar*fc*kc grows with Ar and kc, and kc grows as Lambdarel falls, i.e. with I/Ar*EStr/CStr,
+    so a profile is dominated by an earlier one with larger Ar and I/Ar*EStr/CStr. Sections without a
+    valid residual section are dominated by any earlier profile.
+    """
+    return pareto.subset(profiles, _front_indices(profiles))
+
+
+def _front_indices(profiles):
+    keys = []
+    for j in range(len(profiles.w)):
+        Ar, I, CStr, EStr = profiles.Ar[j], profiles.I[j], profiles.CStr[j], profiles.EStr[j]
+        if Ar>0 and I>0 and CStr>0 and EStr>0:
+            keys.append((Ar, I/Ar*EStr/CStr))
+        else:
+            keys.append((-1, -1))
+    return pareto.front(keys)
+
+
+def _front(profiles, approach, W, H, dchar, SEF, t):
+    """ pareto_front of the profiles of the catalogue W, H, cached in FRONTS
+
+    The front only depends on the sections after fire, so the strength class and support are not part of the key.
+    """
+    if len(W)<=1:
+        return profiles
+    keep = cache.cached(FRONTS, cache.key((approach, W, H, dchar, SEF, t)), _front_indices, profiles)
+    return pareto.subset(profiles, keep)
+
+
+def _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front):
+    fm, fc, E = materials.strength_class(Str)
+    l0 = materials.buckling_length_factor(Sup)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    Bc = straightness_factor(ToW, Input)
+
+    # Check for bmin
+    bmin = sections.minimum_width(dchar, SEF)
+    Wb = []
+    Hb = []
+    for i in range(len(W)):
+        if W[i]>bmin and H[i]>bmin:
+            Wb.append(W[i])
+            Hb.append(H[i])
+
+    w, h, Wr, Hr, Ar, Iy, Iz, Pr = sections.rounded_residual_section(Wb, Hb, dchar, SEF)
+    I = weakest_axis(Wr, Hr, Iy, Iz)
+    CStr, EStr = strength_reduction(Pr, Ar, t)
+    profiles = ColumnProfiles(l0, w, h, Ar, I, fc, E, Bc, CStr, EStr)
+    if front:
+        return _front(profiles, 'SR', W, H, dchar, SEF, t)
+    return profiles
+
+
+def profiles_standard_sr(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a standard fire using the strength reduction method, see ColumnProfiles
+
+    With front, only the profiles of the pareto_front, which is cached per catalogue, dchar, SEF and t
+    """
+    SEF = sections.sides_exposed(SEF)
+    dchar = charring.charring_depth_sr(t, materials.charring_rate_sr(WS))
+    return _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front)
+
+
+def profiles_parametric_sr(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a parametric fire using the strength reduction method, see ColumnProfiles and profiles_standard_sr """
+    SEF = sections.sides_exposed(SEF)
+    Bn = materials.charring_rate_sr(WS)
+    dchar = charring.charring_depth_parametric(t, Bn, O, qf, Ti)
+    t = charring.parametric_exposure_time(t, O, qf)
+    return _profiles_sr(Str, Sup, ToW, t, SEF, dchar, WidthProfile, HeightProfile, front)
+
+
+def profiles_standard_rcs(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, WidthProfile=None, HeightProfile=None, front=False):
+    """ Profiles to verify for a standard fire using the reduced cross section method, see ColumnProfiles and profiles_standard_sr """
+    fm, fc, E = materials.strength_class(Str)
+    l0 = materials.buckling_length_factor(Sup)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    Bc = straightness_factor(ToW, Input)
+    SEF = sections.sides_exposed(SEF)
+    dchar = charring.charring_depth_rcs(t, materials.charring_rate_rcs(WS))
+
+    w, h, Wr, Hr, Ar, Iy, Iz = sections.rectangular_residual_section(W, H, dchar, SEF)
+    I = weakest_axis(Wr, Hr, Iy, Iz)
+    ones = [1]*len(Wr)
+    profiles = ColumnProfiles(l0, w, h, Ar, I, fc, E, Bc, ones, ones)
+    if front:
+        return _front(profiles, 'RCS', W, H, dchar, SEF, t)
+    return profiles
+
+
+def design_standard_sr(L, F, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest column profile that can support F during a standard fire using the strength reduction method
+
+    Returns:
+        ColumnResult with NRcfire [kN], Width [mm], Height [mm] and Utilization [%] per column (None if no profile can support the load),
+        ErrorMessage and Evaluated, the number of profiles verified per column
+    """
+    profiles = profiles_standard_sr(Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile, front=True)
+    return select(L, F, *profiles, search=search)
+
+
+def design_parametric_sr(L, F, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest column profile that can support F during a parametric fire using the strength reduction method
+
+    Returns:
+        ColumnResult, see design_standard_sr
+    """
+    profiles = profiles_parametric_sr(Str, Sup, ToW, WS, t, SEF, O, qf, Ti, WidthProfile, HeightProfile, front=True)
+    return select(L, F, *profiles, search=search)
+
+
+def design_standard_rcs(L, F, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8, WidthProfile=None, HeightProfile=None, search=selection.WALK):
+    """ Smallest column profile that can support F during a standard fire using the reduced cross section method
+
+    Returns:
+        ColumnResult, see design_standard_sr
+    """
+    profiles = profiles_standard_rcs(Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile, front=True)
+    return select(L, F, *profiles, search=search)
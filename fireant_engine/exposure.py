@@ -0,0 +1,203 @@
+"""
+All sides exposed to fire (SEF 1-8) in one pass, when the exposure is not known yet
+
+The capacity of every profile is calculated for the eight SEF at once and the envelope is the
+lowest of them, with the governing SEF the first one giving it. A profile is selected when its
+envelope supports the load, so it can support the load whatever sides turn out to be exposed.
+
+The residual sections of SEF 2, 5 and 7 are those of SEF 1, 4 and 6 for the transposed section
+(width and height exchanged), so with NumPy the section properties are calculated for SEF 1, 4
+and 6 on the sections and their transposes stacked together, and for SEF 3 and 8, then stacked
+into arrays with one row per SEF.
+
+    from fireant_engine import exposure
+    result = exposure.design('Column-StdFire-SR', L=[3000, 4500], load=[150, 200], ToW=3, t=60)
+    result.Width, result.Capacity, result.GoverningSEF
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of the members [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import batch, beam, capacity, catalogue, column, history
+from ._compat import np
+
+
+# Sides Exposed to Fire
+SIDES = (1, 2, 3, 4, 5, 6, 7, 8)
+
+# SEF calculated as another SEF of the transposed section
+TRANSPOSED = {2: 1, 5: 4, 7: 6}
+
+# Envelope of the capacity of every profile, see envelope
+Envelope = namedtuple('Envelope', 'Width Height Capacity Minimum GoverningSEF')
+
+# Capacity (NRcfire [kN] for columns, the line load at which sigmafire reaches fm [kN/m] for beams),
+# Width, Height [mm] and Utilization [%] of the selected profile and its governing SEF per member.
+# For beams Capacity includes FStr, see beam.bending_capacity, unlike qmax of BeamResult, which is
+# beam.maximum_load of the residual section without FStr. Utilization is load/Capacity, which is
+# the Utilization of BeamResult (sigmafire/fm) for the governing SEF.
+ExposureResult = namedtuple('ExposureResult', 'Capacity Width Height Utilization GoverningSEF ErrorMessage')
+
+ERROR_NO_PROFILE = column.ERROR_NO_PROFILE
+
+
+def _transpose(approach, SEF, residual, n):
+    """ Residual section of SEF for the first n sections from the rows n: of a residual section of the transposed sections """
+    Wr, Hr, Ar, Iy, Iz, Pr, valid = [x[..., n:] if x is not None else None for x in residual]
+    if approach=='SR' and SEF==5:
+        # rounded_section gives SEF 5 the formulas of SEF 4 with width and height exchanged
+        return Hr, Wr, Ar, Iy, Iz, Pr, valid
+    return Hr, Wr, Ar, Iz, Iy, Pr, valid
+
+
+def residual_stack(approach, W, H, dchar):
+    """ Cross section after fire of sections W x H [mm] for all SEF, arrays with one row per SEF (requires NumPy)
+
+    Returns:
+        Wr, Hr, Ar, Iy, Iz, Pr, valid: see history.residual_array, Pr is None for the RCS approach
+    """
+    n = len(W)
+    # The sections followed by their transposes
+    WH = np.concatenate((W, H))
+    HW = np.concatenate((H, W))
+    stacked = {}
+    rows = {}
+    for SEF in SIDES:
+        if SEF in TRANSPOSED:
+            rows[SEF] = _transpose(approach, SEF, stacked[TRANSPOSED[SEF]], n)
+        elif SEF in TRANSPOSED.values():
+            stacked[SEF] = history.residual_array(approach, WH, HW, dchar, SEF)
+            rows[SEF] = [x[..., :n] if x is not None else None for x in stacked[SEF]]
+        else:
+            rows[SEF] = history.residual_array(approach, W, H, dchar, SEF)
+    stack = []
+    for k in range(7):
+        if rows[1][k] is None:
+            stack.append(None)
+        else:
+            stack.append(np.array([rows[SEF][k] for SEF in SIDES]))
+    return tuple(stack)
+
+
+def envelope(method, L, Str=1, Sup=1, ToW=1, WS=1, t=60, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None):
+    """ Capacity of every profile for every SEF and the envelope
+
+    Returns:
+        Envelope with Width and Height [mm] of the profiles, Capacity[s][j] of profile j for SIDES[s],
+        Minimum, the lowest capacity of each profile, and GoverningSEF, the first SEF giving it
+    """
+    return _envelopes(method, [L], Str, Sup, ToW, WS, t, O, qf, Ti, WidthProfile, HeightProfile)[0]
+
+
+def _envelopes(method, Ls, Str, Sup, ToW, WS, t, O, qf, Ti, WidthProfile, HeightProfile):
+    """ Envelope for each length of Ls, sharing the residual sections """
+    member, fire, approach = history.method_parts(method)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    if np is None:
+        result = []
+        for L in Ls:
+            Capacity = []
+            for SEF in SIDES:
+                C = history.capacities(method, L, [t], Str, Sup, ToW, WS, SEF, O, qf, Ti, WidthProfile, HeightProfile)[3]
+                Capacity.append(C[0])
+            result.append(_envelope(W, H, Capacity))
+        return result
+    dchar, ta = history.charring_depth(method, [t], WS, O, qf, Ti)
+    Wa = np.asarray(W, dtype=float)
+    Ha = np.asarray(H, dtype=float)
+    residual = residual_stack(approach, Wa, Ha, dchar[0])
+    SEF = np.array([[SEF] for SEF in SIDES])
+    result = []
+    for L in Ls:
+        Capacity = history.section_capacity(method, L, Wa, Ha, dchar[0], ta[0], residual, SEF, Str, Sup, ToW, Input)
+        result.append(_envelope(W, H, Capacity.tolist()))
+    return result
+
+
+def _envelope(W, H, Capacity):
+    Minimum = []
+    GoverningSEF = []
+    for j in range(len(W)):
+        s = min(range(len(SIDES)), key=lambda s: Capacity[s][j])
+        Minimum.append(Capacity[s][j])
+        GoverningSEF.append(SIDES[s])
+    return Envelope(list(W), list(H), Capacity, Minimum, GoverningSEF)
+
+
+def _beam_profiles(method, Str, Sup, ToW, WS, t, O, qf, Ti, WidthProfile, HeightProfile):
+    """ BeamProfiles of every SEF on the positions of the catalogue, with 0 for the profiles a SEF leaves out (see history.scatter) """
+    member, fire, approach = history.method_parts(method)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    inputs = dict(Str=Str, Sup=Sup, ToW=ToW, WS=WS, t=t, WidthProfile=WidthProfile, HeightProfile=HeightProfile)
+    if fire=='ParamFire':
+        inputs.update(O=O, qf=qf, Ti=Ti)
+    result = []
+    for SEF in SIDES:
+        profiles = batch.profiles_function(method)(SEF=SEF, **inputs)
+        values = dict((f, history.scatter(W, H, profiles.w, profiles.h, getattr(profiles, f))) for f in ('Iy', 'Hr', 'FStr'))
+        result.append(profiles._replace(**values))
+    return result
+
+
+def _beam_passes(profiles, L, q, j):
+    """ True if profile j of every BeamProfiles of profiles can support the line load q, as in beam.select """
+    for c, w, h, Iy, Hr, fm, FStr in profiles:
+        if Iy[j]<=0:
+            return False
+        sigma = beam.bending_stress(c*q*(L*L), Iy[j], Hr[j], FStr[j])
+        if not 0<sigma<fm:
+            return False
+    return True
+
+
+def design(method, L, load, Str=1, Sup=1, ToW=1, WS=1, t=60, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None):
+    """ Smallest profile of every member that can support the load for every SEF
+
+    The envelope is calculated once per member length, and the smallest profile for each load
+    is found by binary search, see capacity. For beams the selected profile is verified with
+    beam.bending_stress for every SEF, so a load exactly at the capacity of a profile is decided
+    as in beam.select.
+
+    Returns:
+        ExposureResult with one value per member (None if no profile can support the load)
+    """
+    member, fire, approach = history.method_parts(method)
+    lengths = sorted(set(L))
+    envelopes = dict(zip(lengths, _envelopes(method, lengths, Str, Sup, ToW, WS, t, O, qf, Ti, WidthProfile, HeightProfile)))
+    if member=='beam':
+        profiles = _beam_profiles(method, Str, Sup, ToW, WS, t, O, qf, Ti, WidthProfile, HeightProfile)
+    indexes = {}
+    Capacity = []
+    Width = []
+    Height = []
+    Utilization = []
+    GoverningSEF = []
+    ErrorMessage = None
+    for i in range(len(L)):
+        e = envelopes[L[i]]
+        if L[i] not in indexes:
+            indexes[L[i]] = capacity.CapacityIndex(e.Minimum)
+        if member=='beam':
+            j = indexes[L[i]].smallest(load[i]*(1-beam.CAPACITY_MARGIN))
+            while 0<=j<len(e.Width) and not _beam_passes(profiles, L[i], load[i], j):
+                j += 1
+            if j>=len(e.Width) or load[i]<=0:
+                j = -1
+        else:
+            j = indexes[L[i]].smallest(load[i])
+        if j<0:
+            ErrorMessage = ERROR_NO_PROFILE
+            for x in (Capacity, Width, Height, Utilization, GoverningSEF):
+                x.append(None)
+            continue
+        Capacity.append(e.Minimum[j])
+        Width.append(e.Width[j])
+        Height.append(e.Height[j])
+        Utilization.append(load[i]/e.Minimum[j]*100)
+        GoverningSEF.append(e.GoverningSEF[j])
+    return ExposureResult(Capacity, Width, Height, Utilization, GoverningSEF, ErrorMessage)
@@ -0,0 +1,151 @@
+"""
+Glulam sections of any size on the lamella grid, beyond the standard catalogue
+
+The standard glulam catalogue stops at 185x1500 mm. Glulam can be made in any height that is a
+whole number of lamellas, so Grid describes the sections by a list of widths and the lamella
+thickness, and the sections are generated one at a time while searching. For every width the
+lowest passing height is found by bisection over the lamellas, starting below the lowest passing
+height of the narrower widths, and widths that cannot beat the smallest area found are skipped.
+Each candidate is verified with verify.verify, so only O(widths*log(heights)) sections of the grid
+are ever created, and only the selected section goes through the design function of the method.
+
+    from fireant_engine import glulam
+    grid = glulam.Grid(widths=(140, 185, 240, 290), hmax=2500)
+    result = glulam.design('Beam-StdFire-SR', L=[12000, 16000], load=[40, 60], grid=grid, t=60)
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of the members [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+"""
+
+from __future__ import division
+
+import math as m
+
+from . import batch, verify
+
+# Widths [mm], the standard glulam widths and wider ones
+WIDTHS = (65, 90, 115, 140, 160, 185, 215, 240, 265, 290)
+
+# Thickness of a lamella [mm], giving the heights 100, 133, 167, 200, ... of the standard catalogue
+LAMELLA = 100/3
+
+
+class Grid(object):
+    """ Glulam sections with the given widths and the heights hmin+k*lamella up to hmax, rounded to whole mm
+
+    Args:
+        widths: Widths of the sections [mm] [Default: WIDTHS]
+        lamella: Thickness of a lamella [mm] [Default: LAMELLA]
+        hmin: Smallest height [mm] [Default: 100]
+        hmax: Largest height [mm] [Default: 2500]
+    """
+
+    def __init__(self, widths=WIDTHS, lamella=LAMELLA, hmin=100, hmax=2500):
+        if not widths or min(widths)<=0 or lamella<=0 or hmin<=0 or hmax<hmin:
+            raise ValueError('A glulam grid needs positive widths, lamella and heights with hmin <= hmax')
+        self.widths = tuple(sorted(widths))
+        self.lamella = lamella
+        self.hmin = hmin
+        self.hmax = hmax
+
+    def __len__(self):
+        """ Number of heights """
+        return int(m.floor((self.hmax-self.hmin)/self.lamella+1e-9))+1
+
+    def __repr__(self):
+        return 'Grid(%d widths x %d heights)' % (len(self.widths), len(self))
+
+    def height(self, k):
+        """ Height [mm] of k lamellas above hmin """
+        return int(m.floor(self.hmin+k*self.lamella+0.5))
+
+    def below(self, area, w):
+        """ Number of heights giving a section of width w with an area smaller than area [mm2] """
+        lo, hi = 0, len(self)
+        while lo<hi:
+            mid = (lo+hi)//2
+            if w*self.height(mid)<area:
+                lo = mid+1
+            else:
+                hi = mid
+        return lo
+
+
+GRID = Grid()
+
+
+def smallest(method, L, load, grid=GRID, **scenario):
+    """ Smallest section of the grid that can support the load of one member
+
+    Assumes that a section passes whenever a section that is not wider and not higher passes,
+    like selection.staircase. Sections with the same area are resolved to the narrowest one.
+
+    Args:
+        scenario: Other inputs of the method (Str, Sup, WS, t, SEF, O, qf, Ti)
+    Returns:
+        result: Result of the design function for the section, None if no section can support the load
+        Evaluated: Number of sections verified
+    """
+    design, name = batch.design_function(method)
+    checked = {}
+
+    def passing(w, k):
+        if (w, k) not in checked:
+            result = verify.verify(method, [L], [load], [w], [grid.height(k)], **scenario)
+            # Like the design functions, sections without a residual section are never selected
+            checked[(w, k)] = bool(result.Passes[0]) and result.Capacity[0]>0
+        return checked[(w, k)]
+
+    best = None
+    area = None
+    # Index of the lowest passing height of the narrower widths
+    top = len(grid)-1
+    for w in grid.widths:
+        hi = top
+        if area is not None:
+            hi = min(hi, grid.below(area, w)-1)
+        if hi<0:
+            if area is not None:
+                # Wider sections are larger still
+                break
+            continue
+        if not passing(w, hi):
+            continue
+        lo = 0
+        while lo<hi:
+            mid = (lo+hi)//2
+            if passing(w, mid):
+                hi = mid
+            else:
+                lo = mid+1
+        top = lo
+        best = w, grid.height(lo)
+        area = w*grid.height(lo)
+    if best is None:
+        return None, len(checked)
+    return design([L], [load], WidthProfile=best[0], HeightProfile=best[1], **scenario), len(checked)
+
+
+def design(method, L, load, grid=GRID, **scenario):
+    """ Smallest section of the grid for every member, see smallest
+
+    Returns:
+        ColumnResult or BeamResult like the design function of the method, with Evaluated the number of sections verified per member
+    """
+    Result = batch.result_type(method)
+    error = Result._fields.index('ErrorMessage')
+    evaluated = Result._fields.index('Evaluated')
+    fields = [[] for x in Result._fields]
+    fields[error] = None
+    for i in range(len(L)):
+        result, Evaluated = smallest(method, L[i], load[i], grid, **scenario)
+        for f in range(len(fields)):
+            if f==error:
+                if result is None:
+                    fields[f] = batch.MODULES[batch.METHODS[method][0]].ERROR_NO_PROFILE
+            elif f==evaluated:
+                fields[f].append(Evaluated)
+            else:
+                fields[f].append(result[f][0] if result is not None else None)
+    return Result(*fields)
@@ -0,0 +1,205 @@
+"""
+Strength reduction (SR) and reduced cross section (RCS) methods side by side for a standard fire
+
+The profiles of both methods are put on the positions of the catalogue (see history.scatter),
+and one walk over the catalogue finds, for every member, the smallest profile of each method and
+the smallest profile that passes both methods. A block of profiles is verified once per method
+and member, and that verification is shared by the search of the method alone and the search
+for both. The governing method of a member is the one with the lower capacity of that profile
+(SR if they are the same).
+
+    from fireant_engine import governing
+    result = governing.design('column', L=[3000, 4500], load=[150, 200], ToW=3, t=60)
+    result.Governing, result.Width, result.Height
+
+    member: 'column' or 'beam'
+    L: Length of the members [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+    Other inputs: see the design functions of the member
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import batch, beam, catalogue, column, history, selection
+from ._compat import HAS_NUMPY, np
+
+if HAS_NUMPY:
+    from . import vectorized
+else:
+    vectorized = None
+
+# Standard fire methods of each member: strength reduction, reduced cross section
+METHODS = {
+    'column': ('Column-StdFire-SR', 'Column-StdFire-RCS'),
+    'beam': ('Beam-StdFire-SR', 'Beam-StdFire-RCS'),
+}
+
+# Inputs of the profiles given per profile, see ColumnProfiles and BeamProfiles
+PER_PROFILE = {
+    'column': ('w', 'h', 'Ar', 'I', 'CStr', 'EStr'),
+    'beam': ('w', 'h', 'Iy', 'Hr', 'FStr'),
+}
+
+# SR, RCS: ColumnResult or BeamResult of each method
+# Governing: 'SR' or 'RCS' per member, with Width, Height [mm] and Utilization [%] of the smallest profile passing both methods
+SideBySide = namedtuple('SideBySide', 'SR RCS Governing Width Height Utilization ErrorMessage')
+
+
+def scattered_profiles(member, W, H, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=None, WidthProfile=None, HeightProfile=None):
+    """ Profiles of the SR and RCS methods on the positions of the catalogue W, H
+
+    Returns:
+        ColumnProfiles or BeamProfiles of each method, with 0 for the profiles the method leaves out,
+        which have w = 0
+    """
+    result = []
+    for method in METHODS[member]:
+        profiles = batch.profiles_function(method)(Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile)
+        values = {}
+        for f in PER_PROFILE[member]:
+            values[f] = history.scatter(W, H, profiles.w, profiles.h, getattr(profiles, f))
+        result.append(profiles._replace(**values))
+    return result
+
+
+def _passing_scalar(member, profiles, L, load):
+    """ Function telling if profile j of the scattered profiles can support the load of one member, see select_scalar """
+    checked = {}
+    if member=='column':
+        l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+        ls = L*l0
+
+        def passing(j):
+            return w[j]>0 and column.buckling_capacity(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])>load
+    else:
+        c, w, h, Iy, Hr, fm, FStr = profiles
+        Mmax = c*load*(L*L)
+
+        def passing(j):
+            return w[j]>0 and 0<beam.bending_stress(Mmax, Iy[j], Hr[j], FStr[j])<fm
+
+    def check(j):
+        if j not in checked:
+            checked[j] = passing(j)
+        return checked[j]
+    return check
+
+
+def _walk_scalar(member, profiles, L, load, n):
+    """ index and Evaluated of SR, RCS and both methods, one member at a time """
+    index = [[], [], []]
+    Evaluated = [[], [], []]
+    for i in range(len(L)):
+        SR, RCS = [_passing_scalar(member, p, L[i], load[i]) for p in profiles]
+        for k, passing in enumerate((SR, RCS, lambda j: SR(j) and RCS(j))):
+            j, evaluated = selection.walk(n, passing)
+            index[k].append(j)
+            Evaluated[k].append(evaluated)
+    return index, Evaluated
+
+
+def _passes_array(member, profiles, L, load, rows, start, stop):
+    """ Boolean array telling if the profiles start:stop of the scattered profiles can support the load of the members rows, see select_array """
+    if member=='column':
+        l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+        ls = (L[rows]*l0)[:, np.newaxis]
+        NRcfire = vectorized.buckling_capacity(ls, Ar[start:stop], I[start:stop], fc, E, Bc, CStr[start:stop], EStr[start:stop])
+        passes = NRcfire>load[rows][:, np.newaxis]
+    else:
+        c, w, h, Iy, Hr, fm, FStr = profiles
+        sigmafire = vectorized.bending_stress(L[rows], load[rows], Iy[start:stop], Hr[start:stop], c, FStr[start:stop])
+        passes = (sigmafire>0) & (sigmafire<fm)
+    return passes & (w[start:stop]>0)
+
+
+def _walk_array(member, profiles, L, load, n):
+    """ index and Evaluated of SR, RCS and both methods, in one walk over 3 rows per member (requires NumPy) """
+    members = len(L)
+    La = np.asarray(L, dtype=float)
+    loads = np.asarray(load, dtype=float)
+    arrays = []
+    for p in profiles:
+        arrays.append(p._replace(**dict((f, np.asarray(getattr(p, f), dtype=float)) for f in PER_PROFILE[member])))
+
+    def evaluate(rows, start, stop):
+        member_rows = rows % members
+        group = rows//members
+        passes = np.ones((len(rows), stop-start), dtype=bool)
+        for k in (0, 1):
+            # The members searched with method k alone or with both methods, each verified once
+            r = (group==k) | (group==2)
+            u, inverse = np.unique(member_rows[r], return_inverse=True)
+            passes[r] &= _passes_array(member, arrays[k], La, loads, u, start, stop)[inverse]
+        return passes
+
+    index, Evaluated = vectorized.walk(evaluate, 3*members, n)
+    index = index.tolist()
+    Evaluated = Evaluated.tolist()
+    return [index[k*members:(k+1)*members] for k in range(3)], [Evaluated[k*members:(k+1)*members] for k in range(3)]
+
+
+def _method_result(member, profiles, W, H, L, load, index, Evaluated):
+    """ ColumnResult or BeamResult of one method and its utilization of the profiles index """
+    if member=='column':
+        l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+        nrcfire = []
+        for i in range(len(L)):
+            j = index[i]
+            nrcfire.append(column.buckling_capacity(L[i]*l0, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j]) if j>=0 else None)
+        return column.selection_result(load, W, H, index, nrcfire, Evaluated)
+    c, w, h, Iy, Hr, fm, FStr = profiles
+    sigmafire = []
+    Qmax = []
+    for i in range(len(L)):
+        j = index[i]
+        sigmafire.append(beam.bending_stress(c*load[i]*(L[i]*L[i]), Iy[j], Hr[j], FStr[j]) if j>=0 else None)
+        Qmax.append(beam.maximum_load(L[i], Iy[j], Hr[j], fm, c) if j>=0 else None)
+    return beam.selection_result(fm, W, H, index, sigmafire, Qmax, Evaluated)
+
+
+def design(member, L, load, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=None, WidthProfile=None, HeightProfile=None):
+    """ Smallest profile of every member with each method and with both methods, and the governing method
+
+    Returns:
+        SideBySide with the results of both methods and the governing method, Width, Height and Utilization per member
+    """
+    if member not in METHODS:
+        raise ValueError('Unknown member: %r' % (member,))
+    if SEF is None:
+        SEF = history.DEFAULT_SEF[member]
+    L = list(L)
+    load = list(load)
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    profiles = scattered_profiles(member, W, H, Str, Sup, ToW, WS, t, SEF, WidthProfile, HeightProfile)
+    if vectorized is None:
+        index, Evaluated = _walk_scalar(member, profiles, L, load, len(W))
+    else:
+        index, Evaluated = _walk_array(member, profiles, L, load, len(W))
+    SR, RCS = [_method_result(member, profiles[k], W, H, L, load, index[k], Evaluated[k]) for k in (0, 1)]
+    # Both methods on the smallest profile passing both
+    both = [_method_result(member, profiles[k], W, H, L, load, index[2], Evaluated[2]) for k in (0, 1)]
+    Governing = []
+    Width = []
+    Height = []
+    Utilization = []
+    ErrorMessage = None
+    for i in range(len(L)):
+        if index[2][i]<0:
+            ErrorMessage = batch.MODULES[member].ERROR_NO_PROFILE
+            Governing.append('RCS' if RCS.Width[i] is None and SR.Width[i] is not None else 'SR')
+            Width.append(None)
+            Height.append(None)
+            Utilization.append(None)
+            continue
+        # The method with the lower capacity governs; for beams, which only pass a positive load, that is the higher utilization
+        if member=='column':
+            k = 0 if both[0].NRcfire[i]<=both[1].NRcfire[i] else 1
+        else:
+            k = 0 if both[0].Utilization[i]>=both[1].Utilization[i] else 1
+        Governing.append(('SR', 'RCS')[k])
+        Width.append(both[k].Width[i])
+        Height.append(both[k].Height[i])
+        Utilization.append(both[k].Utilization[i])
+    return SideBySide(SR, RCS, Governing, Width, Height, Utilization, ErrorMessage)
@@ -0,0 +1,333 @@
+"""
+Capacity of the profiles over the time of a fire
+
+The capacity is NRcfire [kN] for columns and, for beams, the line load [kN/m] at which
+sigmafire reaches fm (see beam.bending_capacity). Profiles that are burnt through, thinner
+than bmin or otherwise not verified by the method have capacity 0. With NumPy all times and
+profiles are calculated in one array pass, otherwise one time at a time with the functions
+of the method.
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of the member [mm]
+    Other inputs: see the design function of the method
+"""
+
+from __future__ import division
+
+import math as m
+from collections import namedtuple
+
+from . import batch, beam, catalogue, charring, column, materials, sections
+from ._compat import HAS_NUMPY, np
+
+if HAS_NUMPY:
+    from . import vectorized
+else:
+    vectorized = None
+
+ParametricScan = namedtuple('ParametricScan', 'Time dchar Width Height Capacity Governing Minimum')
+CapacityCurves = namedtuple('CapacityCurves', 'Time dchar Width Height Capacity')
+
+# Number of time steps calculated at a time by standard_curves
+BLOCK = 16
+
+# Default sides exposed to fire of the design functions
+DEFAULT_SEF = {'column': 8, 'beam': 4}
+
+
+def method_parts(method):
+    """ Returns the member ('column' or 'beam'), the fire ('StdFire' or 'ParamFire') and the approach ('SR' or 'RCS') of a method """
+    batch.design_function(method)
+    member, fire, approach = method.split('-')
+    return member.lower(), fire, approach
+
+
+def charring_depth(method, t, WS=1, O=0.04, qf=400, Ti=1160):
+    """ Charring depth dchar [mm] of the method for an array of times t [minutes] (requires NumPy)
+
+    Returns:
+        dchar: Array of charring depths [mm]
+        t: Array of times used for the strength reduction, limited to t1 for parametric fires
+    """
+    member, fire, approach = method_parts(method)
+    t = np.asarray(t, dtype=float)
+    if fire=='ParamFire':
+        Bn = materials.charring_rate_sr(WS)
+        dchar = charring.charring_depth_parametric(t, Bn, O, qf, Ti)
+        t = charring.parametric_exposure_time(t, O, qf)
+    elif approach=='RCS':
+        dchar = charring.charring_depth_rcs(t, materials.charring_rate_rcs(WS))
+    else:
+        dchar = charring.charring_depth_sr(t, materials.charring_rate_sr(WS))
+    return dchar, t
+
+
+def capacity_array(method, L, W, H, dchar, t, Str=1, Sup=1, ToW=1, SEF=None, Input=1):
+    """ Capacity of sections W x H [mm] with the charring depth dchar [mm] at time t [minutes] (requires NumPy)
+
+    L, W, H, dchar and t are arrays that are broadcast together, e.g. times as a column and profiles as a row.
+    """
+    member, fire, approach = method_parts(method)
+    SEF = sections.sides_exposed(DEFAULT_SEF[member] if SEF is None else SEF)
+    W = np.asarray(W, dtype=float)
+    H = np.asarray(H, dtype=float)
+    dchar = np.asarray(dchar, dtype=float)
+    residual = residual_array(approach, W, H, dchar, SEF)
+    return section_capacity(method, L, W, H, dchar, t, residual, SEF, Str, Sup, ToW, Input)
+
+
+def residual_array(approach, W, H, dchar, SEF):
+    """ Cross section after fire of sections W x H [mm] with the charring depth dchar [mm] for one SEF (requires NumPy)
+
+    Returns:
+        Wr, Hr: Width and height after fire [mm]
+        Ar, Iy, Iz, Pr: Section properties, see sections.rounded_section (Pr is None for the RCS approach)
+        valid: False for the sections without a residual section
+    """
+    nw, nh = sections.CHARRED_LAYERS[SEF]
+    Wr = W-nw*dchar
+    Hr = H-nh*dchar
+    valid = (Wr>0) & (Hr>0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if approach=='SR':
+            Ar, Iy, Iz, Pr = sections.rounded_section(Wr, Hr, dchar, SEF)
+            valid = valid & (Ar>0) & (Iy>0) & (Iz>0)
+        else:
+            Ar, Iy, Iz = sections.rectangle(Wr, Hr)
+            Pr = None
+    return Wr, Hr, Ar, Iy, Iz, Pr, valid
+
+
+def section_capacity(method, L, W, H, dchar, t, residual, SEF, Str=1, Sup=1, ToW=1, Input=1):
+    """ Capacity of sections W x H [mm] with the cross section after fire residual, see residual_array (requires NumPy)
+
+    Args:
+        SEF: Sides exposed to fire of the residual sections, a number or an array to broadcast with the sections
+    """
+    member, fire, approach = method_parts(method)
+    fm, fc, E = materials.strength_class(Str)
+    Wr, Hr, Ar, Iy, Iz, Pr, valid = residual
+    t = np.asarray(t, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if member=='column':
+            if approach=='SR':
+                # Check for bmin
+                bmin = sections.minimum_width(dchar, SEF)
+                valid = valid & (W>bmin) & (H>bmin)
+                CStr, EStr = column.section_strength_reduction(Pr, Ar, t)
+            else:
+                CStr = EStr = 1
+            I = np.where(Hr>Wr, Iz, Iy)
+            Bc = column.straightness_factor(ToW, Input)
+            ls = np.asarray(L, dtype=float)*materials.buckling_length_factor(Sup)
+            capacity = vectorized.buckling_capacity(ls, Ar, I, fc, E, Bc, CStr, EStr)
+        else:
+            if approach=='SR':
+                FStr = beam.section_strength_reduction(Pr, Ar, t)
+            else:
+                FStr = 1
+            capacity = vectorized.bending_capacity(L, Iy, Hr, fm, materials.moment_coefficient(Sup), FStr)
+    return np.where(valid, capacity, 0.0)
+
+
+def scatter(W, H, w, h, values):
+    """ values of the profiles w, h, a subsequence of W, H, put at the positions of W, H with 0 for the others """
+    result = [0.0]*len(W)
+    k = 0
+    for j in range(len(W)):
+        if k<len(w) and W[j]==w[k] and H[j]==h[k]:
+            result[j] = values[k]
+            k += 1
+    return result
+
+
+def _capacity_scalar(method, L, t, inputs):
+    member, fire, approach = method_parts(method)
+    profiles = batch.profiles_function(method)(t=t, **inputs)
+    if member=='column':
+        ci = column.capacity_index(L*profiles.l0, profiles)
+    else:
+        ci = beam.capacity_index(L, profiles)
+    return profiles.w, profiles.h, ci.capacity
+
+
+def capacities(method, L, Time, Str=1, Sup=1, ToW=1, WS=1, SEF=None, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None):
+    """ Capacity of every profile at every time
+
+    Args:
+        Time: Times [minutes]
+    Returns:
+        Width, Height: Profiles [mm], ordered from the smallest to the largest area
+        dchar: Charring depth at each time [mm]
+        Capacity: For each time the capacity of every profile
+    """
+    member, fire, approach = method_parts(method)
+    if SEF is None:
+        SEF = DEFAULT_SEF[member]
+    W, H, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    if np is None:
+        inputs = dict(Str=Str, Sup=Sup, ToW=ToW, WS=WS, SEF=SEF, WidthProfile=WidthProfile, HeightProfile=HeightProfile)
+        if fire=='ParamFire':
+            inputs.update(O=O, qf=qf, Ti=Ti)
+        dchar = []
+        Capacity = []
+        for t in Time:
+            if fire=='ParamFire':
+                dchar.append(charring.charring_depth_parametric(t, materials.charring_rate_sr(WS), O, qf, Ti))
+            elif approach=='RCS':
+                dchar.append(charring.charring_depth_rcs(t, materials.charring_rate_rcs(WS)))
+            else:
+                dchar.append(charring.charring_depth_sr(t, materials.charring_rate_sr(WS)))
+            w, h, capacity = _capacity_scalar(method, L, t, inputs)
+            Capacity.append(scatter(W, H, w, h, capacity))
+        return list(W), list(H), dchar, Capacity
+    dchar, t = charring_depth(method, Time, WS, O, qf, Ti)
+    Capacity = capacity_array(method, L, W, H, dchar[:, np.newaxis], t[:, np.newaxis], Str, Sup, ToW, SEF, Input)
+    return list(W), list(H), dchar.tolist(), Capacity.tolist()
+
+
+def parametric_scan(method, L, Str=1, Sup=1, ToW=1, WS=1, SEF=None, O=0.04, qf=400, Ti=1160, WidthProfile=None, HeightProfile=None, step=1):
+    """ Capacity of every profile over the whole parametric fire, heating and decay up to 3*t1,
+    with the governing instant and the minimum capacity of each profile
+
+    Args:
+        method: 'Column-ParamFire-SR' or 'Beam-ParamFire-SR'
+        step: Time step [minutes], t1 is always included
+    Returns:
+        ParametricScan with Time [minutes], dchar [mm], Width and Height [mm], Capacity for each time and profile,
+        Governing, the first time with the minimum capacity, and Minimum, the minimum capacity of each profile
+    """
+    member, fire, approach = method_parts(method)
+    if fire!='ParamFire':
+        raise ValueError('%s is not a parametric fire method' % (method,))
+    t1 = charring.parametric_fire_duration(O, qf)
+    n = int(m.floor(3*t1/step))
+    Time = sorted([k*step for k in range(n+1) if abs(k*step-t1)>1e-9 and k*step<3*t1-1e-9]+[t1, 3*t1])
+    Width, Height, dchar, Capacity = capacities(method, L, Time, Str, Sup, ToW, WS, SEF, O, qf, Ti, WidthProfile, HeightProfile)
+    if np is None:
+        first = [min(range(len(Time)), key=lambda k: Capacity[k][j]) for j in range(len(Width))]
+    else:
+        first = np.asarray(Capacity).reshape(len(Time), len(Width)).argmin(axis=0).tolist()
+    Governing = [Time[k] for k in first]
+    Minimum = [Capacity[first[j]][j] for j in range(len(Width))]
+    return ParametricScan(Time, dchar, Width, Height, Capacity, Governing, Minimum)
+
+
+def standard_curves(method, L, Str=1, Sup=1, ToW=1, WS=1, SEF=None, WidthProfile=None, HeightProfile=None, tmax=120, step=1):
+    """ Capacity-time curves of every profile for a standard fire from 0 to tmax minutes
+
+    dchar grows with t, so a profile that has lost its capacity never gets it back. The times are swept
+    in blocks of BLOCK steps with NumPy, and each block only calculates the profiles that still had a
+    capacity at the end of the previous one.
+
+    Args:
+        method: 'Column-StdFire-SR', 'Column-StdFire-RCS', 'Beam-StdFire-SR' or 'Beam-StdFire-RCS'
+        step: Time step [minutes]
+    Returns:
+        CapacityCurves with Time [minutes], dchar [mm], Width and Height [mm] and Capacity for each time and profile
+    """
+    member, fire, approach = method_parts(method)
+    if fire!='StdFire':
+        raise ValueError('%s is not a standard fire method' % (method,))
+    Time = [k*step for k in range(int(m.floor(tmax/step+1e-9))+1)]
+    if np is None:
+        Width, Height, dchar, Capacity = capacities(method, L, Time, Str, Sup, ToW, WS, SEF, WidthProfile=WidthProfile, HeightProfile=HeightProfile)
+        return CapacityCurves(Time, dchar, Width, Height, Capacity)
+
+    Width, Height, Input = catalogue.profiles(ToW, WidthProfile, HeightProfile)
+    W = np.asarray(Width, dtype=float)
+    H = np.asarray(Height, dtype=float)
+    dchar, t = charring_depth(method, Time, WS)
+    Capacity = np.zeros((len(Time), len(W)))
+    alive = np.arange(len(W))
+    for start in range(0, len(Time), BLOCK):
+        if len(alive)==0:
+            break
+        stop = min(start+BLOCK, len(Time))
+        block = capacity_array(method, L, W[alive], H[alive], dchar[start:stop, np.newaxis], t[start:stop, np.newaxis], Str, Sup, ToW, SEF, Input)
+        Capacity[start:stop, alive] = block
+        alive = alive[block[-1]>0]
+    return CapacityCurves(Time, dchar.tolist(), list(Width), list(Height), Capacity.tolist())
+
+
+def supports(member, capacity, load):
+    """ True if the load can be supported, as in the select functions of column and beam """
+    if member=='column':
+        return capacity>load
+    return 0<load<capacity
+
+
+def fire_resistance(method, L, load, Width, Height, Str=1, Sup=1, WS=1, SEF=None, O=0.04, qf=400, Ti=1160, tmax=240, tol=0.01):
+    """ Largest time of exposure t [minutes] for which each section can still support its load
+
+    The capacity decreases with t, so t is found by bisection between 0 and tmax, for all sections at
+    once when NumPy is available. The sections are verified as user defined profiles (WidthProfile, HeightProfile).
+
+    Args:
+        L: Length of each member [mm]
+        load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+        Width, Height: Section of each member [mm]
+        tmax: Longest time of exposure searched [minutes]
+        tol: Accuracy of t [minutes]
+    Returns:
+        List with t for each member; tmax if the section passes at tmax and None if it fails at t=0.
+        The section passes at the returned t and fails within tol after it
+    """
+    member, fire, approach = method_parts(method)
+    if SEF is None:
+        SEF = DEFAULT_SEF[member]
+    n = len(L)
+    if np is None:
+        inputs = dict(Str=Str, Sup=Sup, WS=WS, SEF=SEF)
+        if fire=='ParamFire':
+            inputs.update(O=O, qf=qf, Ti=Ti)
+
+        def passing(i, t):
+            inputs.update(WidthProfile=Width[i], HeightProfile=Height[i])
+            w, h, capacity = _capacity_scalar(method, L[i], t, inputs)
+            return len(capacity)>0 and supports(member, capacity[0], load[i])
+
+        result = []
+        for i in range(n):
+            if not passing(i, 0):
+                result.append(None)
+            elif passing(i, tmax):
+                result.append(tmax)
+            else:
+                lo = 0
+                hi = tmax
+                while hi-lo>tol:
+                    mid = (lo+hi)/2
+                    if passing(i, mid):
+                        lo = mid
+                    else:
+                        hi = mid
+                result.append(lo)
+        return result
+
+    La = np.asarray(L, dtype=float)
+    loads = np.asarray(load, dtype=float)
+    W = np.asarray(Width, dtype=float)
+    H = np.asarray(Height, dtype=float)
+
+    def passing(t):
+        dchar, te = charring_depth(method, t, WS, O, qf, Ti)
+        capacity = capacity_array(method, La, W, H, dchar, te, Str, Sup, 1, SEF, 0)
+        if member=='column':
+            return capacity>loads
+        return (loads>0) & (loads<capacity)
+
+    start = passing(np.zeros(n))
+    lo = np.zeros(n)
+    hi = np.full(n, float(tmax))
+    done = passing(hi)
+    lo[done] = tmax
+    while True:
+        active = ~done & (hi-lo>tol)
+        if not active.any():
+            break
+        mid = (lo+hi)/2
+        ok = passing(mid)
+        lo = np.where(active & ok, mid, lo)
+        hi = np.where(active & ~ok, mid, hi)
+    return [float(lo[i]) if start[i] else None for i in range(n)]
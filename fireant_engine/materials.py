@@ -0,0 +1,59 @@
+"""
+Strength classes, wood species and support conditions used by the FireAnt design methods
+
+    Str: Strength class for the wood 1=C30, 2=C24, 3=C18, 4=C14, 5=GL32h, 6=GL28h or 7=GL24h
+    WS: Wood Species (1=Conifer p>290 kg/m3, 2=Laminated wood p>290 kg/m3 , 3=Hardwood p>450 kg/m3, 4=Plywood with a thickness d>20 mm and density p>450 kg/m3
+    Sup: Support conditions (1=Simply supported both ends, 2=One end fixed and one end not supported, 3=One end fixed and one end simply supported, 4=Both ends fixed
+"""
+
+from __future__ import division
+
+# Strength class: fm, fc, E [MPa]
+STRENGTH_CLASSES = {
+    1: (30, 23, 8000),      # C30
+    2: (24, 21, 7400),      # C24
+    3: (18, 18, 6000),      # C18
+    4: (14, 16, 4700),      # C14
+    5: (32, 29, 11100),     # GL32h
+    6: (28, 26.5, 10200),   # GL28h
+    7: (24, 24, 9400),      # GL24h
+}
+
+# Charring rate Bn [mm/min] for the strength reduction method
+CHARRING_RATE_SR = {1: 0.65, 2: 0.65, 3: 0.5, 4: 1}
+
+# Charring rate Bn [mm/min] for the reduced cross section method
+CHARRING_RATE_RCS = {1: 0.8, 2: 0.7, 3: 0.55}
+
+# Buckling length factor l0 for columns
+BUCKLING_LENGTH_FACTORS = {1: 1, 2: 2, 3: 0.699, 4: 1/2}
+
+# Maximum moment coefficient for beams, Mmax = c*q*L**2
+MOMENT_COEFFICIENTS = {1: 1/8, 2: 1/2, 3: 9/128, 4: 1/8}
+
+
+def strength_class(Str):
+    """ Returns fm, fc and E [MPa] for the strength class Str """
+    if Str not in STRENGTH_CLASSES:
+        raise ValueError('Unknown strength class: %r' % (Str,))
+    return STRENGTH_CLASSES[Str]
+
+
+def charring_rate_sr(WS):
+    """ Returns the charring rate Bn [mm/min] of the wood species WS for the strength reduction method """
+    return CHARRING_RATE_SR.get(WS, 0.65)
+
+
+def charring_rate_rcs(WS):
+    """ Returns the charring rate Bn [mm/min] of the wood species WS for the reduced cross section method """
+    return CHARRING_RATE_RCS.get(WS, 0.8)
+
+
+def buckling_length_factor(Sup):
+    """ Returns the buckling length factor l0 for the support condition Sup [Default: Simply supported] """
+    return BUCKLING_LENGTH_FACTORS.get(Sup, 1)
+
+
+def moment_coefficient(Sup):
+    """ Returns the coefficient c in Mmax = c*q*L**2 for the support condition Sup [Default: Simply supported] """
+    return MOMENT_COEFFICIENTS.get(Sup, 1/8)
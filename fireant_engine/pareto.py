@@ -0,0 +1,60 @@
+"""
+Removal of dominated profiles ahead of the selection
+
+The profiles are ordered from the smallest to the largest area and the selection takes the first
+passing one. A profile can therefore never be selected if an earlier profile is at least as strong
+for every member length and load, and leaving it out does not change the selected profile, only the
+number of profiles verified. The strength of a profile is described by keys where higher is stronger
+(see column.pareto_front and beam.pareto_front).
+"""
+
+from __future__ import division
+
+# Relative margin by which an earlier profile must be stronger, so rounding never changes the selection
+MARGIN = 1e-9
+
+
+def dominates(a, b, margin=MARGIN):
+    """ True if the keys a are larger than the keys b by the margin in every key """
+    for i in range(len(a)):
+        if not a[i]>b[i]+margin*abs(b[i]):
+            return False
+    return True
+
+
+def front(keys, margin=MARGIN):
+    """ Indices of the profiles that are not dominated by an earlier profile
+
+    Args:
+        keys: Keys of every profile, in the order of the selection
+    Returns:
+        keep: Indices of the remaining profiles, in order
+    """
+    keep = []
+    # Profiles that are not dominated by an earlier one; only those can dominate later profiles
+    best = []
+    for j in range(len(keys)):
+        if len(keys[j])==1:
+            # With one key the strongest earlier profile decides
+            if best and dominates(best[0], keys[j], margin):
+                continue
+            if not best or keys[j][0]>best[0][0]:
+                best = [keys[j]]
+            keep.append(j)
+            continue
+        if any(dominates(k, keys[j], margin) for k in best):
+            continue
+        best.append(keys[j])
+        keep.append(j)
+    return keep
+
+
+def subset(profiles, keep):
+    """ ColumnProfiles or BeamProfiles with only the profiles keep, values shared by all profiles are kept as they are """
+    n = len(profiles.w)
+    fields = []
+    for x in profiles:
+        if isinstance(x, (list, tuple)) and len(x)==n:
+            x = [x[j] for j in keep]
+        fields.append(x)
+    return type(profiles)(*fields)
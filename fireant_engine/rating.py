@@ -0,0 +1,96 @@
+"""
+Standard fire rating (R30, R60, R90, R120) of every profile of a catalogue
+
+For a grid of member lengths and loads, each profile gets the highest rating for which it can
+support the load during a standard fire, 0 if it does not reach the lowest one. With NumPy the
+capacities of all profiles, lengths and ratings are calculated in one array pass (see
+history.capacity_array) and compared with all loads at once.
+
+    method: 'Column-StdFire-SR', 'Column-StdFire-RCS', 'Beam-StdFire-SR' or 'Beam-StdFire-RCS'
+    Length: Lengths of the members [mm]
+    Load: Loads (F [kN] for columns, q [kN/m] for beams)
+"""
+
+from __future__ import division
+
+import csv
+from collections import namedtuple
+
+from . import catalogue, history
+from ._compat import np
+
+
+# Standard fire ratings [minutes]
+RATINGS = (30, 60, 90, 120)
+
+RatingTable = namedtuple('RatingTable', 'Width Height Length Load Rating')
+
+
+def classify(method, Length, Load, Str=1, Sup=1, ToW=1, WS=1, SEF=None, ratings=RATINGS):
+    """ Highest rating of every profile for every length and load
+
+    Returns:
+        RatingTable with Width and Height [mm] of the profiles, Length, Load and
+        Rating[j][a][b], the highest rating [minutes] of profile j for Length[a] and Load[b], 0 if none
+    """
+    member, fire, approach = history.method_parts(method)
+    if fire!='StdFire':
+        raise ValueError('%s is not a standard fire method' % (method,))
+    ratings = sorted(ratings)
+    if np is None:
+        Width = Height = None
+        # Capacity[r][a][j] of profile j for ratings[r] and Length[a]
+        Capacity = []
+        for t in ratings:
+            Capacity.append([])
+            for L in Length:
+                Width, Height, dchar, C = history.capacities(method, L, [t], Str, Sup, ToW, WS, SEF)
+                Capacity[-1].append(C[0])
+        if Width is None:
+            Width, Height, Input = catalogue.profiles(ToW)
+        Rating = []
+        for j in range(len(Width)):
+            Rating.append([])
+            for a in range(len(Length)):
+                row = []
+                for load in Load:
+                    R = 0
+                    for r in range(len(ratings)):
+                        if history.supports(member, Capacity[r][a][j], load):
+                            R = ratings[r]
+                    row.append(R)
+                Rating[-1].append(row)
+        return RatingTable(list(Width), list(Height), list(Length), list(Load), Rating)
+
+    Width, Height, Input = catalogue.profiles(ToW)
+    W = np.asarray(Width, dtype=float)[:, np.newaxis, np.newaxis]
+    H = np.asarray(Height, dtype=float)[:, np.newaxis, np.newaxis]
+    La = np.asarray(Length, dtype=float)[np.newaxis, :, np.newaxis]
+    dchar, t = history.charring_depth(method, ratings, WS)
+    # Capacity with shape (profiles, lengths, ratings)
+    capacity = history.capacity_array(method, La, W, H, dchar[np.newaxis, np.newaxis, :], t[np.newaxis, np.newaxis, :], Str, Sup, ToW, SEF, Input)
+    capacity = capacity[..., np.newaxis]
+    loads = np.asarray(Load, dtype=float)
+    if member=='column':
+        passes = capacity>loads
+    else:
+        passes = (loads>0) & (loads<capacity)
+    # Shape (profiles, lengths, ratings, loads) to the highest passing rating
+    Rating = (passes*np.asarray(ratings)[:, np.newaxis]).max(axis=2)
+    return RatingTable(list(Width), list(Height), list(Length), list(Load), Rating.tolist())
+
+
+def achieving(table, rating, L, load):
+    """ Profiles (Width, Height) reaching at least rating for the length L and load in the table """
+    a = table.Length.index(L)
+    b = table.Load.index(load)
+    return [(table.Width[j], table.Height[j]) for j in range(len(table.Width)) if table.Rating[j][a][b]>=rating]
+
+
+def write_csv(table, path):
+    """ Writes the table as CSV, one row per profile and one column per length and load with the rating R [minutes] """
+    with open(path, 'w') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Width', 'Height']+['L=%g load=%g' % (L, load) for L in table.Length for load in table.Load])
+        for j in range(len(table.Width)):
+            writer.writerow([table.Width[j], table.Height[j]]+[R for row in table.Rating[j] for R in row])
@@ -0,0 +1,188 @@
+"""
+Minimal stand-in for the rhinoscriptsyntax calls used by the FireAnt components
+
+Allows the components and the engine to run outside Rhino/Grasshopper. Curves are
+straight lines given as Line objects or as (start, end) point pairs, and geometry
+is returned as plain Python objects instead of Rhino document objects.
+
+    import fireant_engine.rhino as rs
+    CL = [rs.AddLine((0,0,0), (0,0,3))]
+    rs.CurveLength(CL[0])
+"""
+
+from __future__ import division
+
+import math as m
+
+
+class Point3d(object):
+    """ Point or vector in 3D """
+
+    def __init__(self, x=0, y=0, z=0):
+        self.X = x
+        self.Y = y
+        self.Z = z
+
+    def __iter__(self):
+        return iter((self.X, self.Y, self.Z))
+
+    def __getitem__(self, i):
+        return (self.X, self.Y, self.Z)[i]
+
+    def __len__(self):
+        return 3
+
+    def __add__(self, other):
+        other = point(other)
+        return Point3d(self.X+other.X, self.Y+other.Y, self.Z+other.Z)
+
+    def __sub__(self, other):
+        other = point(other)
+        return Point3d(self.X-other.X, self.Y-other.Y, self.Z-other.Z)
+
+    def __mul__(self, s):
+        return Point3d(self.X*s, self.Y*s, self.Z*s)
+
+    def __eq__(self, other):
+        return tuple(self)==tuple(point(other))
+
+    def __ne__(self, other):
+        return not self==other
+
+    def __repr__(self):
+        return 'Point3d(%r, %r, %r)' % (self.X, self.Y, self.Z)
+
+    @property
+    def Length(self):
+        return m.sqrt(self.X**2+self.Y**2+self.Z**2)
+
+
+class Line(object):
+    """ Straight curve from start to end """
+
+    def __init__(self, start, end):
+        self.start = point(start)
+        self.end = point(end)
+
+    def __repr__(self):
+        return 'Line(%r, %r)' % (self.start, self.end)
+
+
+class Plane(object):
+    """ Plane with origin and axes """
+
+    def __init__(self, origin, xaxis, yaxis, zaxis):
+        self.Origin = origin
+        self.XAxis = xaxis
+        self.YAxis = yaxis
+        self.ZAxis = zaxis
+
+
+class Polyline(object):
+    """ Closed polyline through points """
+
+    def __init__(self, points):
+        self.points = points
+
+    def translate(self, vector):
+        self.points = [p+vector for p in self.points]
+
+
+class Extrusion(object):
+    """ Profile curve extruded along a path """
+
+    def __init__(self, profile, path):
+        self.profile = profile
+        self.path = path
+        self.capped = False
+
+    def translate(self, vector):
+        self.profile.translate(vector)
+
+
+def point(p):
+    """ Converts a point given as Point3d or sequence of 2-3 numbers to Point3d """
+    if isinstance(p, Point3d):
+        return p
+    p = list(p)
+    if len(p)==2:
+        p.append(0)
+    return Point3d(p[0], p[1], p[2])
+
+
+def line(curve):
+    """ Converts a curve given as Line or (start, end) pair to Line """
+    if isinstance(curve, Line):
+        return curve
+    return Line(curve[0], curve[1])
+
+
+def _unit(v):
+    length = v.Length
+    if length==0:
+        raise ValueError('Zero length vector')
+    return v*(1/length)
+
+
+def _cross(a, b):
+    return Point3d(a.Y*b.Z-a.Z*b.Y, a.Z*b.X-a.X*b.Z, a.X*b.Y-a.Y*b.X)
+
+
+def AddLine(start, end):
+    return Line(start, end)
+
+
+def CurveLength(curve):
+    curve = line(curve)
+    return (curve.end-curve.start).Length
+
+
+def CurveStartPoint(curve):
+    return line(curve).start
+
+
+def CurveEndPoint(curve):
+    return line(curve).end
+
+
+def VectorCreate(to_point, from_point):
+    return point(to_point)-point(from_point)
+
+
+def VectorAdd(vector1, vector2):
+    return point(vector1)+point(vector2)
+
+
+def PlaneFromNormal(origin, normal, xaxis=None):
+    zaxis = _unit(point(normal))
+    if xaxis is None:
+        # Any direction perpendicular to the normal
+        if abs(zaxis.Z)<0.9:
+            xaxis = _cross(Point3d(0, 0, 1), zaxis)
+        else:
+            xaxis = _cross(zaxis, Point3d(1, 0, 0))
+    xaxis = _unit(point(xaxis))
+    yaxis = _cross(zaxis, xaxis)
+    return Plane(point(origin), xaxis, yaxis, zaxis)
+
+
+def AddRectangle(plane, width, height):
+    o = plane.Origin
+    x = plane.XAxis*width
+    y = plane.YAxis*height
+    return Polyline([o, o+x, o+x+y, o+y, o])
+
+
+def ExtrudeCurve(curve, path):
+    path = line(path)
+    return Extrusion(curve, path.end-path.start)
+
+
+def MoveObject(object_id, translation):
+    object_id.translate(point(translation))
+    return object_id
+
+
+def CapPlanarHoles(surface_id):
+    surface_id.capped = True
+    return True
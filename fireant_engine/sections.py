@@ -0,0 +1,235 @@
+"""
+Cross section after fire and its section properties
+
+    SEF: Sides Exposed to Fire(1=Width, 2=Height, 3=Width+Height, 4=Width+2*Height, 5=2*Width+Height, 6=2*Width, 7=2*Height, 8=All
+"""
+
+from __future__ import division
+
+import math as m
+
+from . import cache
+from ._compat import where
+
+# Number of residual sections kept per method, one per catalogue, dchar and SEF
+SECTION_CACHE_SIZE = 64
+
+
+def _catalogue(W, H, dchar, SEF):
+    """ Only catalogues are cached, a single user defined profile would just evict one """
+    return len(W)>1
+
+# Number of charred layers taken off the width and the height for each SEF
+CHARRED_LAYERS = {
+    1: (0, 1),
+    2: (1, 0),
+    3: (1, 1),
+    4: (2, 1),
+    5: (1, 2),
+    6: (0, 2),
+    7: (2, 0),
+    8: (2, 2),
+}
+
+
+def sides_exposed(SEF):
+    """ Rounds SEF up to a whole case and limits it to 8 (All) """
+    SEF = int(m.ceil(SEF))
+    if SEF>8:
+        SEF = 8
+    return SEF
+
+
+def minimum_width_factor(SEF):
+    """ Returns the factor a of dchar in the minimum width bmin = a*dchar+80, see minimum_width """
+    return where((SEF==1) | (SEF==2) | (SEF==3) | (SEF==5) | (SEF==6), 1, 2)
+
+
+def minimum_width(dchar, SEF):
+    """ Returns the minimum width bmin [mm] of a column for the strength reduction method
+
+    dchar and SEF can be numbers or NumPy arrays that broadcast together.
+    """
+    a = minimum_width_factor(SEF)
+    return where(dchar < 13, 8.15*dchar, a*dchar+80)
+
+
+def residual_section(W, H, dchar, SEF):
+    """ Cross section after fire, only keeping profiles with a residual section
+
+    Returns:
+        w: Width of the remaining profiles before fire [mm]
+        h: Height of the remaining profiles before fire [mm]
+        Wr: Width of the remaining profiles after fire [mm]
+        Hr: Height of the remaining profiles after fire [mm]
+    """
+    nw, nh = CHARRED_LAYERS[SEF]
+    w = []
+    h = []
+    Wr = []
+    Hr = []
+    for i in range(len(W)):
+        wr = W[i]-nw*dchar
+        hr = H[i]-nh*dchar
+        if wr>0 and hr>0:
+            w.append(W[i])
+            h.append(H[i])
+            Wr.append(wr)
+            Hr.append(hr)
+    return w, h, Wr, Hr
+
+
+def rectangle(Wr, Hr):
+    """ Area Ar [mm2] and moments of inertia Iy, Iz [mm4] of one rectangle, or of NumPy arrays of rectangles """
+    return Wr*Hr, 1/12*Wr*Hr**3, 1/12*Hr*Wr**3
+
+
+def rectangular_properties(Wr, Hr):
+    """ Section properties of rectangular cross sections (reduced cross section method)
+
+    Returns:
+        Ar: Area [mm2]
+        Iy: Moment of inertia y-axis [mm4]
+        Iz: Moment of inertia z-axis [mm4]
+    """
+    Ar = []
+    Iy = []
+    Iz = []
+    for i in range(len(Wr)):
+        A, y, z = rectangle(Wr[i], Hr[i])
+        Ar.append(A)
+        Iy.append(y)
+        Iz.append(z)
+    return Ar, Iy, Iz
+
+
+def corner_properties(r):
+    """ Returns area Acr, moment of inertia Ir and distance to center of gravity sr of 1 rounded corner """
+    Acr = r**2*(1-m.pi/4)
+    Ir = 0.00742*r**4
+    sr = 0.223*r
+    return Acr, Ir, sr
+
+
+def rounded_section(Wr, Hr, r, SEF):
+    """ Section properties of a cross section with corners rounded by the charring depth r (strength reduction method)
+
+    Returns:
+        Ar: Area of cross section with rounded corners [mm2]
+        Iy: Moment of inertia y-axis [mm4]
+        Iz: Moment of inertia z-axis [mm4]
+        Pr: Perimeter [mm]
+    """
+    Acr, Ir, sr = corner_properties(r)
+
+    # Width, Height, 2*Width, 2*Height same calculations
+    if SEF==1 or SEF==2 or SEF==6 or SEF==7:
+        Iytot = 1/12*Wr*Hr**3
+        Iztot = 1/12*Hr*Wr**3
+        Pr = 2*Wr+2*Hr
+        Ar = Wr*Hr
+
+    # Width + Height
+    elif SEF==3:
+        Ar = (Wr*Hr)-Acr
+        Sh = Acr*(Hr/2-sr)
+        drh = Sh/Ar
+        Iysq = 1/12*Wr*(Hr-2*drh)**3+1/12*Wr*(2*drh)**3+Wr*2*drh*(Hr/2)**2
+        Iycr = Ir+Acr*((Hr/2)+drh-sr)**2
+        Iytot = Iysq-Iycr
+        Sw = Acr*(Wr/2-sr)
+        drw = Sw/Ar
+        Izsq = 1/12*Hr*(Wr-2*drh)**3+1/12*Hr*(2*drh)**3+Hr*2*drh*(Wr/2)**2
+        Izcr = Ir+Acr*((Wr/2)+drw-sr)**2
+        Iztot = Izsq-Izcr
+        Pr = Hr+(Hr-r)+Wr+(Wr-r)+(m.pi*r*2)/4
+
+    # Width + 2*Height
+    elif SEF==4:
+        Ar = Wr*Hr-2*Acr
+        S = 2*Acr*(Hr/2-sr)
+        drh = S/Ar
+        Iysq = 1/12*Wr*(Hr-2*drh)**3+1/12*Wr*(2*drh)**3+Wr*2*drh*(Hr/2)**2
+        Iycr = 2*Ir+2*Acr*((Hr/2)+drh-sr)**2
+        Iytot = Iysq-Iycr
+        Izsq = 1/12*Hr*Wr**3
+        Izcr = 2*Ir+2*Acr*((Wr/2)-sr)**2
+        Iztot = Izsq-Izcr
+        Pr = Wr+2*(Hr-r)+(Wr-2*r)+(2*(m.pi*r*2)/4)
+
+    # 2*Width + Height
+    elif SEF==5:
+        Ar = Hr*Wr-2*Acr
+        S = 2*Acr*(Wr/2-sr)
+        drw = S/Ar
+        Iysq = 1/12*Hr*(Wr-2*drw)**3+1/12*Hr*(2*drw)**3+Hr*2*drw*(Wr/2)**2
+        Iycr = 2*Ir+2*Acr*((Wr/2)+drw-sr)**2
+        Iytot = Iysq-Iycr
+        Izsq = 1/12*Wr*Hr**3
+        Izcr = 2*Ir+2*Acr*((Hr/2)-sr)**2
+        Iztot = Izsq-Izcr
+        Pr = Hr+2*(Wr-r)+(Hr-2*r)+(2*(m.pi*r*2)/4)
+
+    # 2*Width + 2*Height
+    elif SEF==8:
+        Ar = Wr*Hr-4*Acr
+        Iytot = 1/12*Wr*Hr**3-r**2*(4-m.pi)*(Hr/2-sr)**2-4*Ir
+        Iztot = 1/12*Hr*Wr**3-r**2*(4-m.pi)*(Wr/2-sr)**2-4*Ir
+        Pr = 2*(Hr-2*r)+2*(Wr-2*r)+m.pi*r*2
+
+    else:
+        raise ValueError('Unknown sides exposed to fire: %r' % (SEF,))
+    return Ar, Iytot, Iztot, Pr
+
+
+def rounded_properties(Wr, Hr, r, SEF):
+    """ Section properties of all residual profiles, see rounded_section
+
+    Returns:
+        Ar, Iy, Iz, Pr: Lists with one value per profile
+    """
+    Ar = []
+    Iy = []
+    Iz = []
+    Pr = []
+    for i in range(len(Wr)):
+        ar, iy, iz, pr = rounded_section(Wr[i], Hr[i], r, SEF)
+        Ar.append(ar)
+        Iy.append(iy)
+        Iz.append(iz)
+        Pr.append(pr)
+    return Ar, Iy, Iz, Pr
+
+
+@cache.memoize(SECTION_CACHE_SIZE, _catalogue)
+def rounded_residual_section(W, H, dchar, SEF):
+    """ Cross section after fire with rounded corners (strength reduction method)
+
+    Profiles where the rounded corners leave no positive area or moments of inertia are left out.
+    The results are cached per catalogue, dchar and SEF and must not be modified.
+
+    Returns:
+        w, h: Width and height of the remaining profiles before fire [mm]
+        Wr, Hr: Width and height of the remaining profiles after fire [mm]
+        Ar, Iy, Iz, Pr: Section properties of the remaining profiles, see rounded_section
+    """
+    w, h, Wr, Hr = residual_section(W, H, dchar, SEF)
+    Ar, Iy, Iz, Pr = rounded_properties(Wr, Hr, dchar, SEF)
+    keep = [i for i in range(len(Wr)) if Ar[i]>0 and Iy[i]>0 and Iz[i]>0]
+    return tuple(tuple(x[i] for i in keep) for x in (w, h, Wr, Hr, Ar, Iy, Iz, Pr))
+
+
+@cache.memoize(SECTION_CACHE_SIZE, _catalogue)
+def rectangular_residual_section(W, H, dchar, SEF):
+    """ Cross section after fire without rounded corners (reduced cross section method)
+
+    The results are cached per catalogue, dchar and SEF and must not be modified.
+
+    Returns:
+        w, h: Width and height of the remaining profiles before fire [mm]
+        Wr, Hr: Width and height of the remaining profiles after fire [mm]
+        Ar, Iy, Iz: Section properties of the remaining profiles, see rectangular_properties
+    """
+    w, h, Wr, Hr = residual_section(W, H, dchar, SEF)
+    Ar, Iy, Iz = rectangular_properties(Wr, Hr)
+    return tuple(tuple(x) for x in (w, h, Wr, Hr, Ar, Iy, Iz))
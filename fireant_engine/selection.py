@@ -0,0 +1,167 @@
+"""
+Search for the smallest profile that passes the verification
+
+The profiles are ordered from the smallest to the largest area, so the selected profile
+is the first one that passes. Instead of verifying the whole catalogue for every member,
+the search stops as soon as it has found it.
+
+    search: 'walk' verifies the profiles in order and stops at the first passing one
+            'bisect' uses binary search within each family of profiles with the same width.
+            This assumes that a profile passes whenever a smaller profile of the same width
+            passes, which holds for the beam and column verifications.
+            'staircase' walks the frontier of passing profiles over the width x height grid, from the
+            widest width up from the bottom and one width at a time, in O(widths + heights) verifications.
+            This assumes that a profile passes whenever a profile that is not wider and not higher passes.
+
+What a search needs of the profiles (the families of bisect, the Grid of staircase) does not
+depend on the member, so it is computed once with prepare and shared by all members.
+"""
+
+from __future__ import division
+
+import bisect as _bisect
+
+WALK = 'walk'
+BISECT = 'bisect'
+STAIRCASE = 'staircase'
+
+
+def walk(n, passing):
+    """ First passing profile, verifying the profiles in order
+
+    Args:
+        n: Number of profiles
+        passing: Function returning True if profile j can support the load
+    Returns:
+        j: Index of the first passing profile, -1 if no profile passes
+        Evaluated: Number of profiles verified
+    """
+    for j in range(n):
+        if passing(j):
+            return j, j+1
+    return -1, n
+
+
+def families(w):
+    """ Groups the profile indices by width, each group ordered from the smallest to the largest area """
+    groups = {}
+    order = []
+    for j in range(len(w)):
+        if w[j] not in groups:
+            groups[w[j]] = []
+            order.append(w[j])
+        groups[w[j]].append(j)
+    return [groups[x] for x in order]
+
+
+def bisect(w, passing, groups=None):
+    """ First passing profile, using binary search within each family of profiles with the same width
+
+    Args:
+        w: Width of each profile [mm]
+        passing: Function returning True if profile j can support the load
+        groups: families(w), if already computed
+    Returns:
+        j: Index of the first passing profile, -1 if no profile passes
+        Evaluated: Number of profiles verified
+    """
+    checked = {}
+    best = -1
+    for family in groups if groups is not None else families(w):
+        # Only profiles smaller than the best one found so far can change the result
+        if best>=0:
+            family = [j for j in family if j<best]
+        lo = 0
+        hi = len(family)
+        while lo<hi:
+            mid = (lo+hi)//2
+            j = family[mid]
+            if j not in checked:
+                checked[j] = passing(j)
+            if checked[j]:
+                hi = mid
+            else:
+                lo = mid+1
+        if lo<len(family):
+            best = family[lo]
+    return best, len(checked)
+
+
+class Grid(object):
+    """ Profiles w, h [mm] grouped by width for staircase, from the widest to the narrowest width
+
+    Args:
+        w: Width of each profile [mm]
+        h: Height of each profile [mm]
+    Attributes:
+        families: List of (indices, heights) for each width, ordered by height
+    """
+
+    def __init__(self, w, h):
+        self.families = []
+        for family in sorted(families(w), key=lambda f: -w[f[0]]):
+            family = sorted(family, key=lambda j: (h[j], j))
+            self.families.append((family, [h[j] for j in family]))
+
+    def __repr__(self):
+        return 'Grid(%d widths)' % (len(self.families),)
+
+
+def staircase(w, h, passing, grid=None):
+    """ First passing profile, walking the frontier of the lowest passing profile of each width
+
+    The lowest passing height can only rise as the width falls, so each width starts just above the
+    highest profile that failed for a wider width and steps up until a profile passes. The profiles
+    are ordered by area, so a width stops as soon as its profiles are larger than the best one found.
+
+    Args:
+        w: Width of each profile [mm]
+        h: Height of each profile [mm]
+        passing: Function returning True if profile j can support the load
+        grid: Grid(w, h), if already computed
+    Returns:
+        j: Index of the first passing profile, -1 if no profile passes
+        Evaluated: Number of profiles verified
+    """
+    if grid is None:
+        grid = Grid(w, h)
+    best = -1
+    evaluated = 0
+    hfail = float('-inf')
+    for family, heights in grid.families:
+        k = _bisect.bisect_right(heights, hfail)
+        while k<len(family):
+            j = family[k]
+            if best>=0 and j>best:
+                break
+            evaluated += 1
+            if passing(j):
+                best = j
+                break
+            hfail = heights[k]
+            k += 1
+    return best, evaluated
+
+
+def prepare(method, w, h=None):
+    """ What the search method needs of the profiles w, h, shared by all members, see search """
+    if method==BISECT:
+        return families(w)
+    if method==STAIRCASE:
+        return Grid(w, h)
+    return None
+
+
+def search(method, w, passing, h=None, prepared=None):
+    """ First passing profile using the search method 'walk', 'bisect' or 'staircase' (requires h), see walk, bisect and staircase
+
+    Args:
+        prepared: prepare(method, w, h), computed once for many members
+    """
+    if method==WALK:
+        return walk(len(w), passing)
+    if method==BISECT:
+        return bisect(w, passing, prepared)
+    if method==STAIRCASE:
+        return staircase(w, h, passing, prepared)
+    raise ValueError('Unknown search method: %r' % (method,))
@@ -0,0 +1,173 @@
+"""
+Span tables for beams, calculated offline and looked up at runtime
+
+For every profile of a catalogue and every scenario (strength class, SEF, support and time of
+exposure) the table holds the maximum span [mm] for a range of line loads. A beam passes when
+sigmafire < fm, so from sigmafire = c*q*L**2/Iy*Hr/2*FStr the maximum span is
+
+    Lmax = sqrt(fm*2*Iy/(c*q*Hr*FStr))
+
+which is linear in log-log. Spans between the loads of the table are therefore interpolated
+in log-log, which is exact up to rounding (relative error below 1e-12). The table is stored
+as gzip compressed JSON, which can be read without NumPy (in Rhino/Grasshopper).
+
+Build a table from the command line:
+
+    python -m fireant_engine.spantable spans.json.gz --ToW 3 --Str 1 5 --SEF 4 8 --Sup 1 --t 30 60 --loads 1 2 5 10 20
+    python -m fireant_engine.spantable param.json.gz --method Beam-ParamFire-SR --O 0.06 --qf 600 --t 30 60
+
+and look it up:
+
+    from fireant_engine import spantable
+    table = spantable.load('spans.json.gz')
+    table.smallest(L=5000, q=8.0, Str=1, SEF=4, Sup=1, t=60)
+"""
+
+from __future__ import division
+
+import argparse
+import bisect
+import gzip
+import json
+import math as m
+
+from . import batch, beam, capacity, catalogue, history
+
+METHODS = ('Beam-StdFire-SR', 'Beam-StdFire-RCS', 'Beam-ParamFire-SR')
+
+
+def maximum_spans(method, loads, Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4, O=0.04, qf=400, Ti=1160):
+    """ Maximum span [mm] of every profile for every line load [kN/m], 0 for profiles not verified by the method
+
+    O, qf and Ti are only used by the parametric fire.
+
+    Returns:
+        Width, Height: Profiles [mm], ordered from the smallest to the largest area
+        Span: Span[j][k] of profile j for loads[k]
+    """
+    if method not in METHODS:
+        raise ValueError('Unknown beam method: %r' % (method,))
+    options = {}
+    if method=='Beam-ParamFire-SR':
+        options = {'O': O, 'qf': qf, 'Ti': Ti}
+    W, H, Input = catalogue.profiles(ToW)
+    profiles = batch.profiles_function(method)(Str=Str, Sup=Sup, ToW=ToW, WS=WS, t=t, SEF=SEF, **options)
+    # The capacity at L=1 is fm*2*Iy/(c*Hr*FStr)
+    X = history.scatter(W, H, profiles.w, profiles.h, beam.capacity_index(1, profiles).capacity)
+    Span = [[m.sqrt(x/q) for q in loads] for x in X]
+    return list(W), list(H), Span
+
+
+def build(method='Beam-StdFire-SR', loads=(1, 2, 5, 10, 20), Str=(1,), SEF=(4,), Sup=(1,), t=(30, 60), ToW=1, WS=1, O=0.04, qf=400, Ti=1160):
+    """ Returns a SpanTable for all combinations of the strength classes, SEF, supports and times of exposure given
+
+    O, qf and Ti of the parametric fire are stored in the table with the other inputs.
+    """
+    loads = sorted(loads)
+    if not loads or loads[0]<=0:
+        raise ValueError('The loads of a span table must be positive')
+    data = {'method': method, 'ToW': ToW, 'WS': WS, 'loads': loads, 'scenarios': []}
+    if method=='Beam-ParamFire-SR':
+        data.update(O=O, qf=qf, Ti=Ti)
+    for s in Str:
+        for e in SEF:
+            for p in Sup:
+                for time in t:
+                    Width, Height, Span = maximum_spans(method, loads, s, p, ToW, WS, time, e, O, qf, Ti)
+                    data['Width'] = Width
+                    data['Height'] = Height
+                    data['scenarios'].append({'Str': s, 'SEF': e, 'Sup': p, 't': time, 'Span': Span})
+    return SpanTable(data)
+
+
+class SpanTable(object):
+    """ Maximum spans of the profiles of a catalogue for a range of line loads and scenarios, see build
+
+    Args:
+        data: Dictionary with method, ToW, WS, (O, qf, Ti for a parametric fire,) loads, Width, Height and scenarios,
+              each with Str, SEF, Sup, t and Span[j][k] of profile j for loads[k]
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.loads = data['loads']
+        self.Width = data['Width']
+        self.Height = data['Height']
+        self._scenarios = {}
+        for s in data['scenarios']:
+            # Lmax*sqrt(q) is the same for every load, so one CapacityIndex answers all spans and loads
+            K = [S[0]*m.sqrt(self.loads[0]) for S in s['Span']]
+            self._scenarios[(s['Str'], s['SEF'], s['Sup'], s['t'])] = (s['Span'], capacity.CapacityIndex(K))
+
+    def __len__(self):
+        return len(self._scenarios)
+
+    def _scenario(self, Str, SEF, Sup, t):
+        key = (Str, SEF, Sup, t)
+        if key not in self._scenarios:
+            raise ValueError('Scenario not in the span table: Str=%r, SEF=%r, Sup=%r, t=%r' % key)
+        return self._scenarios[key]
+
+    def span(self, q, Str=1, SEF=4, Sup=1, t=60):
+        """ Maximum span [mm] of every profile for the line load q [kN/m], interpolated in log-log """
+        Span, index = self._scenario(Str, SEF, Sup, t)
+        loads = self.loads
+        if len(loads)==1:
+            return [S[0]*m.sqrt(loads[0]/q) for S in Span]
+        # Interpolates between the two loads around q, or extrapolates from the first or last two
+        k = min(max(bisect.bisect_left(loads, q), 1), len(loads)-1)
+        q0 = loads[k-1]
+        q1 = loads[k]
+        f = m.log(q/q0)/m.log(q1/q0)
+        return [S[k-1]**(1-f)*S[k]**f if S[k-1]>0 else 0.0 for S in Span]
+
+    def smallest(self, L, q, Str=1, SEF=4, Sup=1, t=60):
+        """ Smallest profile (Width, Height) [mm] with a maximum span larger than L [mm] for the line load q [kN/m], None if there is none """
+        Span, index = self._scenario(Str, SEF, Sup, t)
+        if q<=0:
+            return None
+        j = index.smallest(L*m.sqrt(q))
+        if j<0:
+            return None
+        return self.Width[j], self.Height[j]
+
+    def save(self, path):
+        """ Writes the table to path as gzip compressed JSON """
+        f = gzip.open(path, 'wb')
+        try:
+            f.write(json.dumps(self.data, separators=(',', ':')).encode('utf-8'))
+        finally:
+            f.close()
+
+
+def load(path):
+    """ Reads a SpanTable written by SpanTable.save """
+    f = gzip.open(path, 'rb')
+    try:
+        return SpanTable(json.loads(f.read().decode('utf-8')))
+    finally:
+        f.close()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Calculate a span table for beams in fire')
+    parser.add_argument('path', help='Output file (gzip compressed JSON)')
+    parser.add_argument('--method', default='Beam-StdFire-SR', choices=METHODS)
+    parser.add_argument('--ToW', type=int, default=1, help='Type of Wood; 1=Sawn, 2=Planed or 3=Glulam')
+    parser.add_argument('--WS', type=int, default=1, help='Wood Species')
+    parser.add_argument('--Str', type=int, nargs='+', default=[1], help='Strength classes')
+    parser.add_argument('--SEF', type=int, nargs='+', default=[4], help='Sides Exposed to Fire')
+    parser.add_argument('--Sup', type=int, nargs='+', default=[1], help='Support conditions')
+    parser.add_argument('--t', type=float, nargs='+', default=[30, 60], help='Times of exposure [minutes]')
+    parser.add_argument('--loads', type=float, nargs='+', default=[1, 2, 5, 10, 20], help='Line loads [kN/m]')
+    parser.add_argument('--O', type=float, default=0.04, help='Opening factor [m1/2] of the parametric fire')
+    parser.add_argument('--qf', type=float, default=400, help='Fireload [MJ/m2] of the parametric fire')
+    parser.add_argument('--Ti', type=float, default=1160, help='Thermal inertia [Ws1/2/m2/K] of the parametric fire')
+    args = parser.parse_args(args)
+    table = build(args.method, args.loads, args.Str, args.SEF, args.Sup, args.t, args.ToW, args.WS, args.O, args.qf, args.Ti)
+    table.save(args.path)
+    print('%d scenarios x %d profiles x %d loads written to %s' % (len(table), len(table.Width), len(table.loads), args.path))
+
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Design of the same members for every combination of strength class, wood species, SEF, support and time
+
+The combinations share their intermediate stages instead of running the design function for each:
+the charring depth is calculated once per wood species and time, the residual sections once per
+charring depth and SEF (see sections), the profiles once per strength class on top of those and
+adapted to each support, and the capacity of the catalogue once per member length (see capacity).
+
+    from fireant_engine import sweep
+    cube = sweep.sweep('Column-StdFire-SR', L=[3000, 4500], load=[150, 200], Str=range(1, 8), SEF=range(1, 9), t=[30, 60, 90], ToW=3)
+    cube.Width[Str][WS][SEF][Sup][t][member]
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of the members [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import batch, history, materials
+
+# Axes of the result, in the order of the indices
+AXES = ('Str', 'WS', 'SEF', 'Sup', 't')
+
+# Axes: (name, values) of each axis
+# Width, Height [mm], Capacity (NRcfire [kN] for columns, qmax [kN/m] for beams) and Utilization [%]:
+#   nested lists indexed [Str][WS][SEF][Sup][t][member], None if no profile can support the load
+SweepResult = namedtuple('SweepResult', 'Axes Width Height Capacity Utilization ErrorMessage')
+
+
+def _values(x):
+    if hasattr(x, '__iter__'):
+        return tuple(x)
+    return (x,)
+
+
+def _cube(shape):
+    if len(shape)==1:
+        return [None]*shape[0]
+    return [_cube(shape[1:]) for i in range(shape[0])]
+
+
+def sweep(method, L, load, Str=(1,), WS=(1,), SEF=None, Sup=(1,), t=(60,), ToW=1, O=0.04, qf=400, Ti=1160):
+    """ Smallest profile of every member for every combination of Str, WS, SEF, Sup and t
+
+    Args:
+        Str, WS, SEF, Sup, t: Values of each axis, a single value or a list [Default SEF: 8 for columns, 4 for beams]
+        Other inputs: see the design function of the method
+    Returns:
+        SweepResult, the results of the design function of the method for each combination
+    """
+    member, fire, approach = history.method_parts(method)
+    if SEF is None:
+        SEF = history.DEFAULT_SEF[member]
+    values = [_values(x) for x in (Str, WS, SEF, Sup, t)]
+    module = batch.MODULES[member]
+    profiles_function = batch.profiles_function(method)
+    options = {}
+    if fire=='ParamFire':
+        options = {'O': O, 'qf': qf, 'Ti': Ti}
+
+    shape = [len(v) for v in values]
+    Width = _cube(shape)
+    Height = _cube(shape)
+    Capacity = _cube(shape)
+    Utilization = _cube(shape)
+    ErrorMessage = None
+    # The residual sections depend on WS, t and SEF, so those are the outer loops
+    for b, ws in enumerate(values[1]):
+        for e, sef in enumerate(values[2]):
+            for d, time in enumerate(values[4]):
+                for a, s in enumerate(values[0]):
+                    profiles = profiles_function(Str=s, ToW=ToW, WS=ws, t=time, SEF=sef, front=True, **options)
+                    for c, p in enumerate(values[3]):
+                        # Only the buckling length factor or moment coefficient depends on the support
+                        if member=='column':
+                            profiles = profiles._replace(l0=materials.buckling_length_factor(p))
+                        else:
+                            profiles = profiles._replace(c=materials.moment_coefficient(p))
+                        result = module.select_load_cases(L, [load], profiles)[0]
+                        ErrorMessage = ErrorMessage or result.ErrorMessage
+                        Width[a][b][e][c][d] = result.Width
+                        Height[a][b][e][c][d] = result.Height
+                        # NRcfire or qmax
+                        Capacity[a][b][e][c][d] = result[0]
+                        Utilization[a][b][e][c][d] = result.Utilization
+    return SweepResult(list(zip(AXES, values)), Width, Height, Capacity, Utilization, ErrorMessage)
@@ -0,0 +1,250 @@
+"""
+NumPy kernels evaluating a whole catalogue of profiles for many members in one pass
+
+Rows are members and columns are profiles. The kernels give the same results as
+the scalar functions in column and beam. NumPy is not available in IronPython
+(Rhino/Grasshopper), where the engine falls back to the scalar functions.
+"""
+
+from __future__ import division
+
+import math as m
+
+import numpy as np
+
+
+def buckling_capacity(ls, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Characteristic resistance NRcfire [kN], element by element for arrays of the same shape (or broadcastable)
+
+    Args:
+        see column.buckling_capacity
+    Returns:
+        NRcfire: Array, 0 for sections without a valid residual section
+    """
+    ls = np.asarray(ls, dtype=float)
+    Ar = np.asarray(Ar, dtype=float)
+    I = np.asarray(I, dtype=float)
+    CStr = np.asarray(CStr, dtype=float)
+    EStr = np.asarray(EStr, dtype=float)
+    valid = (Ar>0) & (I>0) & (CStr>0) & (EStr>0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        #Slenderness ratio
+        Lambda = ls/np.sqrt(I/Ar)
+        #Euler stress
+        SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+        #Relative slenderness ratio
+        Lambdarel = Lambda/np.sqrt(SigmaE)
+        #kfire coefficient
+        kfire = 0.5*(1+Bc*(Lambdarel-0.5)+Lambdarel*Lambdarel)
+        #Critical buckling factor
+        kc = np.where(Lambdarel<0.5, 1.0, 1/(kfire+np.sqrt(kfire*kfire-Lambdarel*Lambdarel)))
+        #Characteristic resistance of wood
+        NRcfire = Ar*fc*kc/1000
+    return np.where(valid, NRcfire, 0.0)
+
+
+def capacity_bounds(ls, Ar, I, fc, E, Bc, CStr=1, EStr=1, margin=1e-9):
+    """ Lower and upper bounds of NRcfire [kN] without square roots, element by element, see column.capacity_bounds
+
+    Returns:
+        lower, upper: Arrays with the bounds
+        valid: Array, False for sections without a valid residual section, where the bounds do not apply
+    """
+    ls = np.asarray(ls, dtype=float)
+    Ar = np.asarray(Ar, dtype=float)
+    I = np.asarray(I, dtype=float)
+    CStr = np.asarray(CStr, dtype=float)
+    EStr = np.asarray(EStr, dtype=float)
+    valid = (Ar>0) & (I>0) & (CStr>0) & (EStr>0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upper = Ar*fc/1000
+        SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+        Lambdarel2 = ls*ls*Ar/(I*SigmaE)
+        k = 0.5*(1+(1+0.5*Bc)*Lambdarel2)
+        lower = np.where(Lambdarel2<0.25*(1-margin), upper, upper/(2*k-Lambdarel2/(2*k)))*(1-margin)
+    return lower, upper, valid
+
+
+def buckling_length(F, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Critical buckling length ls at which NRcfire drops to F [kN], element by element, see column.buckling_length
+
+    Returns:
+        Array, nan if the section cannot support F at any length and inf if it supports F at every length
+    """
+    Ar = np.asarray(Ar, dtype=float)
+    I = np.asarray(I, dtype=float)
+    CStr = np.asarray(CStr, dtype=float)
+    EStr = np.asarray(EStr, dtype=float)
+    valid = (Ar>0) & (I>0) & (CStr>0) & (EStr>0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kc = F*1000/(Ar*fc)
+        a = 1-kc
+        c = 1/kc-1+0.5*Bc
+        Lambdarel = (-Bc+np.sqrt(Bc*Bc+4*a*c))/(2*a)
+        SigmaE = m.pi**2*((E*EStr)/(fc*CStr))
+        ls = Lambdarel*np.sqrt(SigmaE)*np.sqrt(I/Ar)
+    ls = np.where(kc<1, ls, np.nan)
+    if F<=0:
+        ls = np.full(ls.shape, np.inf)
+    return np.where(valid, ls, np.nan)
+
+
+def column_capacity(ls, Ar, I, fc, E, Bc, CStr=1, EStr=1):
+    """ Characteristic resistance NRcfire [kN] for every buckling length and profile
+
+    Args:
+        ls: Critical buckling length of each member
+        Ar: Area of the residual cross section of each profile [mm2]
+        I: Moment of inertia about the weakest axis of each profile [mm4]
+        fc: Compression strength [MPa]
+        E: Modulus of elasticity [MPa]
+        Bc: Straightness factor
+        CStr: Reduction factor for compression strength of each profile
+        EStr: Reduction factor for modulus of elasticity of each profile
+    Returns:
+        NRcfire: Array with shape (members, profiles), 0 for profiles without a valid residual section
+    """
+    ls = np.asarray(ls, dtype=float)[:, np.newaxis]
+    Ar = np.asarray(Ar, dtype=float)
+    CStr = np.broadcast_to(np.asarray(CStr, dtype=float), Ar.shape)
+    EStr = np.broadcast_to(np.asarray(EStr, dtype=float), Ar.shape)
+    return buckling_capacity(ls, Ar, I, fc, E, Bc, CStr, EStr)
+
+
+def bending_stress(L, q, Iy, Hr, c, FStr=1):
+    """ Bending stress sigmafire [MPa] for every beam and profile, see beam.bending_stress
+
+    Args:
+        L: Length of each member [mm]
+        q: Line load of each member [kN/m]
+        Iy: Moment of inertia y-axis of each profile [mm4]
+        Hr: Height of each profile after fire [mm]
+        c: Moment coefficient for the support condition, Mmax = c*q*L**2
+        FStr: Reduction factor for flexural strength of each profile
+    Returns:
+        sigmafire: Array with shape (members, profiles)
+    """
+    L = np.asarray(L, dtype=float)[:, np.newaxis]
+    q = np.asarray(q, dtype=float)[:, np.newaxis]
+    return section_stress(L, q, Iy, Hr, c, FStr)
+
+
+def section_stress(L, q, Iy, Hr, c, FStr=1):
+    """ Bending stress sigmafire [MPa], element by element for arrays of the same shape (or broadcastable), see bending_stress """
+    L = np.asarray(L, dtype=float)
+    q = np.asarray(q, dtype=float)
+    Iy = np.asarray(Iy, dtype=float)
+    Hr = np.asarray(Hr, dtype=float)
+    FStr = np.asarray(FStr, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Mmax = c*q*(L*L)
+        return Mmax/Iy*Hr/2*FStr
+
+
+def bending_capacity(L, Iy, Hr, fm, c, FStr=1):
+    """ Line load [kN/m] at which sigmafire reaches fm, element by element, see beam.bending_capacity
+
+    Returns:
+        Array, 0 for sections without a valid residual section
+    """
+    L = np.asarray(L, dtype=float)
+    Iy = np.asarray(Iy, dtype=float)
+    Hr = np.asarray(Hr, dtype=float)
+    FStr = np.asarray(FStr, dtype=float)
+    valid = (Iy>0) & (Hr>0) & (FStr>0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q = (fm*2*Iy)/(c*(L*L)*Hr*FStr)
+    return np.where(valid, q, 0.0)
+
+
+def exceeds(values, limits):
+    """ Boolean array with values[i, j] > limits[i] """
+    return np.asarray(values)>np.asarray(limits, dtype=float)[:, np.newaxis]
+
+
+def first_passing(passes):
+    """ Index of the first passing profile of each member, -1 if no profile passes
+
+    Args:
+        passes: Boolean array with shape (members, profiles)
+    """
+    passes = np.asarray(passes, dtype=bool)
+    if passes.shape[1]==0:
+        return np.full(passes.shape[0], -1, dtype=int)
+    index = passes.argmax(axis=1)
+    index[~passes.any(axis=1)] = -1
+    return index
+
+
+# Number of profiles verified at a time by walk
+BLOCK = 32
+
+
+def walk(evaluate, members, n, block=BLOCK):
+    """ First passing profile of each member, verifying the profiles in blocks and stopping each member at its first passing profile
+
+    Args:
+        evaluate: Function (rows, start, stop) returning a boolean array with shape (len(rows), stop-start) telling if the profiles start:stop can support the load of the members rows
+        members: Number of members
+        n: Number of profiles
+        block: Number of profiles verified at a time
+    Returns:
+        index: Index of the first passing profile of each member, -1 if no profile passes
+        Evaluated: Number of profiles verified for each member, up to its first passing profile like selection.walk
+    """
+    index = np.full(members, -1, dtype=int)
+    Evaluated = np.full(members, n, dtype=int)
+    rows = np.arange(members)
+    for start in range(0, n, block):
+        if len(rows)==0:
+            break
+        stop = min(start+block, n)
+        first = first_passing(evaluate(rows, start, stop))
+        found = first>=0
+        index[rows[found]] = start+first[found]
+        Evaluated[rows[found]] = start+first[found]+1
+        rows = rows[~found]
+    return index, Evaluated
+
+
+def staircase(check, members, grid):
+    """ First passing profile of each member like selection.staircase, moving all members up one width at a time
+
+    Args:
+        check: Function (rows, j) returning a boolean array telling if profile j[i] can support the load of member rows[i]
+        members: Number of members
+        grid: selection.Grid of the profiles
+    Returns:
+        index: Index of the first passing profile of each member, -1 if no profile passes
+        Evaluated: Number of profiles verified for each member, like selection.staircase
+    """
+    index = np.full(members, -1, dtype=int)
+    Evaluated = np.zeros(members, dtype=int)
+    # Height of the highest profile failing for a wider width
+    hfail = np.full(members, -np.inf)
+    for family, heights in grid.families:
+        family = np.asarray(family, dtype=int)
+        heights = np.asarray(heights, dtype=float)
+        rows = np.arange(members)
+        k = np.searchsorted(heights, hfail, side='right')
+        while len(rows):
+            keep = k<len(family)
+            rows = rows[keep]
+            k = k[keep]
+            j = family[k]
+            # Profiles larger than the best one found cannot change the result
+            keep = (index[rows]<0) | (j<index[rows])
+            rows = rows[keep]
+            k = k[keep]
+            j = j[keep]
+            if not len(rows):
+                break
+            Evaluated[rows] += 1
+            passes = check(rows, j)
+            index[rows[passes]] = j[passes]
+            rows = rows[~passes]
+            k = k[~passes]
+            hfail[rows] = heights[k]
+            k = k+1
+    return index, Evaluated
@@ -0,0 +1,136 @@
+"""
+Verification of given sections, e.g. the inventory of an existing building
+
+Every member has its own section, length, load and exposure, and is only verified: no profile
+is selected. With NumPy the members are calculated as arrays, one array pass for each combination
+of Str, Sup, WS and SEF in the table, and large tables are read and verified one chunk at a time
+with stream. The sections are verified as user defined profiles (WidthProfile, HeightProfile).
+
+    from fireant_engine import verify
+    result = verify.verify('Column-StdFire-SR', L=[3000, 4500], load=[150, 200], Width=[140, 185], Height=[315, 360], t=[60, 30], SEF=[8, 4])
+    result.Capacity, result.Utilization, result.Passes
+
+    for result in verify.stream('Column-StdFire-SR', csv.DictReader(open('inventory.csv')), chunksize=10000):
+        ...
+
+    method: Name of the FireAnt component, see batch.METHODS
+    L: Length of each member [mm]
+    load: Load of each member (F [kN] for columns, q [kN/m] for beams)
+    Width, Height: Section of each member [mm]
+    Str, Sup, WS, t, SEF: A value for all members or one per member, see the design function of the method
+"""
+
+from __future__ import division
+
+from collections import namedtuple
+
+from . import batch, history
+from ._compat import np
+
+
+# Capacity (NRcfire [kN] for columns, the line load at which sigmafire reaches fm [kN/m] for beams),
+# Utilization [%] (inf for sections without capacity) and Passes, True if the section supports the load.
+# Arrays with NumPy, lists otherwise
+Verification = namedtuple('Verification', 'Capacity Utilization Passes')
+
+# Inputs that can be given per member, with the names of the columns read by stream
+INPUTS = ('Str', 'Sup', 'WS', 't', 'SEF')
+
+
+def _value(x, i):
+    if hasattr(x, '__len__'):
+        return x[i]
+    return x
+
+
+def verify(method, L, load, Width, Height, Str=1, Sup=1, WS=1, t=60, SEF=None, O=0.04, qf=400, Ti=1160):
+    """ Capacity and utilization of the section of every member and whether it supports the load
+
+    Returns:
+        Verification with one value per member
+    """
+    member, fire, approach = history.method_parts(method)
+    if SEF is None:
+        SEF = history.DEFAULT_SEF[member]
+    if np is None:
+        Capacity = []
+        Utilization = []
+        Passes = []
+        for i in range(len(L)):
+            C = 0.0
+            if Width[i]>0 and Height[i]>0:
+                C = history.capacities(method, L[i], [_value(t, i)], _value(Str, i), _value(Sup, i), 1, _value(WS, i), _value(SEF, i),
+                                       O, qf, Ti, Width[i], Height[i])[3][0][0]
+            Capacity.append(C)
+            Utilization.append(load[i]/C*100 if C>0 else float('inf'))
+            Passes.append(history.supports(member, C, load[i]))
+        return Verification(Capacity, Utilization, Passes)
+
+    La = np.asarray(L, dtype=float)
+    loads = np.asarray(load, dtype=float)
+    W = np.asarray(Width, dtype=float)
+    H = np.asarray(Height, dtype=float)
+    n = len(La)
+    ta = np.broadcast_to(np.asarray(t, dtype=float), (n,))
+    keys = np.stack([np.broadcast_to(np.asarray(x), (n,)) for x in (Str, Sup, WS, SEF)], axis=1)
+    capacity = np.zeros(n)
+    # Members with the same Str, Sup, WS and SEF are calculated together
+    for key in np.unique(keys, axis=0).tolist():
+        rows = (keys==key).all(axis=1)
+        s, p, ws, sef = key
+        dchar, te = history.charring_depth(method, ta[rows], ws, O, qf, Ti)
+        capacity[rows] = history.capacity_array(method, La[rows], W[rows], H[rows], dchar, te, s, p, 1, sef, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        utilization = np.where(capacity>0, loads/capacity*100, np.inf)
+    if member=='column':
+        passes = capacity>loads
+    else:
+        passes = (loads>0) & (loads<capacity)
+    return Verification(capacity, utilization, passes)
+
+
+def stream(method, rows, chunksize=batch.CHUNKSIZE, O=0.04, qf=400, Ti=1160, **defaults):
+    """ verify for a table of members read one chunk at a time
+
+    Args:
+        rows: Iterable of members, dictionaries with L, the load (F or q), Width, Height and optionally
+              Str, Sup, WS, t and SEF, e.g. a csv.DictReader
+        defaults: Inputs used for members that do not give them, e.g. t=60
+    Returns:
+        Generator of a Verification for each chunk of chunksize members, in the order of the table
+    """
+    member, fire, approach = history.method_parts(method)
+    name = batch.design_function(method)[1]
+    defaults.setdefault('Str', 1)
+    defaults.setdefault('Sup', 1)
+    defaults.setdefault('WS', 1)
+    defaults.setdefault('t', 60)
+    defaults.setdefault('SEF', history.DEFAULT_SEF[member])
+    columns = ('L', name, 'Width', 'Height')+INPUTS
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk)==chunksize:
+            yield _verify_chunk(method, chunk, columns, defaults, O, qf, Ti)
+            chunk = []
+    if chunk:
+        yield _verify_chunk(method, chunk, columns, defaults, O, qf, Ti)
+
+
+def _number(row, column, defaults):
+    value = row.get(column)
+    if value is None or value=='':
+        value = defaults.get(column)
+    if value is None:
+        raise ValueError('Member without %s: %r' % (column, row))
+    return float(value)
+
+
+def _verify_chunk(method, chunk, columns, defaults, O, qf, Ti):
+    values = []
+    for c in columns:
+        if np is None:
+            values.append([_number(row, c, defaults) for row in chunk])
+        else:
+            values.append(np.fromiter((_number(row, c, defaults) for row in chunk), float, len(chunk)))
+    return verify(method, *values, O=O, qf=qf, Ti=Ti)
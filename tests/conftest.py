@@ -0,0 +1,61 @@
+from __future__ import division
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fireant_engine import batch, beam, capacity, column, exposure, governing, history, rating, verify  # noqa: E402
+
+COLUMN_METHODS = ('Column-StdFire-SR', 'Column-StdFire-RCS', 'Column-ParamFire-SR')
+BEAM_METHODS = ('Beam-StdFire-SR', 'Beam-StdFire-RCS', 'Beam-ParamFire-SR')
+METHODS = COLUMN_METHODS+BEAM_METHODS
+
+
+def scenarios(method, n, seed=1):
+    """ n random scenarios of the method, each with member lengths [mm] and loads """
+    rnd = random.Random(seed)
+    member = batch.METHODS[method][0]
+    result = []
+    for k in range(n):
+        scenario = dict(Str=rnd.randint(1, 7), Sup=rnd.randint(1, 4), ToW=rnd.randint(1, 3), WS=rnd.randint(1, 3),
+                        t=rnd.choice([0, 10, 15, 30, 45, 60, 90]), SEF=rnd.randint(1, 8))
+        if 'ParamFire' in method:
+            scenario.update(O=rnd.choice([0.02, 0.04, 0.1]), qf=rnd.choice([200, 400, 800]), Ti=rnd.choice([800, 1160, 1500]))
+        L = [rnd.uniform(1000, 8000) for i in range(12)]
+        if member=='column':
+            load = [rnd.uniform(1, 600) for i in L]
+        else:
+            load = [rnd.uniform(0.5, 30) for i in L]
+        result.append((L, load, scenario))
+    return result
+
+
+@pytest.fixture
+def scalar(monkeypatch):
+    """ Runs the design functions with the scalar loops, as in IronPython where NumPy is missing """
+    for module in (beam, column, governing, history):
+        monkeypatch.setattr(module, 'vectorized', None)
+    for module in (capacity, exposure, history, rating, verify):
+        monkeypatch.setattr(module, 'np', None)
+
+
+def assert_same(a, b, evaluated=True, rel=1e-12):
+    """ Asserts that two ColumnResult or BeamResult are the same, floats to rel """
+    for f in a._fields:
+        if f=='Evaluated' and not evaluated:
+            continue
+        x = getattr(a, f)
+        y = getattr(b, f)
+        if isinstance(x, list):
+            assert len(x)==len(y), f
+            for i in range(len(x)):
+                if isinstance(x[i], float) and y[i] is not None:
+                    assert x[i]==pytest.approx(y[i], rel=rel), (f, i)
+                else:
+                    assert x[i]==y[i], (f, i)
+        else:
+            assert x==y, f
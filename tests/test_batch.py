@@ -0,0 +1,115 @@
+"""
+Member tables designed in chunks and processes, in the order of the table
+"""
+
+from __future__ import division
+
+import random
+
+import pytest
+
+from conftest import METHODS, assert_same, scenarios
+from fireant_engine import batch
+
+
+def table(method, seed=5, lengths=5):
+    """ Members of several scenarios in random order, with 12 members and the given number of lengths per scenario """
+    load = batch.design_function(method)[1]
+    members = []
+    for L, loads, s in scenarios(method, 4, seed):
+        for i in range(len(L)):
+            members.append(dict(s, L=L[i % lengths], **{load: loads[i]}))
+    random.Random(seed).shuffle(members)
+    return members
+
+
+def single(method, member):
+    design, load = batch.design_function(method)
+    scenario = dict((k, v) for k, v in member.items() if k not in ('L', load))
+    return design([member['L']], [member[load]], **scenario)
+
+
+def row(result, i):
+    return type(result)(*[x[i:i+1] if isinstance(x, list) else x for x in result])
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_order(method):
+    members = table(method)
+    result = batch.design(method, members, processes=1, chunksize=7)
+    assert len(result.Width)==len(members)
+    for i, member in enumerate(members):
+        expected = single(method, member)
+        assert_same(row(result, i)._replace(ErrorMessage=expected.ErrorMessage), expected)
+    if any(x is None for x in result.Width):
+        assert result.ErrorMessage==batch.MODULES[batch.METHODS[method][0]].ERROR_NO_PROFILE
+
+
+def test_processes():
+    members = table('Column-StdFire-SR')
+    assert batch.design('Column-StdFire-SR', members, processes=2, chunksize=10)==batch.design('Column-StdFire-SR', members, processes=1)
+
+
+def test_columns_of_lists():
+    result = batch.design('Beam-StdFire-SR', {'L': [3000, 4000], 'q': [5, 6]}, processes=1, ToW=3)
+    assert result==batch.design('Beam-StdFire-SR', [{'L': 3000, 'q': 5}, {'L': 4000, 'q': 6}], processes=1, ToW=3)
+
+
+def test_unknown_input():
+    with pytest.raises(ValueError):
+        batch.design('Beam-StdFire-SR', [{'L': 3000, 'q': 5, 'F': 6}], processes=1)
+    with pytest.raises(ValueError):
+        batch.design('Beam-StdFire-SR', [{'L': 3000}], processes=1)
+
+
+def test_rounded_length():
+    assert batch.rounded_length(3001, 50)==3050
+    assert batch.rounded_length(3000, 50)==3000
+    assert batch.rounded_length(3001, 0)==3001
+    assert batch.rounded_length(3001, None)==3001
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_deduplication(method):
+    # 2 lengths for 12 members, within DEDUPLICATION
+    members = table(method, lengths=2)
+    load = batch.design_function(method)[1]
+    result = batch.design(method, members, processes=1, tolerance=50)
+    shared = set()
+    for i, member in enumerate(members):
+        rounded = dict(member, L=batch.rounded_length(member['L'], 50))
+        expected = single(method, rounded)
+        assert_same(row(result, i)._replace(ErrorMessage=expected.ErrorMessage), expected, evaluated=False)
+        key = tuple(sorted((k, v) for k, v in rounded.items() if k!=load))
+        assert (result.Evaluated[i]==0)==(key in shared)
+        shared.add(key)
+    d = batch.deduplication(method, members, 50)
+    assert d.Members==len(members)
+    assert d.Unique==len(shared)
+    assert d.Ratio==len(members)/len(shared)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_no_deduplication(method):
+    # 9 lengths for 12 members, more than DEDUPLICATION: designed with their own lengths
+    members = table(method, lengths=9)
+    result = batch.design(method, members, processes=1, tolerance=50)
+    assert result==batch.design(method, members, processes=1)
+    assert all(deduplicate is False for indices, L, loads, scenario, deduplicate in batch.chunks(method, members, tolerance=50))
+
+
+def test_chunks():
+    members = table('Column-StdFire-SR', lengths=2)+table('Column-StdFire-SR', seed=6, lengths=9)
+    result = batch.chunks('Column-StdFire-SR', members, chunksize=5, tolerance=50)
+    assert sorted(i for chunk in result for i in chunk[0])==list(range(len(members)))
+    for indices, L, loads, scenario, deduplicate in result:
+        assert len(set(tuple(sorted(dict(members[i], L=0, F=0).items())) for i in indices))==1
+        assert loads==[members[i]['F'] for i in indices]
+        if deduplicate:
+            assert L==sorted(L)
+            assert L==[batch.rounded_length(members[i]['L'], 50) for i in indices]
+        else:
+            assert len(indices)<=5
+            assert L==[members[i]['L'] for i in indices]
+            assert indices==sorted(indices)
+    assert set(chunk[-1] for chunk in result)=={True, False}
@@ -0,0 +1,102 @@
+"""
+The least recently used cache shared between members, components and solves
+"""
+
+from __future__ import division
+
+import pytest
+
+from fireant_engine import cache, catalogue, sections
+
+
+def test_eviction():
+    lru = cache.LRUCache(3)
+    for k in range(3):
+        lru.put(k, k*10)
+    # Reading 0 makes 1 the least recently used
+    assert lru.get(0)==0
+    lru.put(3, 30)
+    assert len(lru)==3
+    assert 1 not in lru
+    assert [k in lru for k in (0, 2, 3)]==[True, True, True]
+    # Putting an existing key refreshes it without growing the cache
+    lru.put(2, 21)
+    lru.put(4, 40)
+    assert 0 not in lru
+    assert (lru.get(2), len(lru))==(21, 3)
+
+
+def test_hits():
+    lru = cache.LRUCache(2)
+    assert lru.get('a', 'missing')=='missing'
+    lru.put('a', None)
+    # A cached None is a hit, told apart from the default
+    assert lru.get('a', lru) is None
+    assert (lru.hits, lru.misses)==(1, 1)
+    lru.clear()
+    assert (len(lru), lru.hits, lru.misses)==(0, 0, 0)
+
+
+def test_key():
+    np = pytest.importorskip('numpy')
+    assert cache.key(([1, 2], (1, 2), 3.5))==((1, 2), (1, 2), 3.5)
+    assert cache.key((np.array([1.0, 2.0]),))==cache.key(([1.0, 2.0],))
+    assert hash(cache.key(([1, 2], 'a')))==hash(((1, 2), 'a'))
+
+
+def test_memoize():
+    calls = []
+
+    @cache.memoize(2, lambda x, y: x!=0)
+    def add(x, y):
+        calls.append((x, y))
+        return x+sum(y)
+
+    # Lists and tuples with the same values share one result
+    assert add(1, [2, 3])==6
+    assert add(1, (2, 3))==6
+    assert calls==[(1, [2, 3])]
+    assert (add.cache.hits, add.cache.misses)==(1, 1)
+    # Calls that are not cached are always calculated and leave the cache alone
+    add(0, [1])
+    add(0, [1])
+    assert len(calls)==3 and len(add.cache)==1
+    add(2, [1])
+    add(3, [1])
+    assert len(add.cache)==2
+    add(1, [2, 3])
+    assert calls[-1]==(1, [2, 3])
+
+
+def test_cached():
+    lru = cache.LRUCache(4)
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x*x
+
+    assert cache.cached(lru, ('k',), square, 3)==9
+    # The key decides, not the arguments
+    assert cache.cached(lru, ('k',), square, 4)==9
+    assert calls==[3]
+
+
+def test_sections():
+    c = catalogue.GLULAM
+    residual = sections.rounded_residual_section
+    residual.cache.clear()
+    first = residual(c.W, c.H, 10.0, 8)
+    # The catalogue as lists gives the same key as the tuples of the Catalogue
+    assert residual(list(c.W), list(c.H), 10.0, 8) is first
+    assert (residual.cache.hits, residual.cache.misses)==(1, 1)
+    # Every charring depth after SECTION_CACHE_SIZE others evicts the least recently used one
+    for k in range(sections.SECTION_CACHE_SIZE):
+        residual(c.W, c.H, 11.0+k, 8)
+    assert len(residual.cache)==sections.SECTION_CACHE_SIZE
+    assert cache.key((c.W, c.H, 10.0, 8)) not in residual.cache
+    assert residual(c.W, c.H, 10.0, 8) is not first
+    # A single user defined profile is not cached
+    residual((100,), (200,), 10.0, 8)
+    assert cache.key(((100,), (200,), 10.0, 8)) not in residual.cache
+    residual.cache.clear()
@@ -0,0 +1,65 @@
+"""
+User catalogues read from CSV and JSON files and their binary cache
+"""
+
+from __future__ import division
+
+import io
+import json
+import os
+
+import pytest
+
+from fireant_engine import catalogue
+
+
+def write(path, text):
+    with io.open(str(path), 'w', encoding='utf-8') as f:
+        f.write(text)
+    return str(path)
+
+
+def test_csv(tmp_path):
+    path = write(tmp_path/'beams.csv', u'Width,Height,ToW\n90,300,2\n45,95,2\n70,145,2\n')
+    c = catalogue.load(path, binary_cache=False)
+    assert (list(c.W), list(c.H), c.ToW)==([45, 70, 90], [95, 145, 300], 2)
+    assert catalogue.load(path, ToW=1, binary_cache=False).ToW==1
+
+
+def test_csv_without_tow(tmp_path):
+    path = write(tmp_path/'beams.csv', u'90,300\n45,95\n')
+    assert catalogue.load(path, binary_cache=False).ToW==3
+
+
+def test_csv_mixed_tow(tmp_path):
+    path = write(tmp_path/'beams.csv', u'Width,Height,ToW\n90,300,2\n45,95,1\n')
+    with pytest.raises(ValueError):
+        catalogue.load(path, binary_cache=False)
+
+
+def test_json(tmp_path):
+    path = write(tmp_path/'beams.json', json.dumps({'ToW': 1, 'profiles': [{'Width': 100, 'Height': 200}, [50, 100]]}))
+    c = catalogue.load(path, binary_cache=False)
+    assert (list(c.W), list(c.H), c.ToW)==([50, 100], [100, 200], 1)
+    path = write(tmp_path/'bad.json', json.dumps({'ToW': 4, 'W': [50], 'H': [100]}))
+    with pytest.raises(ValueError):
+        catalogue.load(path, binary_cache=False)
+
+
+def test_cache(tmp_path, monkeypatch):
+    np = pytest.importorskip('numpy')
+    path = write(tmp_path/'beams.csv', u'Width,Height,ToW\n90,300,1\n45,95,1\n')
+    c = catalogue.load(path)
+    assert os.path.exists(path+'.npy')
+    loaded = []
+    load = np.load
+
+    def memory_mapped(*args, **kwargs):
+        loaded.append(kwargs.get('mmap_mode'))
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(np, 'load', memory_mapped)
+    cached = catalogue.load(path)
+    assert loaded==['r']
+    assert (list(cached.W), list(cached.H), cached.order, cached.ToW)==(list(c.W), list(c.H), c.order, 1)
+    assert catalogue.load(path, ToW=2).ToW==2
@@ -0,0 +1,66 @@
+"""
+Cheapest combination against the minimum cost of a scan over every strength class, catalogue and profile
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import METHODS, scenarios
+from fireant_engine import batch, cheapest, pareto
+
+STR = [2, 5, 7]
+TOW = [1, 2, 3]
+
+
+def by_strength(Str, ToW, Width, Height):
+    """ Cost growing with the strength class, so that a weaker class with a larger profile can be cheaper """
+    return Width*Height*(1+0.15*Str)
+
+
+def scan(method, L, load, cost, scenario):
+    """ (cost, order, Str, ToW, Width, Height, Utilization) of the cheapest passing profile of every member """
+    member = batch.METHODS[method][0]
+    module = batch.MODULES[member]
+    best = [None]*len(L)
+    order = 0
+    for tow in TOW:
+        for s in STR:
+            profiles = batch.profiles_function(method)(Str=s, ToW=tow, **scenario)
+            for j in range(len(profiles.w)):
+                result = module.select(L, load, *pareto.subset(profiles, [j]))
+                for i in range(len(L)):
+                    if result.Width[i] is not None:
+                        row = (cost(s, tow, profiles.w[j], profiles.h[j]), order, s, tow, profiles.w[j], profiles.h[j], result.Utilization[i])
+                        if best[i] is None or row[:2]<best[i][:2]:
+                            best[i] = row
+                order += 1
+    return best
+
+
+def check(method, cost):
+    for L, load, s in scenarios(method, 2, seed=11):
+        s.pop('Str')
+        s.pop('ToW')
+        result = cheapest.design(method, L, load, Str=STR, ToW=TOW, cost=cost, **s)
+        expected = scan(method, L, load, cost, s)
+        for i in range(len(L)):
+            if expected[i] is None:
+                assert result.Width[i] is None
+                assert result.ErrorMessage==cheapest.ERROR_NO_PROFILE
+                continue
+            c, order, Str, ToW, Width, Height, Utilization = expected[i]
+            assert (result.Str[i], result.ToW[i], result.Width[i], result.Height[i])==(Str, ToW, Width, Height), (s, i)
+            assert result.Cost[i]==c
+            assert result.Utilization[i]==pytest.approx(Utilization, rel=1e-12)
+
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('cost', [cheapest.area, by_strength])
+def test_design(method, cost):
+    check(method, cost)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_design_scalar(method, scalar):
+    check(method, by_strength)
@@ -0,0 +1,85 @@
+"""
+The envelope of all SEF against the capacity of every SEF on its own
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import METHODS, scenarios
+from fireant_engine import batch, exposure, history
+
+
+def envelope_cases(method, n, seed):
+    for L, load, s in scenarios(method, n, seed):
+        s = dict(s)
+        s.pop('SEF')
+        yield L, load, s
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_envelope(method):
+    for L, load, s in envelope_cases(method, 3, 6):
+        e = exposure.envelope(method, L[0], **s)
+        options = dict((k, s[k]) for k in ('O', 'qf', 'Ti') if k in s)
+        for k, SEF in enumerate(exposure.SIDES):
+            expected = history.capacities(method, L[0], [s['t']], s['Str'], s['Sup'], s['ToW'], s['WS'], SEF, **options)[3][0]
+            assert e.Capacity[k]==pytest.approx(expected, rel=1e-9, abs=1e-9)
+        for j in range(len(e.Width)):
+            column = [C[j] for C in e.Capacity]
+            assert e.Minimum[j]==min(column)
+            assert e.GoverningSEF[j]==exposure.SIDES[column.index(min(column))]
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_design(method):
+    member = batch.METHODS[method][0]
+    for L, load, s in envelope_cases(method, 3, 7):
+        L = L[:4]*3
+        result = exposure.design(method, L, load, **s)
+        for i in range(len(L)):
+            e = exposure.envelope(method, L[i], **s)
+            # The first profile supporting the load for every SEF
+            j = -1
+            if member=='column' or load[i]>0:
+                j = next((j for j in range(len(e.Width)) if e.Minimum[j]>load[i]), -1)
+            if j<0:
+                assert result.Width[i] is None
+                continue
+            assert (result.Width[i], result.Height[i], result.GoverningSEF[i])==(e.Width[j], e.Height[j], e.GoverningSEF[j])
+            assert result.Utilization[i]==pytest.approx(load[i]/e.Minimum[j]*100, rel=1e-12)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_scalar(method, request):
+    pytest.importorskip('numpy')
+    cases = list(envelope_cases(method, 2, 8))
+    arrays = [exposure.design(method, L, load, **s) for L, load, s in cases]
+    request.getfixturevalue('scalar')
+    for (L, load, s), expected in zip(cases, arrays):
+        result = exposure.design(method, L, load, **s)
+        assert (result.Width, result.Height, result.GoverningSEF)==(expected.Width, expected.Height, expected.GoverningSEF)
+        assert result.Capacity==pytest.approx(expected.Capacity, rel=1e-9)
+
+
+@pytest.mark.parametrize('method', [m for m in METHODS if m.startswith('Beam')])
+def test_beam_boundary(method):
+    design = batch.design_function(method)[0]
+    for L, load, s in envelope_cases(method, 2, 9):
+        e = exposure.envelope(method, L[0], **s)
+        # Loads exactly at the capacity of a profile, which that profile does not support
+        loads = [C for C in e.Minimum if C>0][::7]
+        result = exposure.design(method, [L[0]]*len(loads), loads, **s)
+        for i, q in enumerate(loads):
+            expected = None
+            for j in range(len(e.Width)):
+                if e.Minimum[j]<q*(1-1e-9):
+                    continue
+                profile = dict(s, WidthProfile=e.Width[j], HeightProfile=e.Height[j])
+                if all(design([L[0]], [q], SEF=SEF, **profile).Width[0] is not None for SEF in exposure.SIDES):
+                    expected = j
+                    break
+            if expected is None:
+                assert result.Width[i] is None
+            else:
+                assert (result.Width[i], result.Height[i])==(e.Width[expected], e.Height[expected]), q
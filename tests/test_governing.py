@@ -0,0 +1,52 @@
+"""
+Both standard fire methods in one walk against the design functions and the capacity of every profile
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import assert_same, scenarios
+from fireant_engine import batch, catalogue, governing, history
+
+MEMBERS = {'column': 'Column-StdFire-SR', 'beam': 'Beam-StdFire-SR'}
+
+
+def cases(member, n, seed):
+    for L, load, s in scenarios(MEMBERS[member], n, seed):
+        yield L, [x*2-load[0] for x in load], s
+
+
+@pytest.mark.parametrize('member', sorted(MEMBERS))
+def test_design(member):
+    for L, load, s in cases(member, 6, 10):
+        result = governing.design(member, L, load, **s)
+        for k, method in enumerate(governing.METHODS[member]):
+            assert_same((result.SR, result.RCS)[k], batch.design_function(method)[0](L, load, **s), evaluated=False)
+        W, H, Input = catalogue.profiles(s['ToW'])
+        capacities = [history.capacities(method, x, [s['t']], s['Str'], s['Sup'], s['ToW'], s['WS'], s['SEF'])[3][0]
+                      for method in governing.METHODS[member] for x in L]
+        for i in range(len(L)):
+            # The first profile of the catalogue passing both methods
+            both = [capacities[i], capacities[len(L)+i]]
+            j = next((j for j in range(len(W)) if all(C[j]>0 and history.supports(member, C[j], load[i]) for C in both)), -1)
+            if j<0:
+                assert result.Width[i] is None
+                continue
+            assert (result.Width[i], result.Height[i])==(W[j], H[j])
+            assert result.Governing[i]==('SR' if both[0][j]<=both[1][j] else 'RCS')
+
+
+@pytest.mark.parametrize('member', sorted(MEMBERS))
+def test_scalar(member, request):
+    pytest.importorskip('numpy')
+    data = list(cases(member, 4, 11))
+    arrays = [governing.design(member, L, load, **s) for L, load, s in data]
+    request.getfixturevalue('scalar')
+    for (L, load, s), expected in zip(data, arrays):
+        assert governing.design(member, L, load, **s)==expected
+
+
+def test_unknown_member():
+    with pytest.raises(ValueError):
+        governing.design('slab', [3000], [5])
@@ -0,0 +1,118 @@
+"""
+Capacity of the profiles over the time of a fire, with and without NumPy
+"""
+
+from __future__ import division
+
+import pytest
+
+from fireant_engine import history
+
+np = pytest.importorskip('numpy')
+
+
+def assert_close(a, b, rel=1e-12):
+    """ Asserts that two lists of capacities, or lists of lists, are the same to rel """
+    assert len(a)==len(b)
+    for x, y in zip(a, b):
+        if isinstance(x, list):
+            assert_close(x, y, rel)
+        else:
+            assert x==pytest.approx(y, rel=rel, abs=1e-9)
+
+
+@pytest.mark.parametrize('method, L, inputs', [
+    ('Column-ParamFire-SR', 3500, dict(Str=3, Sup=2, ToW=2, WS=1, O=0.04, qf=400, Ti=1160)),
+    ('Column-ParamFire-SR', 6000, dict(Str=6, Sup=1, ToW=3, WS=2, SEF=4, O=0.1, qf=200, Ti=800, step=2.5)),
+    ('Beam-ParamFire-SR', 5000, dict(Str=2, Sup=3, ToW=1, WS=3, O=0.02, qf=800, Ti=1500)),
+])
+def test_parametric_scan(method, L, inputs, request):
+    scan = history.parametric_scan(method, L, **inputs)
+    assert scan.Time==sorted(scan.Time)
+    for j in range(len(scan.Width)):
+        column = [c[j] for c in scan.Capacity]
+        assert scan.Minimum[j]==min(column)
+        assert scan.Governing[j]==scan.Time[column.index(min(column))]
+    request.getfixturevalue('scalar')
+    expected = history.parametric_scan(method, L, **inputs)
+    assert scan.Time==expected.Time
+    assert (scan.Width, scan.Height)==(expected.Width, expected.Height)
+    assert_close(scan.dchar, expected.dchar)
+    assert_close(scan.Capacity, expected.Capacity)
+    assert_close(scan.Minimum, expected.Minimum)
+    assert scan.Governing==expected.Governing
+
+
+RESISTANCE = [
+    ('Column-StdFire-SR', [3000, 4500, 2500, 6000], [150, 300, 2000, 60], [200, 240, 115, 280], [200, 240, 135, 315], {}),
+    ('Column-StdFire-RCS', [3000, 4500, 2500], [150, 300, 0.5], [200, 240, 240], [200, 240, 240], dict(Sup=2)),
+    ('Column-ParamFire-SR', [3000, 4500], [150, 300], [200, 240], [200, 240], dict(O=0.04, qf=800, Ti=1500)),
+    ('Beam-StdFire-SR', [5000, 7000, 4000], [8, 12, 0], [140, 190, 90], [405, 630, 225], dict(Str=4)),
+    ('Beam-StdFire-RCS', [5000, 7000], [8, 50], [140, 190], [405, 630], {}),
+    ('Beam-ParamFire-SR', [5000, 7000], [8, 12], [140, 190], [405, 630], dict(O=0.02, qf=800, Ti=1500, WS=2)),
+]
+
+
+def check_resistance(method, L, load, Width, Height, inputs):
+    from fireant_engine import batch
+    design = batch.design_function(method)[0]
+    tmax = 240
+    tol = 0.01
+    result = history.fire_resistance(method, L, load, Width, Height, tmax=tmax, tol=tol, **inputs)
+
+    def passes(i, t):
+        r = design([L[i]], [load[i]], t=t, WidthProfile=Width[i], HeightProfile=Height[i], **inputs)
+        return r.Width[0] is not None
+
+    for i, t in enumerate(result):
+        if t is None:
+            assert not passes(i, 0), i
+            continue
+        assert passes(i, t), (i, t)
+        if t<tmax:
+            assert not passes(i, t+tol), (i, t)
+    return result
+
+
+@pytest.mark.parametrize('method, L, load, Width, Height, inputs', RESISTANCE)
+def test_fire_resistance(method, L, load, Width, Height, inputs, request):
+    result = check_resistance(method, L, load, Width, Height, inputs)
+    assert any(t is not None and 0<t<240 for t in result)
+    request.getfixturevalue('scalar')
+    expected = check_resistance(method, L, load, Width, Height, inputs)
+    assert [t is None for t in result]==[t is None for t in expected]
+    assert_close([t or 0 for t in result], [t or 0 for t in expected])
+
+
+@pytest.mark.parametrize('method, L, inputs', [
+    ('Column-StdFire-SR', 3500, dict(Str=3, Sup=2, ToW=2, WS=1)),
+    ('Column-StdFire-RCS', 5000, dict(Str=5, Sup=1, ToW=3, WS=2, SEF=4)),
+    ('Beam-StdFire-SR', 6000, dict(Str=2, Sup=3, ToW=1, WS=1)),
+    ('Beam-StdFire-RCS', 4000, dict(Str=7, Sup=1, ToW=2, WS=3, SEF=3)),
+])
+def test_standard_curves(method, L, inputs, request):
+    from fireant_engine import batch
+    member = batch.METHODS[method][0]
+    design = batch.design_function(method)[0]
+    curves = history.standard_curves(method, L, tmax=100, step=2.5, **inputs)
+    assert curves.Time[-1]==100
+    for k in range(0, len(curves.Time), 7):
+        Capacity = curves.Capacity[k]
+        for fraction in (0.05, 0.3, 0.8):
+            load = fraction*max(Capacity)
+            result = design([L], [load], t=curves.Time[k], **inputs)
+            # The design functions select the first profile of the catalogue that supports the load
+            passing = [j for j in range(len(Capacity)) if history.supports(member, Capacity[j], load)]
+            if not passing:
+                assert result.Width==[None]
+                continue
+            j = passing[0]
+            assert (result.Width[0], result.Height[0])==(curves.Width[j], curves.Height[j]), (curves.Time[k], load)
+            if member=='column':
+                assert result.NRcfire[0]==pytest.approx(Capacity[j], rel=1e-12)
+    request.getfixturevalue('scalar')
+    expected = history.standard_curves(method, L, tmax=100, step=2.5, **inputs)
+    assert curves.Time==expected.Time
+    assert (curves.Width, curves.Height)==(expected.Width, expected.Height)
+    assert_close(curves.dchar, expected.dchar)
+    assert_close(curves.Capacity, expected.Capacity)
@@ -0,0 +1,54 @@
+"""
+The NumPy kernels against the scalar functions they replace
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import BEAM_METHODS, COLUMN_METHODS, METHODS, scenarios
+from fireant_engine import batch, beam, column
+
+np = pytest.importorskip('numpy')
+vectorized = pytest.importorskip('fireant_engine.vectorized')
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_design_array_scalar(method, monkeypatch):
+    design = batch.design_function(method)[0]
+    cases = scenarios(method, 8)
+    arrays = [design(L, load, **s) for L, load, s in cases]
+    monkeypatch.setattr(beam, 'vectorized', None)
+    monkeypatch.setattr(column, 'vectorized', None)
+    for (L, load, s), expected in zip(cases, arrays):
+        assert design(L, load, **s)==expected, s
+
+
+@pytest.mark.parametrize('method', COLUMN_METHODS)
+def test_buckling_capacity(method):
+    for L, F, s in scenarios(method, 4):
+        l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = batch.profiles_function(method)(**s)
+        ls = [x*l0 for x in L]
+        NRcfire = vectorized.column_capacity(ls, Ar, I, fc, E, Bc, CStr, EStr)
+        lower, upper, valid = vectorized.capacity_bounds(np.asarray(ls)[:, np.newaxis], Ar, I, fc, E, Bc, CStr, EStr)
+        lower, upper, valid = [np.broadcast_to(x, NRcfire.shape) for x in (lower, upper, valid)]
+        for i in range(len(ls)):
+            for j in range(len(w)):
+                expected = column.buckling_capacity(ls[i], Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])
+                assert NRcfire[i, j]==pytest.approx(expected, rel=1e-12)
+                if valid[i, j]:
+                    assert lower[i, j]<=expected<=upper[i, j]
+
+
+@pytest.mark.parametrize('method', BEAM_METHODS)
+def test_bending(method):
+    for L, q, s in scenarios(method, 4):
+        c, w, h, Iy, Hr, fm, FStr = batch.profiles_function(method)(**s)
+        sigmafire = vectorized.bending_stress(L, q, Iy, Hr, c, FStr)
+        qmax = vectorized.bending_capacity(np.asarray(L)[:, np.newaxis], Iy, Hr, fm, c, FStr)
+        for i in range(len(L)):
+            for j in range(len(w)):
+                if Iy[j]>0:
+                    expected = beam.bending_stress(c*q[i]*(L[i]*L[i]), Iy[j], Hr[j], FStr[j])
+                    assert sigmafire[i, j]==pytest.approx(expected, rel=1e-12)
+                assert qmax[i, j]==pytest.approx(beam.bending_capacity(L[i], Iy[j], Hr[j], fm, c, FStr[j]), rel=1e-12)
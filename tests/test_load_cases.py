@@ -0,0 +1,41 @@
+"""
+select_load_cases against select for each load case
+"""
+
+from __future__ import division
+
+import random
+
+import pytest
+
+from conftest import METHODS, assert_same, scenarios
+from fireant_engine import batch
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_load_cases(method):
+    member = batch.METHODS[method][0]
+    module = batch.MODULES[member]
+    rnd = random.Random(4)
+    for L, load, s in scenarios(method, 6, seed=4):
+        # Members sharing a length share the capacity of the catalogue
+        L = L[:6]+L[:6]
+        cases = [[x*rnd.uniform(0.2, 2) for x in load] for k in range(3)]+[[0]*len(L)]
+        profiles = batch.profiles_function(method)(**s)
+        results = module.select_load_cases(L, cases, profiles)
+        assert len(results)==len(cases)
+        for result, F in zip(results, cases):
+            assert_same(result, module.select(L, F, *profiles), evaluated=False)
+            assert result.Evaluated==[len(profiles.w)]*6+[0]*6
+
+
+@pytest.mark.parametrize('method', [m for m in METHODS if m.startswith('Beam')])
+def test_capacity_loads(method):
+    module = batch.MODULES['beam']
+    for L, load, s in scenarios(method, 4, seed=5):
+        profiles = batch.profiles_function(method)(**s)
+        # Loads exactly at the capacity of each profile
+        capacity = module.capacity_index(L[0], profiles).capacity
+        F = [C for C in capacity if C>0]
+        result = module.select_load_cases([L[0]]*len(F), [F], profiles)[0]
+        assert_same(result, module.select([L[0]]*len(F), F, *profiles), evaluated=False)
@@ -0,0 +1,48 @@
+"""
+Longest column of every profile against the design functions
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import COLUMN_METHODS, scenarios
+from fireant_engine import batch, column
+
+
+def check(method):
+    design = batch.design_function(method)[0]
+    tol = 1
+    result = []
+    for L, F, s in scenarios(method, 3, seed=7):
+        # Glulam, which has the straightness factor of user defined profiles
+        s['ToW'] = 3
+        profiles = batch.profiles_function(method)(**s)
+        for load in F[:3]:
+            lengths = column.maximum_length(load, profiles, tol)
+            result.append(lengths)
+            for j in range(0, len(profiles.w), 7):
+                inputs = dict(s, WidthProfile=profiles.w[j], HeightProfile=profiles.h[j])
+                Lmax = lengths[j]
+                if Lmax is None:
+                    assert design([1], [load], **inputs).Width==[None], j
+                elif Lmax==float('inf'):
+                    assert design([1e7], [load], **inputs).Width==[profiles.w[j]], j
+                else:
+                    assert design([Lmax], [load], **inputs).Width==[profiles.w[j]], (j, Lmax)
+                    assert design([Lmax+tol], [load], **inputs).Width==[None], (j, Lmax)
+    return result
+
+
+@pytest.mark.parametrize('method', COLUMN_METHODS)
+def test_maximum_length(method, request):
+    result = check(method)
+    assert any(x is not None and 0<x<float('inf') for lengths in result for x in lengths)
+    request.getfixturevalue('scalar')
+    expected = check(method)
+    for lengths, scalar_lengths in zip(result, expected):
+        for x, y in zip(lengths, scalar_lengths):
+            if x is None or y is None:
+                assert x==y
+            else:
+                assert x==pytest.approx(y, abs=1)
@@ -0,0 +1,44 @@
+"""
+Removing the dominated profiles does not change the selected profile
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import METHODS, assert_same, scenarios
+from fireant_engine import batch, pareto
+
+
+def test_front():
+    keys = [(1, 5), (2, 2), (0.5, 3), (3, 1), (2, 6), (0, 0)]
+    assert pareto.front(keys)==[0, 1, 3, 4]
+    # A profile as strong as an earlier one is kept, only weaker ones are removed
+    assert pareto.front([(2,), (1,), (3,), (3,)])==[0, 2, 3]
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_selection(method):
+    member = batch.METHODS[method][0]
+    module = batch.MODULES[member]
+    for L, load, s in scenarios(method, 8, seed=3):
+        profiles = batch.profiles_function(method)(**s)
+        front = module.pareto_front(profiles)
+        assert len(front.w)<=len(profiles.w)
+        assert_same(module.select(L, load, *front), module.select(L, load, *profiles), evaluated=False)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_cached_front(method):
+    member = batch.METHODS[method][0]
+    module = batch.MODULES[member]
+    profiles_function = batch.profiles_function(method)
+    module.FRONTS.clear()
+    for L, load, s in scenarios(method, 4, seed=5):
+        expected = module.pareto_front(profiles_function(**s))
+        assert profiles_function(front=True, **s)==expected
+        # Another strength class keeps the same profiles, found in the cache
+        hits = module.FRONTS.hits
+        s['Str'] = s['Str'] % 7+1
+        assert profiles_function(front=True, **s)==module.pareto_front(profiles_function(**s))
+        assert module.FRONTS.hits==hits+1
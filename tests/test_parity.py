@@ -0,0 +1,118 @@
+"""
+The design functions against the original Grasshopper scripts (Column-*.py and Beam-*.py before
+they became wrappers around fireant_engine), run headless one member at a time on the inputs below.
+
+Beam-StdFire-RCS is left out: the original script calculates sigmafire and qmax with the height
+before fire, which the engine corrects to the residual height.
+"""
+
+from __future__ import division
+
+import pytest
+
+from fireant_engine import batch
+
+# Scenario and rows (L [mm], load, Width, Height, NRcfire or qmax, Sigmafire for beams, Utilization)
+# of the original scripts, None where they find no profile
+EXPECTED = {
+    'Column-StdFire-SR': [
+        (dict(Str=1, Sup=1, ToW=3, WS=1, t=60, SEF=8), [
+            (3000, 150, 185, 300, 165.2207205220527, 90.7876442652233),
+            (6000, 80, 185, 500, 86.2175442259171, 92.7885394072172)]),
+        (dict(Str=4, Sup=2, ToW=1, WS=2, t=30, SEF=4), [
+            (3000, 150, None, None, None, None),
+            (4500, 300, None, None, None, None)]),
+        (dict(Str=2, Sup=3, ToW=2, WS=1, t=15, SEF=3), [
+            (3000, 150, 120, 120, 160.61183031098412, 93.39287131562041),
+            (2800, 40, 95, 95, 70.91379549352509, 56.40651402399167)]),
+        (dict(Str=6, Sup=4, ToW=3, WS=3, t=90, SEF=6), [
+            (6000, 80, 140, 200, 161.92108852680877, 49.406782481427456),
+            (2800, 40, 140, 133, 45.15539114227001, 88.58299969979876)]),
+    ],
+    'Column-StdFire-RCS': [
+        (dict(Str=1, Sup=1, ToW=3, WS=1, t=60, SEF=8), [
+            (3000, 150, 185, 633, 155.0627157021029, 96.73505285962545),
+            (4500, 300, None, None, None, None),
+            (6000, 80, 185, 1200, 82.41615398749789, 97.06834901824658),
+            (2800, 40, 185, 233, 41.72904177719718, 95.85650256138396)]),
+        (dict(Str=2, Sup=3, ToW=2, WS=1, t=15, SEF=3), [
+            (3000, 150, 145, 145, 260.39069961897906, 57.605744068236675),
+            (4500, 300, 195, 195, 462.07093504157854, 64.92509639737567),
+            (6000, 80, 145, 145, 83.65690956822957, 95.62868197366646),
+            (2800, 40, 95, 95, 50.54278701202916, 79.14086730215337)]),
+        (dict(Str=6, Sup=4, ToW=3, WS=3, t=90, SEF=6), [
+            (3000, 150, 90, 200, 171.5342154101294, 87.44611076067697),
+            (4500, 300, 115, 267, 331.9062476286559, 90.3869698577192),
+            (6000, 80, 90, 267, 99.31940560242258, 80.5482065813417),
+            (2800, 40, 65, 167, 40.565424441889164, 98.60614193079836)]),
+    ],
+    'Column-ParamFire-SR': [
+        (dict(Str=1, Sup=1, ToW=3, WS=1, t=60, SEF=8, O=0.06, qf=300, Ti=1000), [
+            (3000, 150, 185, 300, 161.20919758948506, 93.04680020923558),
+            (6000, 80, 185, 500, 84.3469145559398, 94.84638581170995)]),
+        (dict(Str=2, Sup=3, ToW=2, WS=1, t=15, SEF=3, O=0.06, qf=300, Ti=1000), [
+            (3000, 150, 145, 145, 288.5975500699177, 51.97549319585697),
+            (4500, 300, 170, 170, 304.1005641408016, 98.6515762795813),
+            (6000, 80, 145, 145, 95.52885642108842, 83.74432919762206),
+            (2800, 40, 120, 120, 161.18614678027146, 24.81602842366342)]),
+    ],
+    'Beam-StdFire-SR': [
+        (dict(Str=1, Sup=1, ToW=3, WS=1, t=60, SEF=8), [
+            (4000, 5, 140, 300, 5.7831632180232315, 25.93214668495698, 86.4404889498566),
+            (6000, 10, 160, 433, 10.082387029843742, 29.75054026318286, 99.16846754394287),
+            (8000, 15, 140, 733, 15.10447907375722, 29.7873061757982, 99.291020585994),
+            (3000, 2, 140, 200, 2.5099502881514915, 23.899106475746994, 79.66368825248999)]),
+        (dict(Str=4, Sup=2, ToW=1, WS=2, t=30, SEF=4), [
+            (4000, 5, None, None, None, None, None),
+            (3000, 2, 200, 200, 2.6780243515700133, 10.454263464514169, 74.67331046081549)]),
+        (dict(Str=2, Sup=3, ToW=2, WS=1, t=15, SEF=3), [
+            (4000, 5, 45, 220, 5.496354344577801, 21.827260843527768, 90.9469201813657),
+            (6000, 10, 195, 195, 10.029046640008909, 23.928562072658764, 99.7023419694115),
+            (8000, 15, None, None, None, None, None),
+            (3000, 2, 45, 120, 2.668721505557071, 17.98113649113208, 74.92140204638366)]),
+        (dict(Str=6, Sup=4, ToW=3, WS=3, t=90, SEF=6), [
+            (4000, 5, 65, 300, 6.688499999999999, 20.92723254418702, 74.74011622923936),
+            (6000, 10, 65, 500, 11.331185185185184, 24.706161732723917, 88.23629190258542),
+            (8000, 15, 65, 733, 15.676607916666665, 26.78697170751659, 95.66775609827353),
+            (3000, 2, 65, 200, 3.2625185185185184, 17.16045238931444, 61.28732996183729)]),
+    ],
+    'Beam-ParamFire-SR': [
+        (dict(Str=1, Sup=1, ToW=3, WS=1, t=60, SEF=8, O=0.06, qf=300, Ti=1000), [
+            (4000, 5, 140, 300, 5.629951763728171, 26.63779628708323, 88.79265429027743),
+            (6000, 10, 140, 500, 10.37849869203826, 28.900620445511212, 96.33540148503738),
+            (8000, 15, 160, 667, 16.211249092813322, 27.754707831272054, 92.51569277090684),
+            (3000, 2, 140, 200, 2.4076693424584548, 24.914294457306884, 83.04764819102294)]),
+        (dict(Str=2, Sup=3, ToW=2, WS=1, t=15, SEF=3, O=0.06, qf=300, Ti=1000), [
+            (4000, 5, 70, 195, 6.721130200291898, 17.85109640370249, 74.37956834876037),
+            (6000, 10, None, None, None, None, None),
+            (3000, 2, 45, 120, 2.295301311667003, 20.906041609161274, 87.10850670483865)]),
+        (dict(Str=6, Sup=4, ToW=3, WS=3, t=90, SEF=6, O=0.06, qf=300, Ti=1000), [
+            (4000, 5, 65, 267, 6.335465317587166, 22.093343523790278, 78.90479829925098),
+            (6000, 10, 65, 467, 11.022822538337325, 25.39730617722578, 90.7046649186635),
+            (8000, 15, 65, 700, 15.403901382054993, 27.261197326094678, 97.36141902176671),
+            (3000, 2, 65, 167, 2.937817992446679, 19.057007577391545, 68.06074134782695)]),
+    ],
+}
+
+FIELDS = {
+    'column': ('Width', 'Height', 'NRcfire', 'Utilization'),
+    'beam': ('Width', 'Height', 'qmax', 'Sigmafire', 'Utilization'),
+}
+
+
+@pytest.mark.parametrize('method', sorted(EXPECTED))
+@pytest.mark.parametrize('numpy', [True, False])
+def test_original_scripts(method, numpy, request):
+    if not numpy:
+        request.getfixturevalue('scalar')
+    design, load = batch.design_function(method)
+    fields = FIELDS[batch.METHODS[method][0]]
+    for scenario, rows in EXPECTED[method]:
+        result = design([r[0] for r in rows], [r[1] for r in rows], **scenario)
+        for i, row in enumerate(rows):
+            for f, expected in zip(fields, row[2:]):
+                value = getattr(result, f)[i]
+                if expected is None or f in ('Width', 'Height'):
+                    assert value==expected, (scenario, row, f)
+                else:
+                    assert value==pytest.approx(expected, rel=1e-12), (scenario, row, f)
@@ -0,0 +1,82 @@
+"""
+Sections decided by the capacity bounds of column.select, counted in column.PRUNING
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import scenarios
+from fireant_engine import column, selection
+
+
+def expected_counts(L, F, profiles):
+    """ rejected, accepted and evaluated of a walk over the profiles, from the bounds of every section """
+    l0, w, h, Ar, I, fc, E, Bc, CStr, EStr = profiles
+    counts = [0, 0, 0]
+    for i in range(len(L)):
+        ls = L[i]*l0
+        for j in range(len(w)):
+            if Ar[j]>0 and I[j]>0 and CStr[j]>0 and EStr[j]>0:
+                lower, upper = column.capacity_bounds(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])
+                if upper<=F[i]:
+                    counts[0] += 1
+                    continue
+                if lower>F[i]:
+                    counts[1] += 1
+                    break
+            counts[2] += 1
+            if column.buckling_capacity(ls, Ar[j], I[j], fc, E, Bc, CStr[j], EStr[j])>F[i]:
+                break
+    return counts
+
+
+def check():
+    for L, F, s in scenarios('Column-StdFire-SR', 4, seed=13):
+        profiles = column.profiles_standard_sr(**s)
+        column.PRUNING.clear()
+        result = column.select(L, F, *profiles)
+        counts = [column.PRUNING.rejected, column.PRUNING.accepted, column.PRUNING.evaluated]
+        assert counts==expected_counts(L, F, profiles), s
+        assert sum(counts)==sum(result.Evaluated)
+        # The counts add up until they are cleared
+        column.select(L, F, *profiles)
+        assert [column.PRUNING.rejected, column.PRUNING.accepted, column.PRUNING.evaluated]==[2*x for x in counts]
+        column.PRUNING.clear()
+        assert [column.PRUNING.rejected, column.PRUNING.accepted, column.PRUNING.evaluated]==[0, 0, 0]
+
+
+def test_counts():
+    check()
+
+
+def test_counts_scalar(scalar):
+    check()
+
+
+def test_known_catalogue():
+    # Glulam columns of 3 m at R60
+    profiles = column.profiles_standard_sr(Str=4, Sup=1, ToW=3, WS=1, t=60, SEF=8)
+    invalid = sum(1 for Ar in profiles.Ar if Ar<=0)
+    counts = {}
+    for F in (1, 300, 20000):
+        column.PRUNING.clear()
+        result = column.select([3000], [F], *profiles)
+        counts[F] = [column.PRUNING.rejected, column.PRUNING.accepted, column.PRUNING.evaluated]
+        assert counts[F]==expected_counts([3000], [F], profiles)
+        assert sum(counts[F])==result.Evaluated[0]
+    # 1 kN is carried by the first section after fire, decided by its lower bound
+    assert counts[1]==[0, 1, invalid]
+    # No section carries 20000 kN, which is above the upper bound of every section after fire
+    assert counts[20000]==[len(profiles.w)-invalid, 0, invalid]
+    # 300 kN: the 8 smallest sections are rejected by their upper bound, the next 31 up to the selected one need the full calculation
+    assert counts[300]==[8, 0, 31]
+
+
+@pytest.mark.parametrize('search', (selection.WALK, selection.BISECT, selection.STAIRCASE))
+def test_evaluated(search):
+    for L, F, s in scenarios('Column-StdFire-RCS', 3, seed=17):
+        profiles = column.profiles_standard_rcs(**s)
+        column.PRUNING.clear()
+        result = column.select(L, F, *profiles, search=search)
+        assert column.PRUNING.rejected+column.PRUNING.accepted+column.PRUNING.evaluated==sum(result.Evaluated)
@@ -0,0 +1,43 @@
+"""
+Ratings of the catalogue against the design functions at each rating time
+"""
+
+from __future__ import division
+
+import pytest
+
+from fireant_engine import batch, rating
+
+LENGTH = [2500, 4000, 6500]
+LOAD = {'column': [50, 200, 600], 'beam': [2, 8, 25]}
+
+
+def check(method, inputs):
+    member = batch.METHODS[method][0]
+    design = batch.design_function(method)[0]
+    # Glulam, which has the straightness factor of user defined profiles
+    table = rating.classify(method, LENGTH, LOAD[member], ToW=3, **inputs)
+    for j in range(0, len(table.Width), 6):
+        profile = dict(inputs, ToW=3, WidthProfile=table.Width[j], HeightProfile=table.Height[j])
+        for a, L in enumerate(LENGTH):
+            for b, load in enumerate(LOAD[member]):
+                expected = 0
+                for t in rating.RATINGS:
+                    if design([L], [load], t=t, **profile).Width[0] is not None:
+                        expected = t
+                assert table.Rating[j][a][b]==expected, (table.Width[j], table.Height[j], L, load)
+    return table
+
+
+@pytest.mark.parametrize('method, inputs', [
+    ('Column-StdFire-SR', dict(Str=3, Sup=2, WS=1)),
+    ('Column-StdFire-RCS', dict(Str=6, Sup=1, WS=2, SEF=4)),
+    ('Beam-StdFire-SR', dict(Str=2, Sup=3, WS=1)),
+    ('Beam-StdFire-RCS', dict(Str=5, Sup=1, WS=3, SEF=3)),
+])
+def test_classify(method, inputs, request):
+    table = check(method, inputs)
+    found = set(R for rows in table.Rating for row in rows for R in row)
+    assert len(found)>=3
+    request.getfixturevalue('scalar')
+    assert check(method, inputs)==table
@@ -0,0 +1,55 @@
+"""
+The search methods of selection select the same profile
+"""
+
+from __future__ import division
+
+import pytest
+
+from conftest import METHODS, assert_same, scenarios
+from fireant_engine import batch, selection
+
+SEARCHES = (selection.WALK, selection.BISECT, selection.STAIRCASE)
+
+
+def test_grid():
+    # Profiles of a width x height grid ordered by area, passing when not narrower and not lower than a corner
+    grid = sorted(((w, h) for w in range(1, 7) for h in range(1, 9)), key=lambda p: (p[0]*p[1], p[0]))
+    w = [p[0] for p in grid]
+    h = [p[1] for p in grid]
+    for a in range(1, 8):
+        for b in range(1, 10):
+            def passing(j):
+                return w[j]>=a and h[j]>=b
+            expected = selection.walk(len(w), passing)[0]
+            for method in SEARCHES:
+                assert selection.search(method, w, passing, h, selection.prepare(method, w, h))[0]==expected, (method, a, b)
+            # One width at a time, moving up the heights
+            assert selection.staircase(w, h, passing)[1]<=6+8
+
+
+def test_unknown_search():
+    with pytest.raises(ValueError):
+        selection.search('random', [1], lambda j: True)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_design(method):
+    design = batch.design_function(method)[0]
+    for L, load, s in scenarios(method, 8, seed=2):
+        expected = design(L, load, search=selection.WALK, **s)
+        for search in (selection.BISECT, selection.STAIRCASE):
+            result = design(L, load, search=search, **s)
+            assert_same(result, expected, evaluated=False)
+            assert sum(result.Evaluated)<=len(L)*len(batch.profiles_function(method)(**s).w)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_staircase_array(method, request):
+    pytest.importorskip('numpy')
+    design = batch.design_function(method)[0]
+    cases = scenarios(method, 6, seed=13)
+    arrays = [design(L, load, search=selection.STAIRCASE, **s) for L, load, s in cases]
+    request.getfixturevalue('scalar')
+    for (L, load, s), expected in zip(cases, arrays):
+        assert design(L, load, search=selection.STAIRCASE, **s)==expected, s
@@ -0,0 +1,36 @@
+"""
+Span tables against the beam design functions
+"""
+
+from __future__ import division
+
+import pytest
+
+from fireant_engine import batch, spantable
+
+PARAMETRIC = dict(O=0.06, qf=300, Ti=1000)
+
+
+@pytest.mark.parametrize('method', spantable.METHODS)
+def test_smallest(method):
+    options = PARAMETRIC if 'ParamFire' in method else {}
+    table = spantable.build(method, loads=(5,), Str=(2,), SEF=(4,), Sup=(1,), t=(60,), ToW=3, **options)
+    design = batch.design_function(method)[0]
+    for L in (3000, 4500, 6000, 8000):
+        result = design([L], [5], Str=2, SEF=4, Sup=1, t=60, ToW=3, **options)
+        expected = (result.Width[0], result.Height[0]) if result.Width[0] is not None else None
+        assert table.smallest(L, 5, Str=2, SEF=4, Sup=1, t=60)==expected
+
+
+def test_parametric_inputs():
+    table = spantable.build('Beam-ParamFire-SR', loads=(5,), t=(60,), ToW=3, **PARAMETRIC)
+    assert dict((k, table.data[k]) for k in PARAMETRIC)==PARAMETRIC
+    default = spantable.maximum_spans('Beam-ParamFire-SR', [5], ToW=3)[2]
+    assert spantable.maximum_spans('Beam-ParamFire-SR', [5], ToW=3, **PARAMETRIC)[2]!=default
+
+
+def test_save(tmp_path):
+    table = spantable.build(loads=(2, 5), t=(30,), ToW=3)
+    path = str(tmp_path/'spans.json.gz')
+    table.save(path)
+    assert spantable.load(path).span(3, t=30)==table.span(3, t=30)
@@ -0,0 +1,45 @@
+"""
+Every cell of the sweep against the design function of the method
+"""
+
+from __future__ import division
+
+import itertools
+
+import pytest
+
+from conftest import METHODS
+from fireant_engine import batch, sweep
+
+L = [2500, 4000, 6500]
+LOADS = {'column': [40, 150, 400], 'beam': [2, 6, 15]}
+AXES = dict(Str=(1, 4, 7), WS=(1, 3), Sup=(1, 2, 4), t=(0, 30, 60, 90))
+
+
+def check(method):
+    member = batch.METHODS[method][0]
+    design = batch.design_function(method)[0]
+    load = LOADS[member]
+    SEF = (1, 4, 8)
+    options = {}
+    if 'ParamFire' in method:
+        options = dict(O=0.1, qf=200, Ti=800)
+    cube = sweep.sweep(method, L, load, SEF=SEF, ToW=2, **dict(AXES, **options))
+    assert [a for a, v in cube.Axes]==list(sweep.AXES)
+    for (a, s), (b, ws), (e, sef), (c, sup), (d, t) in itertools.product(*[list(enumerate(v)) for a, v in cube.Axes]):
+        expected = design(L, load, Str=s, Sup=sup, ToW=2, WS=ws, t=t, SEF=sef, **options)
+        cell = (s, ws, sef, sup, t)
+        assert cube.Width[a][b][e][c][d]==expected.Width, cell
+        assert cube.Height[a][b][e][c][d]==expected.Height, cell
+        assert cube.Capacity[a][b][e][c][d]==pytest.approx(expected[0], rel=1e-12), cell
+        assert cube.Utilization[a][b][e][c][d]==pytest.approx(expected.Utilization, rel=1e-12), cell
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_sweep(method):
+    check(method)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_sweep_scalar(method, scalar):
+    check(method)
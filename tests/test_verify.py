@@ -0,0 +1,78 @@
+"""
+Verification of given sections against the design functions with the same section as user defined profile
+"""
+
+from __future__ import division
+
+import random
+
+import pytest
+
+from conftest import METHODS
+from fireant_engine import batch, verify
+
+
+def inventory(method, n=40, seed=9):
+    """ Members with their own section, length, load and exposure """
+    rnd = random.Random(seed)
+    member = batch.METHODS[method][0]
+    rows = []
+    for i in range(n):
+        rows.append(dict(L=rnd.uniform(1000, 8000), Width=rnd.choice([65, 90, 100, 140, 185, 200, 300]),
+                         Height=rnd.choice([100, 133, 200, 400, 800, 1500]), t=rnd.choice([0, 10, 30, 60, 90]),
+                         SEF=rnd.randint(1, 8), Sup=rnd.randint(1, 4), Str=rnd.randint(1, 7),
+                         load=rnd.uniform(-1, 1500) if member=='column' else rnd.uniform(-1, 60)))
+    return rows
+
+
+def columns(rows):
+    return dict((k, [r[k] for r in rows]) for k in rows[0])
+
+
+def test_example():
+    result = verify.verify('Column-StdFire-SR', L=[3000, 4500], load=[150, 200], Width=[140, 185], Height=[315, 360], t=[60, 30], SEF=[8, 4])
+    assert list(result.Passes)==[result.Capacity[0]>150, result.Capacity[1]>200]
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_design(method):
+    design = batch.design_function(method)[0]
+    rows = inventory(method)
+    c = columns(rows)
+    result = verify.verify(method, c['L'], c['load'], c['Width'], c['Height'], Str=c['Str'], Sup=c['Sup'], t=c['t'], SEF=c['SEF'])
+    for i, r in enumerate(rows):
+        expected = design([r['L']], [r['load']], Str=r['Str'], Sup=r['Sup'], t=r['t'], SEF=r['SEF'],
+                          WidthProfile=r['Width'], HeightProfile=r['Height'])
+        assert bool(result.Passes[i])==(expected.Width[0] is not None), r
+        if result.Passes[i]:
+            assert result.Utilization[i]==pytest.approx(expected.Utilization[0], rel=1e-9)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_stream(method):
+    load = batch.design_function(method)[1]
+    rows = inventory(method, 30)
+    c = columns(rows)
+    expected = verify.verify(method, c['L'], c['load'], c['Width'], c['Height'], Str=3, Sup=c['Sup'], t=c['t'], SEF=c['SEF'])
+    table = [dict((load if k=='load' else k, v) for k, v in r.items() if k!='Str') for r in rows]
+    # Values read from a CSV file are strings
+    table[0] = dict((k, str(v)) for k, v in table[0].items())
+    chunks = list(verify.stream(method, iter(table), chunksize=8, Str=3))
+    assert [len(x.Capacity) for x in chunks]==[8, 8, 8, 6]
+    Capacity = [x for chunk in chunks for x in chunk.Capacity]
+    Passes = [bool(x) for chunk in chunks for x in chunk.Passes]
+    assert Capacity==pytest.approx(list(expected.Capacity), rel=1e-12)
+    assert Passes==[bool(x) for x in expected.Passes]
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_scalar(method, request):
+    pytest.importorskip('numpy')
+    c = columns(inventory(method))
+    args = (method, c['L'], c['load'], c['Width'], c['Height'])
+    options = dict(Str=c['Str'], Sup=c['Sup'], t=c['t'], SEF=c['SEF'])
+    expected = verify.verify(*args, **options)
+    request.getfixturevalue('scalar')
+    result = verify.verify(*args, **options)
+    assert result.Capacity==pytest.approx(list(expected.Capacity), rel=1e-9, abs=1e-9)
+    assert result.Passes==[bool(x) for x in expected.Passes]
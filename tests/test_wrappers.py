@@ -0,0 +1,99 @@
+"""
+The Grasshopper components (Column-*.py and Beam-*.py) run headless with the rhinoscriptsyntax stand-in
+"""
+
+from __future__ import division
+
+import io
+import os
+
+import pytest
+
+from conftest import METHODS
+from fireant_engine import batch
+from fireant_engine import rhino as rs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Inputs of the components, None is the default of the component
+INPUTS = {
+    'column': [
+        (dict(Str=None, Sup=None, ToW=None, WS=None, t=None, SEF=None), [10, 30, 5000]),
+        (dict(Str=6, Sup=2, ToW=3, WS=2, t=30, SEF=4), [10, 30, 5000]),
+    ],
+    'beam': [
+        (dict(Str=None, Sup=None, ToW=None, WS=None, t=None, SEF=None), [2, 5, 500]),
+        (dict(Str=5, Sup=3, ToW=3, WS=1, t=30, SEF=3), [2, 5, 500]),
+    ],
+}
+
+DEFAULTS = {
+    'column': dict(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=8),
+    'beam': dict(Str=1, Sup=1, ToW=1, WS=1, t=60, SEF=4),
+}
+
+PARAMETRIC = dict(O=None, qf=None, Ti=None)
+PARAMETRIC_DEFAULTS = dict(O=0.04, qf=400, Ti=1160)
+
+
+def center_lines(member):
+    """ A vertical column or horizontal beam as a Line, one as a (start, end) pair and a sloping one """
+    if member=='column':
+        return [rs.AddLine((0, 0, 0), (0, 0, 3000)), ((1000, 0, 0), (1000, 0, 4500)), rs.AddLine((0, 2000, 0), (600, 2000, 2800))]
+    return [rs.AddLine((0, 0, 3000), (5000, 0, 3000)), ((0, 1000, 3000), (0, 7000, 3000)), rs.AddLine((0, 0, 0), (3000, 4000, 0))]
+
+
+def run(method, inputs):
+    """ Globals of the component after running it with the inputs """
+    path = os.path.join(ROOT, method+'.py')
+    with io.open(path, encoding='utf-8-sig') as f:
+        source = f.read()
+    g = dict(inputs, __name__='__fireant_component__')
+    exec(compile(source, path, 'exec'), g)
+    return g
+
+
+def cases():
+    for method in METHODS:
+        member = batch.METHODS[method][0]
+        for inputs, loads in INPUTS[member]:
+            for profile in ((None, None), (200, 300)):
+                yield method, inputs, loads, profile
+
+
+@pytest.mark.parametrize('method, inputs, loads, profile', list(cases()))
+def test_component(method, inputs, loads, profile):
+    member, name, load = batch.METHODS[method]
+    design = batch.design_function(method)[0]
+    CL = center_lines(member)
+    inputs = dict(inputs, CL=CL, WidthProfile=profile[0], HeightProfile=profile[1], **{load: loads})
+    expected_inputs = dict((k, DEFAULTS[member][k] if v is None else v) for k, v in inputs.items() if k in DEFAULTS[member])
+    if 'ParamFire' in method:
+        inputs.update(PARAMETRIC)
+        expected_inputs.update(PARAMETRIC_DEFAULTS)
+    g = run(method, inputs)
+
+    L = [rs.CurveLength(c) for c in CL]
+    assert L==pytest.approx([3000, 4500, 2863.5642126553] if member=='column' else [5000, 6000, 5000])
+    expected = design(L, loads, WidthProfile=profile[0], HeightProfile=profile[1], **expected_inputs)
+    assert g['Result']==expected
+    for f in ('Width', 'Height', 'Utilization', 'ErrorMessage', expected._fields[0]):
+        assert g[f]==getattr(expected, f)
+    assert any(x is not None for x in expected.Width)
+
+    # One capped extrusion of the section along the center line of every member with a profile
+    members = [i for i in range(len(CL)) if expected.Width[i] is not None]
+    assert len(g['Geo'])==len(members)
+    for geo, i in zip(g['Geo'], members):
+        start = rs.CurveStartPoint(CL[i])
+        direction = rs.VectorCreate(rs.CurveEndPoint(CL[i]), start)
+        assert geo.capped
+        assert tuple(geo.path)==pytest.approx(tuple(direction))
+        corners = geo.profile.points
+        assert len(corners)==5 and corners[0]==corners[-1]
+        assert tuple(corners[0])==pytest.approx(tuple(start))
+        sides = [corners[k+1]-corners[k] for k in range(4)]
+        # Height along the x axis of the plane and Width along its y axis, both across the member
+        assert [s.Length for s in sides]==pytest.approx([expected.Height[i], expected.Width[i]]*2)
+        for s in sides:
+            assert s.X*direction.X+s.Y*direction.Y+s.Z*direction.Z==pytest.approx(0, abs=1e-6)